@@ -30,7 +30,9 @@ from . import molding
 # the import here plus the register()/unregister() calls below.
 # from . import catalog
 from . import hb_layouts
+from . import hb_wall_cutters
 from . import hb_assets
+from . import hb_draw_stats
 
 from bpy.app.handlers import persistent
 
@@ -65,6 +67,11 @@ def load_file_post(scene):
     # Ensure a default frameless style is created
     main_scene.hb_frameless.ensure_default_style()
 
+    # Fold per-opening wall booleans from older files into one
+    # collection boolean per wall.
+    from . import hb_wall_cutters
+    hb_wall_cutters.migrate_all_walls()
+
     # Modal operators do not survive a .blend load -- re-arm the HUD listener.
     from .operators import viewport_hud
     viewport_hud.ensure_listener()
@@ -103,6 +110,11 @@ def _update_sidebar_tab_first(self, context):
     bpy.app.timers.register(_apply, first_interval=0.0)
 
 
+def _update_wall_boolean_solver(self, context):
+    from . import hb_wall_cutters
+    hb_wall_cutters.apply_solver_to_all_walls()
+
+
 class Home_Builder_AddonPreferences(bpy.types.AddonPreferences):
     bl_idname = __package__
 
@@ -129,6 +141,29 @@ class Home_Builder_AddonPreferences(bpy.types.AddonPreferences):
         default=False,
     ) # type: ignore
 
+    wall_boolean_solver: bpy.props.EnumProperty(
+        name="Wall Opening Solver",
+        description="Boolean solver used to cut doors, windows and wall "
+                    "cutters out of walls",
+        items=[
+            ('FLOAT', 'Fast',
+             'Fast solver. Good for simple rectangular openings'),
+            ('EXACT', 'Exact',
+             'Exact solver. Slower, but handles coplanar and overlapping '
+             'openings'),
+        ],
+        default='EXACT',
+        update=_update_wall_boolean_solver,
+    ) # type: ignore
+
+    use_wall_cut_cache: bpy.props.BoolProperty(
+        name="Cache Cut Walls in Layout Views",
+        description="Show a pre-cut copy of each wall in layout views and "
+                    "reuse it on export. The copy is only re-cut when the "
+                    "wall or one of its openings changes",
+        default=False,
+    ) # type: ignore
+
     wall_color: bpy.props.FloatVectorProperty(name="Wall Color",
                                    description="The color of walls",
                                    size=4,
@@ -241,6 +276,22 @@ class Home_Builder_AddonPreferences(bpy.types.AddonPreferences):
         default=True
     )# type: ignore
 
+    use_pdf_background_workers: bpy.props.BoolProperty(
+        name="Render PDF Sheets in Background",
+        description="Export All Layouts to PDF renders the sheets in separate "
+                    "background Blender processes, several at a time",
+        default=True
+    )# type: ignore
+
+    pdf_export_workers: bpy.props.IntProperty(
+        name="PDF Export Workers",
+        description="Number of background Blender processes rendering sheets. "
+                    "0 uses one per CPU core",
+        default=0,
+        min=0,
+        max=64
+    )# type: ignore
+
     asset_libraries: bpy.props.CollectionProperty(
 		type=hb_assets.HB_AssetLibraryEntry,
 	)# type: ignore
@@ -256,6 +307,8 @@ class Home_Builder_AddonPreferences(bpy.types.AddonPreferences):
         layout.prop(self, "sidebar_tab_first")
         layout.prop(self, "use_viewport_hud")
         layout.prop(self, "hide_2d_drawing_panels")
+        layout.prop(self, "wall_boolean_solver")
+        layout.prop(self, "use_wall_cut_cache")
         
         # Layout view defaults
         box = layout.box()
@@ -265,6 +318,11 @@ class Home_Builder_AddonPreferences(bpy.types.AddonPreferences):
         col.prop(self, "default_paper_size")
         col.prop(self, "default_layout_scale")
         col.prop(self, "default_paper_landscape")
+        col.separator()
+        col.prop(self, "use_pdf_background_workers")
+        row = col.row()
+        row.active = self.use_pdf_background_workers
+        row.prop(self, "pdf_export_workers")
         
         layout.separator()
         
@@ -326,6 +384,7 @@ def register():
     wood_hoods.register()
     door_window_geo.register()
     molding.register()
+    hb_wall_cutters.register()
     # catalog.register()
 
     hb_assets.ensure_asset_libraries()
@@ -354,6 +413,7 @@ def unregister():
     export.unregister()
     scene_navigator.unregister()
     viewport_hud.unregister()
+    hb_draw_stats.unregister()
     layout_lock.unregister()
     room_dim_overlay.unregister()
     ops_stairs.unregister()
@@ -369,6 +429,7 @@ def unregister():
     wood_hoods.unregister()
     face_frame.unregister()
     frameless.unregister()
+    hb_wall_cutters.unregister()
     hb_assets.unregister()
 
     bpy.app.handlers.load_post.remove(load_file_post)
@@ -9,6 +9,7 @@ a thin renderer over it. Per-item thumbnails (or the no_thumbnail.png
 placeholder) are managed by previews_catalog.
 """
 from . import catalog_data
+from . import search_catalog
 from . import previews_catalog
 from . import props_catalog
 from . import ops_catalog
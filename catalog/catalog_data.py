@@ -346,12 +346,26 @@ CATALOG = [
 ]
 
 
+_by_id = {}
+_by_id_source = None    # (CATALOG list, its length) the map was built from
+
+
+def reindex():
+    """Rebuild the id -> entry map behind find_entry. Called by
+    search_catalog whenever it drops or rebuilds its own index."""
+    global _by_id_source
+    _by_id.clear()
+    for entry in CATALOG:
+        _by_id.setdefault(entry['id'], entry)
+    _by_id_source = (CATALOG, len(CATALOG))
+
+
 def find_entry(item_id):
     """Return the catalog entry with the given id, or None."""
-    for entry in CATALOG:
-        if entry['id'] == item_id:
-            return entry
-    return None
+    if (_by_id_source is None or _by_id_source[0] is not CATALOG
+            or _by_id_source[1] != len(CATALOG)):
+        reindex()
+    return _by_id.get(item_id)
 
 
 def list_categories():
@@ -8,6 +8,14 @@ fallback shown for any item that doesn't have a real thumbnail yet.
 When per-item thumbnails ship, this module gains a load step (or a
 "Render Library Thumbnails" command populates it) and get_icon_id
 returns the matching id.
+
+get_icon_id runs once per visible row per redraw, so it never touches
+the disk for a lookup: which files exist comes from a snapshot of the
+thumbnails folder (taken on register / reload, and again by a timer
+when the folder's mtime changes), and every resolved (filename, id)
+pair - including the ones that fall back to the placeholder - is
+cached until the next snapshot. The only disk read left in draw is the
+one-time load of a thumbnail that does exist.
 """
 import os
 import bpy
@@ -17,6 +25,12 @@ import bpy.utils.previews
 _pcoll = None
 _PLACEHOLDER_KEY = '__no_thumbnail__'
 
+WATCH_INTERVAL = 2.0    # seconds between thumbnails-folder mtime checks
+
+_listing = frozenset()  # file names in the thumbnails folder
+_listing_mtime = None
+_icon_cache = {}        # (thumbnail_filename, item_id) -> icon_id
+
 
 def _thumbs_dir():
     return os.path.join(os.path.dirname(__file__), 'thumbnails')
@@ -26,6 +40,38 @@ def _placeholder_path():
     return os.path.join(_thumbs_dir(), 'no_thumbnail.png')
 
 
+def _snapshot():
+    """Re-list the thumbnails folder and forget every cached lookup."""
+    global _listing, _listing_mtime
+    folder = _thumbs_dir()
+    try:
+        _listing_mtime = os.stat(folder).st_mtime_ns
+        _listing = frozenset(os.listdir(folder))
+    except OSError:
+        _listing_mtime = None
+        _listing = frozenset()
+    _icon_cache.clear()
+
+
+def _watch_thumbnails():
+    """Timer: re-snapshot when files were added to or removed from the
+    thumbnails folder outside reload() (e.g. copied in by hand)."""
+    try:
+        mtime = os.stat(_thumbs_dir()).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime != _listing_mtime:
+        _snapshot()
+        _tag_redraw()
+    return WATCH_INTERVAL
+
+
+def _tag_redraw():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+
+
 def get_icon_id(thumbnail_filename='', item_id=''):
     """Return a Blender icon_id for the given thumbnail.
 
@@ -37,40 +83,52 @@ def get_icon_id(thumbnail_filename='', item_id=''):
 
     Lazily loads files into the previews collection on first
     reference, so we don't pay disk cost for thumbnails the user
-    never views.
+    never views. "Exists" means present in the folder snapshot, and
+    the answer is cached per (thumbnail_filename, item_id).
     """
     if _pcoll is None:
         return 0  # not registered yet - safe fallback (no icon)
 
+    key = (thumbnail_filename, item_id)
+    icon_id = _icon_cache.get(key)
+    if icon_id is not None:
+        return icon_id
+
     candidates = []
     if thumbnail_filename:
         candidates.append(thumbnail_filename)
     if item_id:
         candidates.append(f"{item_id}.png")
 
+    icon_id = None
     for fname in candidates:
         if fname in _pcoll:
-            return _pcoll[fname].icon_id
-        full = os.path.join(_thumbs_dir(), fname)
-        if os.path.isfile(full):
+            icon_id = _pcoll[fname].icon_id
+            break
+        if fname in _listing:
             try:
-                _pcoll.load(fname, full, 'IMAGE')
-                return _pcoll[fname].icon_id
+                _pcoll.load(fname, os.path.join(_thumbs_dir(), fname), 'IMAGE')
+                icon_id = _pcoll[fname].icon_id
+                break
             except Exception:
                 pass  # fall through
 
-    if _PLACEHOLDER_KEY in _pcoll:
-        return _pcoll[_PLACEHOLDER_KEY].icon_id
-    return 0
+    if icon_id is None:
+        if _PLACEHOLDER_KEY in _pcoll:
+            icon_id = _pcoll[_PLACEHOLDER_KEY].icon_id
+        else:
+            icon_id = 0
+    _icon_cache[key] = icon_id
+    return icon_id
 
 
 def reload():
     """Drop and re-create the preview collection.
 
     Called after rendering thumbnails so freshly-saved PNGs are
-    picked up on the next panel draw. Also tags every UI area for
-    redraw so the new icon_ids resolve immediately without manual
-    refresh.
+    picked up on the next panel draw. Re-snapshots the thumbnails
+    folder and tags every UI area for redraw so the new icon_ids
+    resolve immediately without manual refresh.
     """
     global _pcoll
     if _pcoll is not None:
@@ -86,9 +144,8 @@ def reload():
             _pcoll.load(_PLACEHOLDER_KEY, placeholder, 'IMAGE')
         except Exception:
             pass
-    for window in bpy.context.window_manager.windows:
-        for area in window.screen.areas:
-            area.tag_redraw()
+    _snapshot()
+    _tag_redraw()
 
 
 def register():
@@ -107,10 +164,18 @@ def register():
         _pcoll.load(_PLACEHOLDER_KEY, placeholder, 'IMAGE')
     # If the placeholder file is missing the collection still exists
     # and get_icon_id falls back to 0 (no icon shown).
+    _snapshot()
+    if not bpy.app.timers.is_registered(_watch_thumbnails):
+        bpy.app.timers.register(_watch_thumbnails,
+                                first_interval=WATCH_INTERVAL,
+                                persistent=True)
 
 
 def unregister():
     global _pcoll
+    if bpy.app.timers.is_registered(_watch_thumbnails):
+        bpy.app.timers.unregister(_watch_thumbnails)
+    _icon_cache.clear()
     if _pcoll is not None:
         try:
             bpy.utils.previews.remove(_pcoll)
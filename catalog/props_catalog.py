@@ -19,6 +19,7 @@ from bpy.props import (
 )
 
 from . import catalog_data
+from . import search_catalog
 
 
 def _category_items_cb(self, context):
@@ -78,6 +79,8 @@ def sync_catalog(scene):
     Must only be called from a context where ID writes are allowed:
     operators, timers, handlers - NOT Panel.draw().
     """
+    search_catalog.invalidate()
+    search_catalog.ensure_index()
     state = scene.hb_catalog
     state.items.clear()
     for entry in catalog_data.CATALOG:
@@ -14,10 +14,27 @@ The camera is positioned at a fixed front-right-above angle relative
 to the cabinet bbox center, with distance scaled to the largest bbox
 dimension so cabinets of different sizes (Base ~36" wide vs Tall ~84"
 tall) all frame consistently.
+
+render_all only renders entries whose thumbnail is missing or stale:
+each PNG has a {item.id}.hash file next to it holding the hash of the
+entry's operator, arguments and library version it was rendered from.
+The stale ones are split across background `blender -b` workers, each
+rendering its share with render_entry, and the preview collection is
+reloaded once when they are all done. The workers open a copy of the
+current file (saved to a temporary folder), so units, materials and
+library settings match an in-process render; if that copy cannot be
+saved they fall back to the startup file and their thumbnails may
+differ. Workers that overrun their time allowance are killed and their
+remaining entries reported as errors.
 """
 
 import os
+import json
 import math
+import hashlib
+import tempfile
+import time
+import subprocess
 import bpy
 from mathutils import Vector
 
@@ -27,6 +44,18 @@ from . import previews_catalog
 
 THUMB_RESOLUTION = 256
 
+# Bump when the camera, shading or resolution change so every thumbnail
+# is re-rendered; it is part of each entry's definition hash.
+RENDER_VERSION = 1
+
+MAX_WORKERS = 4
+
+# A worker is killed once it has run longer than the startup allowance
+# plus the per-entry allowance times its share of entries.
+WORKER_STARTUP_TIMEOUT = 60.0   # seconds
+WORKER_ENTRY_TIMEOUT = 30.0     # seconds per entry
+WORKER_POLL_INTERVAL = 0.25     # seconds
+
 # 3/4 view angles: front-right azimuth, slight downward look from above.
 # These match the conventions most furniture catalogs use.
 _AZIMUTH_DEG = -45.0   # negative = swing from -Y (front) toward +X (right)
@@ -47,152 +76,343 @@ def render_entry(entry):
 
     Caller is responsible for handling exceptions - this function lets
     them propagate so the bulk renderer can decide whether to abort or
-    skip-and-continue.
+    skip-and-continue. The preview collection is not reloaded here;
+    call previews_catalog.reload() once the batch is done.
     """
     if not _is_renderable(entry):
         return None
 
     context = bpy.context
-    original_scene = context.window.scene
+    window = context.window
+    original_scene = window.scene if window is not None else None
 
     # Build a fresh scene so we don't pollute the user's working scene
     # with throwaway objects, lights, or cameras.
     thumb_scene = bpy.data.scenes.new('_hb_thumbnail_render')
 
     try:
-        context.window.scene = thumb_scene
-        thumb_scene.cursor.location = (0.0, 0.0, 0.0)
-
-        # Place the cabinet via the entry's real operator. Using
-        # EXEC_DEFAULT skips any modal phase and runs execute() directly.
-        op_full = entry['action_operator']
-        mod_name, op_name = op_full.split('.', 1)
-        op_func = getattr(getattr(bpy.ops, mod_name), op_name)
-        result = op_func('EXEC_DEFAULT', **entry.get('action_args', {}))
-
-        if 'CANCELLED' in result or 'FINISHED' not in result:
-            return None
-
-        # The placed cabinet is left as the active object by draw_cabinet.
-        cabinet = context.view_layer.objects.active
-        if cabinet is None:
-            return None
-
-        # World-space bbox over cabinet + all descendants. Cabinets are
-        # hierarchies of cages and parts, so we need to walk the tree.
-        bb_min = Vector((float('inf'),) * 3)
-        bb_max = Vector((float('-inf'),) * 3)
-        any_mesh = False
-        for obj in [cabinet] + list(cabinet.children_recursive):
-            if obj.type != 'MESH':
-                continue
-            # Skip hidden objects (cages are hidden in the active mode)
-            if not obj.visible_get(view_layer=context.view_layer):
-                continue
-            any_mesh = True
-            for corner in obj.bound_box:
-                world = obj.matrix_world @ Vector(corner)
-                for i in range(3):
-                    if world[i] < bb_min[i]:
-                        bb_min[i] = world[i]
-                    if world[i] > bb_max[i]:
-                        bb_max[i] = world[i]
-
-        if not any_mesh or bb_min[0] == float('inf'):
-            return None
-
-        center = (bb_min + bb_max) * 0.5
-        size = max(bb_max[0] - bb_min[0],
-                   bb_max[1] - bb_min[1],
-                   bb_max[2] - bb_min[2])
-        if size <= 0:
-            return None
-
-        # Camera at front-right-above. Math: spherical coordinates with
-        # the cabinet center as the origin, distance proportional to size.
-        az = math.radians(_AZIMUTH_DEG)
-        el = math.radians(_ELEVATION_DEG)
-        distance = size * 2.0  # 2x size leaves comfortable margin
-
-        cam_offset = Vector((
-            distance * math.cos(el) * math.sin(az),     # +X = right
-            distance * math.cos(el) * (-math.cos(az)),  # -Y = toward front
-            distance * math.sin(el),                    # +Z = above
-        ))
-        # az=-45 + sin(-45)=-0.71, cos(-45)=0.71 - so cam is to the right
-        # and toward -Y (front). That puts the cabinet's face frame visible
-        # since face frames sit on the -Y side.
-
-        cam_data = bpy.data.cameras.new('_hb_thumb_cam')
-        cam_data.lens = 50.0
-        cam = bpy.data.objects.new('_hb_thumb_cam', cam_data)
-        thumb_scene.collection.objects.link(cam)
-        cam.location = center + cam_offset
-
-        # Look at the bbox center. to_track_quat aligns -Z (camera forward)
-        # with the direction vector and uses +Y as up.
-        direction = center - cam.location
-        cam.rotation_mode = 'QUATERNION'
-        cam.rotation_quaternion = direction.to_track_quat('-Z', 'Y')
-
-        thumb_scene.camera = cam
-
-        # Workbench render config
-        thumb_scene.render.engine = 'BLENDER_WORKBENCH'
-        thumb_scene.render.resolution_x = THUMB_RESOLUTION
-        thumb_scene.render.resolution_y = THUMB_RESOLUTION
-        thumb_scene.render.resolution_percentage = 100
-        thumb_scene.render.film_transparent = True
-        thumb_scene.render.image_settings.file_format = 'PNG'
-        thumb_scene.render.image_settings.color_mode = 'RGBA'
-
-        shading = thumb_scene.display.shading
-        shading.light = 'MATCAP'
-        shading.studio_light = 'basic_grey.exr'  # neutral grey - shows shape without distracting material cues
-        shading.show_cavity = True
-        shading.cavity_type = 'BOTH'
-        shading.show_object_outline = False
-
-        # Output path
-        out_dir = _thumbs_dir()
-        os.makedirs(out_dir, exist_ok=True)
-        out_path = os.path.join(out_dir, f"{entry['id']}.png")
-        thumb_scene.render.filepath = out_path
-
-        bpy.ops.render.render(write_still=True)
-        return out_path
+        if window is not None:
+            window.scene = thumb_scene
+            return _render_scene(context, entry, thumb_scene)
+        # Background workers (blender -b) have no window to switch, so
+        # point the context at the thumbnail scene instead.
+        with context.temp_override(scene=thumb_scene,
+                                   view_layer=thumb_scene.view_layers[0]):
+            return _render_scene(context, entry, thumb_scene)
     finally:
         # Restore user scene, drop the temp scene + its data-blocks. New
         # scenes own their cursor/view layer, but cameras/objects we
         # added live in bpy.data and need explicit removal.
-        context.window.scene = original_scene
+        if window is not None:
+            window.scene = original_scene
         # Removing the scene removes references; orphan objects/datablocks
         # get cleaned up by Blender unless still linked elsewhere.
         if thumb_scene.name in bpy.data.scenes:
             bpy.data.scenes.remove(thumb_scene, do_unlink=True)
-        # Reload preview collection so freshly-rendered thumbnails appear.
-        previews_catalog.reload()
 
 
-def render_all():
+def _render_scene(context, entry, thumb_scene):
+    """Place the entry's cabinet in thumb_scene (the context's current
+    scene), frame it and render. Writes the definition hash next to the
+    PNG on success."""
+    thumb_scene.cursor.location = (0.0, 0.0, 0.0)
+
+    # Place the cabinet via the entry's real operator. Using
+    # EXEC_DEFAULT skips any modal phase and runs execute() directly.
+    op_full = entry['action_operator']
+    mod_name, op_name = op_full.split('.', 1)
+    op_func = getattr(getattr(bpy.ops, mod_name), op_name)
+    result = op_func('EXEC_DEFAULT', **entry.get('action_args', {}))
+
+    if 'CANCELLED' in result or 'FINISHED' not in result:
+        return None
+
+    # The placed cabinet is left as the active object by draw_cabinet.
+    cabinet = context.view_layer.objects.active
+    if cabinet is None:
+        return None
+
+    # World-space bbox over cabinet + all descendants. Cabinets are
+    # hierarchies of cages and parts, so we need to walk the tree.
+    bb_min = Vector((float('inf'),) * 3)
+    bb_max = Vector((float('-inf'),) * 3)
+    any_mesh = False
+    for obj in [cabinet] + list(cabinet.children_recursive):
+        if obj.type != 'MESH':
+            continue
+        # Skip hidden objects (cages are hidden in the active mode)
+        if not obj.visible_get(view_layer=context.view_layer):
+            continue
+        any_mesh = True
+        for corner in obj.bound_box:
+            world = obj.matrix_world @ Vector(corner)
+            for i in range(3):
+                if world[i] < bb_min[i]:
+                    bb_min[i] = world[i]
+                if world[i] > bb_max[i]:
+                    bb_max[i] = world[i]
+
+    if not any_mesh or bb_min[0] == float('inf'):
+        return None
+
+    center = (bb_min + bb_max) * 0.5
+    size = max(bb_max[0] - bb_min[0],
+               bb_max[1] - bb_min[1],
+               bb_max[2] - bb_min[2])
+    if size <= 0:
+        return None
+
+    # Camera at front-right-above. Math: spherical coordinates with
+    # the cabinet center as the origin, distance proportional to size.
+    az = math.radians(_AZIMUTH_DEG)
+    el = math.radians(_ELEVATION_DEG)
+    distance = size * 2.0  # 2x size leaves comfortable margin
+
+    cam_offset = Vector((
+        distance * math.cos(el) * math.sin(az),     # +X = right
+        distance * math.cos(el) * (-math.cos(az)),  # -Y = toward front
+        distance * math.sin(el),                    # +Z = above
+    ))
+    # az=-45 + sin(-45)=-0.71, cos(-45)=0.71 - so cam is to the right
+    # and toward -Y (front). That puts the cabinet's face frame visible
+    # since face frames sit on the -Y side.
+
+    cam_data = bpy.data.cameras.new('_hb_thumb_cam')
+    cam_data.lens = 50.0
+    cam = bpy.data.objects.new('_hb_thumb_cam', cam_data)
+    thumb_scene.collection.objects.link(cam)
+    cam.location = center + cam_offset
+
+    # Look at the bbox center. to_track_quat aligns -Z (camera forward)
+    # with the direction vector and uses +Y as up.
+    direction = center - cam.location
+    cam.rotation_mode = 'QUATERNION'
+    cam.rotation_quaternion = direction.to_track_quat('-Z', 'Y')
+
+    thumb_scene.camera = cam
+
+    # Workbench render config
+    thumb_scene.render.engine = 'BLENDER_WORKBENCH'
+    thumb_scene.render.resolution_x = THUMB_RESOLUTION
+    thumb_scene.render.resolution_y = THUMB_RESOLUTION
+    thumb_scene.render.resolution_percentage = 100
+    thumb_scene.render.film_transparent = True
+    thumb_scene.render.image_settings.file_format = 'PNG'
+    thumb_scene.render.image_settings.color_mode = 'RGBA'
+
+    shading = thumb_scene.display.shading
+    shading.light = 'MATCAP'
+    shading.studio_light = 'basic_grey.exr'  # neutral grey - shows shape without distracting material cues
+    shading.show_cavity = True
+    shading.cavity_type = 'BOTH'
+    shading.show_object_outline = False
+
+    # Output path
+    out_dir = _thumbs_dir()
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, f"{entry['id']}.png")
+    thumb_scene.render.filepath = out_path
+
+    bpy.ops.render.render(write_still=True)
+    with open(_hash_path(entry), 'w', encoding='utf-8') as f:
+        f.write(definition_hash(entry))
+    return out_path
+
+
+def render_all(workers=None, force=False):
     """Render thumbnails for every renderable (non-stub) catalog entry.
 
+    Entries whose thumbnail is current (see is_current) are skipped
+    unless ``force``. The rest are sharded across ``workers`` background
+    Blender processes (default: half the CPUs, at most MAX_WORKERS); with
+    one worker, or a single entry to do, they render in this process.
+    The preview collection is reloaded once at the end.
+
     Returns (rendered_count, skipped_count, errors). Errors are tuples
     of (item_id, exception) so the caller can show a summary.
     """
-    rendered = 0
     skipped = 0
-    errors = []
+    pending = []
     for entry in catalog_data.CATALOG:
-        if not _is_renderable(entry):
+        if not _is_renderable(entry) or (not force and is_current(entry)):
             skipped += 1
-            continue
+        else:
+            pending.append(entry)
+
+    if workers is None:
+        workers = min(MAX_WORKERS, max(1, (os.cpu_count() or 2) // 2))
+    workers = min(workers, len(pending))
+    try:
+        if workers > 1 and bpy.app.binary_path:
+            results = _render_in_workers(pending, workers)
+        else:
+            results = _render_here(pending)
+    finally:
+        previews_catalog.reload()
+
+    rendered = 0
+    errors = []
+    for item_id, status, message in results:
+        if status == 'rendered':
+            rendered += 1
+        elif status == 'skipped':
+            skipped += 1
+        else:
+            errors.append((item_id, RuntimeError(message)))
+    return rendered, skipped, errors
+
+
+def _render_here(entries):
+    """Render entries one after another in this process. Returns
+    [(item_id, 'rendered' | 'skipped' | 'error', message)]."""
+    results = []
+    for entry in entries:
         try:
             path = render_entry(entry)
-            if path:
-                rendered += 1
-            else:
-                skipped += 1
+            results.append((entry['id'], 'rendered' if path else 'skipped', ''))
         except Exception as e:  # pragma: no cover
-            errors.append((entry['id'], e))
-    return rendered, skipped, errors
+            results.append((entry['id'], 'error', str(e)))
+    return results
+
+
+# Run by each worker: blender -b [file] --addons <package> --python-expr ... --
+#                      <catalog module> <result file> <item id>...
+_WORKER_EXPR = (
+    "import sys, importlib\n"
+    "argv = sys.argv[sys.argv.index('--') + 1:]\n"
+    "importlib.import_module(argv[0] + '.render_thumbnails')"
+    ".run_worker(argv[1], argv[2:])\n"
+)
+
+
+def _snapshot_blend(folder):
+    """Save a copy of the open file for the workers to start from, so
+    their thumbnails use the same units, materials and library settings
+    as an in-process render. Returns the path, or None if it could not
+    be written (workers then start from the startup file)."""
+    path = os.path.join(folder, 'scene.blend')
+    try:
+        bpy.ops.wm.save_as_mainfile(filepath=path, copy=True,
+                                    check_existing=False)
+    except RuntimeError:
+        return None
+    return path if os.path.isfile(path) else None
+
+
+def _read_results(result_path):
+    try:
+        with open(result_path, encoding='utf-8') as f:
+            return [tuple(row) for row in json.load(f)]
+    except (OSError, ValueError):
+        return []
+
+
+def _render_in_workers(entries, workers):
+    """Shard entries round-robin across background Blender processes and
+    wait for all of them, advancing the window-manager progress as they
+    report. A worker still running after WORKER_STARTUP_TIMEOUT plus
+    WORKER_ENTRY_TIMEOUT per entry is killed. Entries a worker did not
+    report on (it crashed, hung or was killed) come back as errors."""
+    addon = __package__.rpartition('.')[0]
+    wm = bpy.context.window_manager
+    with tempfile.TemporaryDirectory(prefix='hb_thumbs_') as tmp:
+        blend = _snapshot_blend(tmp)
+        jobs = []
+        for n in range(workers):
+            ids = [entry['id'] for entry in entries[n::workers]]
+            result_path = os.path.join(tmp, f'worker_{n}.json')
+            command = [bpy.app.binary_path, '-b']
+            if blend:
+                command.append(blend)
+            command += ['--addons', addon, '--python-expr', _WORKER_EXPR,
+                        '--', __package__, result_path, *ids]
+            proc = subprocess.Popen(command, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL)
+            deadline = (time.monotonic() + WORKER_STARTUP_TIMEOUT
+                        + WORKER_ENTRY_TIMEOUT * len(ids))
+            jobs.append([proc, ids, result_path, deadline, None])
+
+        wm.progress_begin(0, len(entries))
+        try:
+            running = list(jobs)
+            while running:
+                time.sleep(WORKER_POLL_INTERVAL)
+                for job in list(running):
+                    proc, _ids, _path, deadline, _failure = job
+                    code = proc.poll()
+                    if code is None and time.monotonic() > deadline:
+                        proc.kill()
+                        proc.wait()
+                        job[4] = 'worker timed out'
+                    elif code is not None:
+                        job[4] = f'worker exited with code {code}'
+                    if job[4] is not None:
+                        running.remove(job)
+                wm.progress_update(sum(len(_read_results(job[2]))
+                                       for job in jobs))
+        finally:
+            for proc, *_rest in jobs:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+            wm.progress_end()
+
+        results = []
+        for _proc, ids, result_path, _deadline, failure in jobs:
+            reported = _read_results(result_path)
+            results.extend(reported)
+            done = {row[0] for row in reported}
+            results.extend((item_id, 'error', failure)
+                           for item_id in ids if item_id not in done)
+    return results
+
+
+def run_worker(result_path, item_ids):
+    """Worker entry point (see _WORKER_EXPR). Renders the given entries
+    and rewrites result_path after each one, so a crash part-way through
+    still reports what finished."""
+    results = []
+    for item_id in item_ids:
+        entry = catalog_data.find_entry(item_id)
+        if entry is None:
+            results.append((item_id, 'error', 'not in catalog'))
+        else:
+            results.extend(_render_here([entry]))
+        with open(result_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f)
+
+
+# ---- Incremental skip ----------------------------------------------------
+
+def _hash_path(entry):
+    return os.path.join(_thumbs_dir(), f"{entry['id']}.hash")
+
+
+def _library_version():
+    from .. import bl_info
+    return '.'.join(str(n) for n in bl_info['version'])
+
+
+def definition_hash(entry):
+    """Hash of everything a thumbnail depends on: the entry's operator
+    and arguments, the library version and RENDER_VERSION."""
+    payload = json.dumps({
+        'operator': entry.get('action_operator', ''),
+        'args': entry.get('action_args', {}),
+        'library': _library_version(),
+        'render': RENDER_VERSION,
+    }, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def is_current(entry):
+    """True if the entry's PNG exists and was rendered from the same
+    definition (its .hash file matches definition_hash)."""
+    png = os.path.join(_thumbs_dir(), f"{entry['id']}.png")
+    if not os.path.isfile(png):
+        return False
+    try:
+        with open(_hash_path(entry), encoding='utf-8') as f:
+            return f.read().strip() == definition_hash(entry)
+    except OSError:
+        return False
@@ -0,0 +1,136 @@
+"""Search index over catalog_data.CATALOG for the browser.
+
+_filter_visible used to lowercase and concatenate every item's code,
+name and description on each redraw and test the query against all of
+them. That is fine for a hand-written catalog and far too slow for a
+product list with thousands of SKUs, so the work is split:
+
+    - Built once per catalog (ensure_index, called from sync_catalog
+      after invalidate, so every sync starts from the current entries):
+      each entry's lowercased search text, an inverted index from every
+      character to the entries containing it, and a map from every
+      category path to the entries filed under it or any sub-category.
+    - Per (query, category), memoized until the catalog changes: the
+      matching entry indices, in catalog order.
+
+A query matches an entry when it is a substring of the entry's text or,
+failing that, a subsequence of it (every character in order). Every
+substring is also a subsequence, so the character index is what narrows
+the candidates: an entry can only match if it contains every character
+of the query. A query that extends an earlier one can only lose
+matches, so it is checked against that query's result instead of the
+whole catalog.
+
+Indices refer to CATALOG positions, which are also the positions of the
+mirrored scene.hb_catalog.items (sync_catalog writes them in order).
+"""
+from . import catalog_data
+
+
+MEMO_SIZE = 256
+
+_index = None
+_memo = {}
+
+
+class _CatalogIndex:
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.size = len(catalog)
+        self.text = []
+        self.chars = {}         # character -> set of entry indices
+        self.categories = {}    # category path -> set of entry indices
+        for i, entry in enumerate(catalog):
+            text = (entry.get('code', '') + ' ' + entry['name'] + ' '
+                    + entry.get('description', '')).lower()
+            self.text.append(text)
+            for ch in set(text):
+                self.chars.setdefault(ch, set()).add(i)
+            category = entry.get('category', '')
+            if category:
+                parts = category.split('/')
+                for n in range(1, len(parts) + 1):
+                    self.categories.setdefault(
+                        '/'.join(parts[:n]), set()).add(i)
+
+
+def invalidate():
+    """Drop the index, the id map and every memoized result. sync_catalog
+    calls this; other code only needs to after editing entries in place
+    between syncs (replacing CATALOG or changing its length is noticed
+    on its own)."""
+    global _index
+    _index = None
+    _memo.clear()
+    catalog_data.reindex()
+
+
+def ensure_index():
+    """Build the index if there is none, or CATALOG was replaced or
+    changed size since it was built."""
+    global _index
+    catalog = catalog_data.CATALOG
+    if (_index is None or _index.catalog is not catalog
+            or _index.size != len(catalog)):
+        _memo.clear()
+        _index = _CatalogIndex(catalog_data.CATALOG)
+        catalog_data.reindex()
+    return _index
+
+
+def fuzzy_subseq(needle, hay):
+    """True if every char of needle appears in hay in order."""
+    i = 0
+    for ch in needle:
+        j = hay.find(ch, i)
+        if j < 0:
+            return False
+        i = j + 1
+    return True
+
+
+def _category_members(index, category):
+    if category == 'all':
+        return None
+    return index.categories.get(category, set())
+
+
+def search(query, category):
+    """Sorted tuple of CATALOG indices whose text matches ``query``
+    (already lowercased and stripped) inside ``category`` ('all' for
+    every category)."""
+    index = ensure_index()
+    key = (query, category)
+    result = _memo.get(key)
+    if result is not None:
+        return result
+
+    members = _category_members(index, category)
+    if not query:
+        result = (tuple(range(index.size)) if members is None
+                  else tuple(sorted(members)))
+    else:
+        # Longest memoized prefix of this query in the same category: its
+        # matches are a superset of this query's.
+        candidates = None
+        for n in range(len(query) - 1, 0, -1):
+            previous = _memo.get((query[:n], category))
+            if previous is not None:
+                candidates = previous
+                break
+        if candidates is None:
+            postings = sorted((index.chars.get(ch, set())
+                               for ch in set(query)), key=len)
+            found = set(postings[0]).intersection(*postings[1:])
+            if members is not None:
+                found &= members
+            candidates = sorted(found)
+        text = index.text
+        result = tuple(i for i in candidates
+                       if query in text[i] or fuzzy_subseq(query, text[i]))
+
+    if len(_memo) >= MEMO_SIZE:
+        _memo.clear()
+    _memo[key] = result
+    return result
@@ -16,6 +16,7 @@ import bpy
 
 from . import catalog_data
 from . import previews_catalog
+from . import search_catalog
 
 
 def _filter_visible(state):
@@ -23,34 +24,29 @@ def _filter_visible(state):
 
     Shared by HB_UL_catalog.filter_items (list view) and
     HB_CATALOG_PT_browser._draw_grid (grid view) so the two surfaces
-    stay in sync. Pure read - safe from any context.
+    stay in sync. Pure read - safe from any context. The matching is
+    done (and memoized) by search_catalog over CATALOG, whose order the
+    items mirror; a scene not yet re-synced is scanned directly.
     """
     query = state.search.lower().strip()
     category = state.category
+    items = state.items
+    if len(items) == len(catalog_data.CATALOG):
+        return [(idx, items[idx])
+                for idx in search_catalog.search(query, category)]
     visible = []
-    for idx, item in enumerate(state.items):
+    for idx, item in enumerate(items):
         if category != 'all':
             if item.category != category and not item.category.startswith(category + '/'):
                 continue
         if query:
             hay = (item.code + ' ' + item.name + ' ' + item.description).lower()
-            if query not in hay and not _fuzzy_subseq(query, hay):
+            if query not in hay and not search_catalog.fuzzy_subseq(query, hay):
                 continue
         visible.append((idx, item))
     return visible
 
 
-def _fuzzy_subseq(needle, hay):
-    """True if every char of needle appears in hay in order."""
-    i = 0
-    for ch in needle:
-        j = hay.find(ch, i)
-        if j < 0:
-            return False
-        i = j + 1
-    return True
-
-
 class HB_UL_catalog(bpy.types.UIList):
     """Single list class, two layout types (DEFAULT and GRID). The user
     toggles between them via state.view_mode which we pass as the
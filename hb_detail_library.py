@@ -2,14 +2,81 @@
 Detail Library Management for Home Builder 5
 
 Handles saving and loading 2D details to/from a user library.
-Details are stored as individual blend files with embedded thumbnails.
+Details are stored as individual blend files in the user library folder.
+
+The library is indexed in a SQLite database (library.db) next to the
+files, with indexes on detail type, name and tag, so listing a large
+library is a query instead of a JSON read and a filter in Python. The
+index is updated incrementally by save_detail_to_library and
+delete_detail_from_library, and sync_library_index compares file mtimes
+and sizes to pick up files added, edited or removed outside Blender.
+The sync only stats files; object counts of new or edited files are
+read on a timer, so menus never load blend files while drawing.
+
+Thumbnails are rendered lazily: asking for a detail's icon queues the
+detail on a timer when its cached PNG (thumbnails/<file>.png) is
+missing or older than the file. Which thumbnails exist comes from one
+listing of the thumbnail folder, taken again after each sync, rather
+than a stat per menu row.
 """
 
 import bpy
+import bpy.utils.previews
 import os
+import re
 import json
+import time
+import sqlite3
 from datetime import datetime
 
+import numpy as np
+
+
+DB_FILENAME = "library.db"
+THUMBNAIL_FOLDER = "thumbnails"
+THUMBNAIL_SIZE = 128
+
+# sync_library_index is called from menu draw; stat the folder at most
+# this often (seconds). Saves and deletes through this module update the
+# index directly, so this only delays picking up external edits.
+SYNC_INTERVAL = 2.0
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS details (
+    filename TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    detail_type TEXT NOT NULL DEFAULT 'detail',
+    is_crown_detail INTEGER NOT NULL DEFAULT 0,
+    date_created TEXT NOT NULL DEFAULT '',
+    object_count INTEGER NOT NULL DEFAULT 0,
+    mtime REAL NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS tags (
+    filename TEXT NOT NULL REFERENCES details(filename) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (filename, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_details_type ON details(detail_type, name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_details_name ON details(name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag);
+"""
+
+_db = None
+_db_path = ""
+_last_sync = 0.0
+
+_previews = None
+_preview_keys = {}      # filename -> key of its loaded preview
+_thumbnail_queue = []   # (filename, library file mtime)
+_thumbnail_failed = set()   # (filename, library file mtime) that drew nothing
+_thumbnails_written = False
+_count_queue = []
+_thumb_mtimes = None    # thumbnail stem -> mtime, None until listed
+
 
 def get_user_library_path() -> str:
     """Get the path to the user's detail library folder."""
@@ -17,81 +84,310 @@ def get_user_library_path() -> str:
 
 
 def get_library_index_path() -> str:
-    """Get the path to the library index file."""
+    """Get the path to the legacy JSON library index (imported into the
+    database on first use)."""
     return os.path.join(get_user_library_path(), "library_index.json")
 
 
-def load_library_index() -> dict:
-    """Load the library index, or create a new one if it doesn't exist."""
-    index_path = get_library_index_path()
-    
-    if os.path.exists(index_path):
+def get_library_db_path() -> str:
+    """Get the path to the library index database."""
+    return os.path.join(get_user_library_path(), DB_FILENAME)
+
+
+def get_thumbnail_path(filename: str) -> str:
+    """Get the cached thumbnail path for a library file. The folder is
+    created when the first thumbnail is written."""
+    folder = os.path.join(get_user_library_path(), THUMBNAIL_FOLDER)
+    return os.path.join(folder, os.path.splitext(filename)[0] + ".png")
+
+
+def _thumbnail_mtime(filename: str):
+    """Modification time of a library file's thumbnail, or None when it
+    has none, from the cached listing of the thumbnail folder."""
+    global _thumb_mtimes
+    if _thumb_mtimes is None:
+        _thumb_mtimes = {}
+        folder = os.path.join(get_user_library_path(), THUMBNAIL_FOLDER)
         try:
-            with open(index_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
+            with os.scandir(folder) as it:
+                for item in it:
+                    if item.is_file() and item.name.lower().endswith(".png"):
+                        _thumb_mtimes[item.name[:-4]] = item.stat().st_mtime
+        except OSError:
             pass
-    
-    return {"details": []}
+    return _thumb_mtimes.get(os.path.splitext(filename)[0])
 
 
-def save_library_index(index: dict):
-    """Save the library index."""
+# =============================================================================
+# INDEX DATABASE
+# =============================================================================
+
+def _connect() -> sqlite3.Connection:
+    """Open (once per library path) the index database."""
+    global _db, _db_path, _last_sync
+    path = get_library_db_path()
+    if _db is not None and _db_path == path:
+        return _db
+    close_library_index()
+
+    db = sqlite3.connect(path)
+    db.row_factory = sqlite3.Row
+    db.execute("PRAGMA foreign_keys = ON")
+    is_new = db.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION
+    db.executescript(_SCHEMA)
+    if is_new:
+        with db:
+            _import_json_index(db)
+            db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    _db, _db_path, _last_sync = db, path, 0.0
+    return db
+
+
+def close_library_index():
+    """Close the index database connection."""
+    global _db, _db_path
+    if _db is not None:
+        _db.close()
+    _db, _db_path = None, ""
+
+
+def _import_json_index(db: sqlite3.Connection):
+    """Bring entries from a library_index.json written by older versions
+    into the database. File stats are left at 0 so the next sync fills
+    them in without touching the stored names and descriptions."""
     index_path = get_library_index_path()
-    
-    with open(index_path, 'w', encoding='utf-8') as f:
-        json.dump(index, f, indent=2)
+    if not os.path.exists(index_path):
+        return
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f).get("details", [])
+    except (OSError, ValueError):
+        return
+    for entry in entries:
+        if entry.get("filename"):
+            _upsert(db, entry)
+
+
+def _upsert(db: sqlite3.Connection, entry: dict):
+    filename = entry["filename"]
+    db.execute(
+        "INSERT OR REPLACE INTO details (filename, name, description, detail_type,"
+        " is_crown_detail, date_created, object_count, mtime, size)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (filename,
+         entry.get("name") or _name_from_filename(filename),
+         entry.get("description", ""),
+         entry.get("detail_type", "detail"),
+         int(bool(entry.get("is_crown_detail", False))),
+         entry.get("date_created", ""),
+         entry.get("object_count", 0),
+         entry.get("mtime", 0.0),
+         entry.get("size", 0)))
+    db.execute("DELETE FROM tags WHERE filename = ?", (filename,))
+    db.executemany("INSERT OR IGNORE INTO tags (filename, tag) VALUES (?, ?)",
+                   [(filename, tag) for tag in normalize_tags(entry.get("tags", ()))])
+
+
+def _entry(row: sqlite3.Row, library_path: str, tags: dict) -> dict:
+    entry = dict(row)
+    entry["is_crown_detail"] = bool(entry["is_crown_detail"])
+    entry["filepath"] = os.path.join(library_path, entry["filename"])
+    entry["tags"] = tags.get(entry["filename"], [])
+    return entry
+
+
+def _tags_for(db: sqlite3.Connection, filenames: list) -> dict:
+    tags = {}
+    if not filenames:
+        return tags
+    # Query in chunks to stay under SQLite's host parameter limit
+    for start in range(0, len(filenames), 500):
+        chunk = filenames[start:start + 500]
+        marks = ",".join("?" * len(chunk))
+        for row in db.execute(f"SELECT filename, tag FROM tags WHERE filename IN ({marks})"
+                              " ORDER BY tag", chunk):
+            tags.setdefault(row["filename"], []).append(row["tag"])
+    return tags
+
+
+def normalize_tags(tags) -> list:
+    """Accept a comma separated string or an iterable of tags and return
+    the unique, lower case, stripped tags."""
+    if isinstance(tags, str):
+        tags = tags.split(",")
+    result = []
+    for tag in tags:
+        tag = tag.strip().lower()
+        if tag and tag not in result:
+            result.append(tag)
+    return result
+
+
+def _name_from_filename(filename: str) -> str:
+    """Display name for a file that was dropped into the library folder:
+    the stem without the timestamp generate_detail_filename adds."""
+    stem = os.path.splitext(filename)[0]
+    stem = re.sub(r'_\d{8}_\d{6}$', '', stem)
+    return stem.replace('_', ' ').strip() or stem
+
+
+def _object_count(filepath: str) -> int:
+    """Number of objects in a blend file (reads the file's ID names only)."""
+    try:
+        with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+            return len(data_from.objects)
+    except (OSError, RuntimeError):
+        return 0
+
+
+def sync_library_index(force: bool = False) -> tuple:
+    """
+    Bring the index in line with the files in the library folder.
+
+    New .blend files are added, files whose mtime or size changed are
+    re-read (and get a new thumbnail on next view), and entries whose
+    file is gone are removed. Runs at most every SYNC_INTERVAL seconds
+    unless forced. Only stats files: object counts of new and edited
+    files are filled in afterwards by a timer.
+
+    Returns (added: int, updated: int, removed: int)
+    """
+    global _last_sync, _thumb_mtimes
+    now = time.monotonic()
+    db = _connect()
+    if not force and now - _last_sync < SYNC_INTERVAL:
+        return (0, 0, 0)
+    _last_sync = now
+    _thumb_mtimes = None
+
+    library_path = get_user_library_path()
+    on_disk = {}
+    with os.scandir(library_path) as it:
+        for item in it:
+            if item.is_file() and item.name.lower().endswith(".blend"):
+                stat = item.stat()
+                on_disk[item.name] = (stat.st_mtime, stat.st_size)
+
+    indexed = {row["filename"]: (row["mtime"], row["size"])
+               for row in db.execute("SELECT filename, mtime, size FROM details")}
+
+    added = updated = 0
+    to_count = []
+    with db:
+        for filename, (mtime, size) in on_disk.items():
+            known = indexed.get(filename)
+            if known == (mtime, size):
+                continue
+            if known is None:
+                _upsert(db, {
+                    "filename": filename,
+                    "date_created": datetime.fromtimestamp(mtime).isoformat(),
+                    "mtime": mtime,
+                    "size": size,
+                })
+                added += 1
+                to_count.append(filename)
+            else:
+                # Entries imported from the JSON index have no stats yet
+                # but already carry their object count; only real edits
+                # are counted (and recounted).
+                if known != (0.0, 0):
+                    updated += 1
+                    to_count.append(filename)
+                db.execute("UPDATE details SET mtime = ?, size = ? WHERE filename = ?",
+                           (mtime, size, filename))
+
+        missing = [name for name in indexed if name not in on_disk]
+        db.executemany("DELETE FROM details WHERE filename = ?",
+                       [(name,) for name in missing])
+    _queue(_count_queue, to_count, _process_count_queue)
+    return (added, updated, len(missing))
+
+
+def _queue(queue: list, jobs, timer):
+    """Append jobs to a work queue, starting its timer if idle."""
+    for job in jobs:
+        if job not in queue:
+            if not queue and not bpy.app.timers.is_registered(timer):
+                bpy.app.timers.register(timer, first_interval=0.1)
+            queue.append(job)
+
+
+def _process_count_queue():
+    """Timer: store the object count of one queued file per tick."""
+    if not _count_queue:
+        return None
+    filename = _count_queue.pop(0)
+    count = _object_count(os.path.join(get_user_library_path(), filename))
+    db = _connect()
+    with db:
+        db.execute("UPDATE details SET object_count = ? WHERE filename = ?",
+                   (count, filename))
+    return 0.01 if _count_queue else None
+
+
+def load_library_index() -> dict:
+    """Load the whole library index as {"details": [entry, ...]}."""
+    return {"details": get_library_details()}
+
+
+def save_library_index(index: dict):
+    """Replace the library index with the entries of ``index``."""
+    db = _connect()
+    with db:
+        db.execute("DELETE FROM details")
+        for entry in index.get("details", []):
+            if entry.get("filename"):
+                _upsert(db, entry)
 
 
 def generate_detail_filename(name: str) -> str:
     """Generate a unique filename for a detail."""
-    import re
-    
     # Clean the name
     clean_name = re.sub(r'[^a-zA-Z0-9_-]', '_', name)
-    
+
     # Add timestamp for uniqueness
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
+
     return f"{clean_name}_{timestamp}.blend"
 
 
-def save_detail_to_library(context, name: str, description: str = "") -> tuple:
+def save_detail_to_library(context, name: str, description: str = "", tags=()) -> tuple:
     """
     Save the current detail view to the user library.
-    
+
     Returns (success: bool, message: str, filepath: str)
     """
     scene = context.scene
-    
+
     # Verify we're in a detail view (either regular or crown detail)
     is_detail = scene.get('IS_DETAIL_VIEW', False)
     is_crown_detail = scene.get('IS_CROWN_DETAIL', False)
-    
+
     if not is_detail and not is_crown_detail:
         return (False, "Not in a detail view", "")
-    
+
     # Get all detail objects in the scene
     detail_objects = []
     for obj in scene.objects:
         # Include curves, text, and other detail objects
         if obj.type in {'CURVE', 'FONT', 'MESH'}:
             detail_objects.append(obj)
-    
+
     if not detail_objects:
         return (False, "No objects in detail view", "")
-    
+
     # Generate filename
     filename = generate_detail_filename(name)
     library_path = get_user_library_path()
     filepath = os.path.join(library_path, filename)
-    
+
     # Create a data block set for the objects we want to save
     # We need to save the objects and their dependencies
-    
+
     # Write the blend file with only the detail objects
     data_blocks = set()
-    
+
     for obj in detail_objects:
         data_blocks.add(obj)
         # Add object data (curve, font, etc)
@@ -102,142 +398,362 @@ def save_detail_to_library(context, name: str, description: str = "") -> tuple:
             for mat in obj.data.materials:
                 if mat:
                     data_blocks.add(mat)
-    
+
     # Write to file
     bpy.data.libraries.write(filepath, data_blocks, fake_user=True)
-    
-    # Update library index
-    index = load_library_index()
-    
+
     # Determine detail type
     detail_type = "crown" if is_crown_detail else "detail"
-    
+
+    stat = os.stat(filepath)
     detail_entry = {
         "name": name,
         "description": description,
         "filename": filename,
-        "filepath": filepath,
         "date_created": datetime.now().isoformat(),
         "object_count": len(detail_objects),
         "detail_type": detail_type,
-        "is_crown_detail": is_crown_detail,
+        "is_crown_detail": bool(is_crown_detail),
+        "tags": normalize_tags(tags),
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
     }
-    
-    index["details"].append(detail_entry)
-    save_library_index(index)
-    
+
+    # Update library index
+    db = _connect()
+    with db:
+        _upsert(db, detail_entry)
+
+    # The objects are at hand, so draw the thumbnail now rather than
+    # loading the file back later.
+    _write_thumbnail(detail_objects, get_thumbnail_path(filename))
+
     return (True, f"Saved '{name}' to library", filepath)
 
 
-def get_library_details(detail_type: str = None) -> list:
+def get_library_details(detail_type: str = None, tag: str = None, search: str = "") -> list:
     """
-    Get list of all details in the library.
-    
+    Get list of all details in the library, sorted by name.
+
     Args:
-        detail_type: Optional filter - "crown" for crown details only, 
+        detail_type: Optional filter - "crown" for crown details only,
                      "detail" for regular details only, None for all
+        tag: Optional tag the details must have
+        search: Optional text the name must contain
     """
-    index = load_library_index()
-    
-    # Verify files still exist
-    valid_details = []
+    db = _connect()
+    sync_library_index()
+
+    query = "SELECT d.* FROM details d"
+    where = []
+    params = []
+    if tag:
+        query += " JOIN tags t ON t.filename = d.filename"
+        where.append("t.tag = ?")
+        params.append(tag.strip().lower())
+    if detail_type is not None:
+        where.append("d.detail_type = ?")
+        params.append(detail_type)
+    if search:
+        where.append("d.name LIKE ? ESCAPE '\\'")
+        escaped = search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        params.append(f"%{escaped}%")
+    if where:
+        query += " WHERE " + " AND ".join(where)
+    query += " ORDER BY d.name COLLATE NOCASE"
+
+    rows = db.execute(query, params).fetchall()
+    tags = _tags_for(db, [row["filename"] for row in rows])
     library_path = get_user_library_path()
-    
-    for detail in index.get("details", []):
-        filepath = os.path.join(library_path, detail.get("filename", ""))
-        if os.path.exists(filepath):
-            detail["filepath"] = filepath  # Update path in case library moved
-            
-            # Filter by type if specified
-            if detail_type is not None:
-                stored_type = detail.get("detail_type", "detail")
-                if stored_type != detail_type:
-                    continue
-            
-            valid_details.append(detail)
-    
-    return valid_details
+    return [_entry(row, library_path, tags) for row in rows]
+
+
+def get_library_tags(detail_type: str = None) -> list:
+    """Get the tags in use, optionally only on details of one type."""
+    db = _connect()
+    if detail_type is None:
+        rows = db.execute("SELECT DISTINCT tag FROM tags ORDER BY tag")
+    else:
+        rows = db.execute("SELECT DISTINCT t.tag FROM tags t"
+                          " JOIN details d ON d.filename = t.filename"
+                          " WHERE d.detail_type = ? ORDER BY t.tag", (detail_type,))
+    return [row["tag"] for row in rows]
 
 
 def load_detail_from_library(context, filepath: str) -> tuple:
     """
     Load a detail from the library into the current detail view.
-    
+
     Returns (success: bool, message: str, objects: list)
     """
     scene = context.scene
-    
+
     # Verify we're in a detail view
     is_detail = scene.get('IS_DETAIL_VIEW', False)
     is_crown_detail = scene.get('IS_CROWN_DETAIL', False)
-    
+
     if not is_detail and not is_crown_detail:
         return (False, "Not in a detail view", [])
-    
+
     if not os.path.exists(filepath):
         return (False, f"File not found: {filepath}", [])
-    
+
     # Get existing object names to identify new objects after append
     existing_objects = set(obj.name for obj in scene.objects)
-    
+
     # Append all objects from the library file
     with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
         data_to.objects = data_from.objects
-    
+
     # Link appended objects to scene
     new_objects = []
     for obj in data_to.objects:
         if obj is not None:
             scene.collection.objects.link(obj)
             new_objects.append(obj)
-    
+
     if not new_objects:
         return (False, "No objects found in library file", [])
-    
+
     # Select the new objects
     bpy.ops.object.select_all(action='DESELECT')
     for obj in new_objects:
         obj.select_set(True)
-    
+
     if new_objects:
         context.view_layer.objects.active = new_objects[0]
-    
+
     return (True, f"Loaded {len(new_objects)} objects", new_objects)
 
 
 def get_detail_info(filepath: str) -> dict:
     """
     Get the stored info for a detail by its filepath.
-    
+
     Returns the detail entry dict or empty dict if not found.
     """
-    index = load_library_index()
     library_path = get_user_library_path()
-    
-    for detail in index.get("details", []):
-        detail_filepath = os.path.join(library_path, detail.get("filename", ""))
-        if detail_filepath == filepath or detail.get("filepath") == filepath:
-            return detail
-    
-    return {}
+    if os.path.dirname(os.path.abspath(filepath)) != os.path.abspath(library_path):
+        return {}
+
+    db = _connect()
+    row = db.execute("SELECT * FROM details WHERE filename = ?",
+                     (os.path.basename(filepath),)).fetchone()
+    if row is None:
+        return {}
+    return _entry(row, library_path, _tags_for(db, [row["filename"]]))
 
 
 def delete_detail_from_library(filename: str) -> tuple:
     """
     Delete a detail from the library.
-    
+
     Returns (success: bool, message: str)
     """
     library_path = get_user_library_path()
     filepath = os.path.join(library_path, filename)
-    
-    # Delete the file
+
+    # Delete the file and its thumbnail
     if os.path.exists(filepath):
         os.remove(filepath)
-    
+    thumbnail_path = get_thumbnail_path(filename)
+    if os.path.exists(thumbnail_path):
+        os.remove(thumbnail_path)
+    if _thumb_mtimes is not None:
+        _thumb_mtimes.pop(os.path.splitext(filename)[0], None)
+
     # Update index
-    index = load_library_index()
-    index["details"] = [d for d in index["details"] if d.get("filename") != filename]
-    save_library_index(index)
-    
+    db = _connect()
+    with db:
+        db.execute("DELETE FROM details WHERE filename = ?", (filename,))
+
     return (True, f"Deleted {filename}")
+
+
+# =============================================================================
+# THUMBNAILS
+# =============================================================================
+
+def _object_edges(objects) -> list:
+    """World space edge segments (2D, XZ for details drawn in the front
+    view and XY otherwise) of the given objects, as (N, 2, 2) arrays."""
+    segments = []
+    for obj in objects:
+        try:
+            mesh = obj.to_mesh()
+        except RuntimeError:
+            continue
+        if mesh is None:
+            continue
+        try:
+            count = len(mesh.vertices)
+            if count == 0 or len(mesh.edges) == 0:
+                continue
+            co = np.empty(count * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", co)
+            co = co.reshape(-1, 3)
+            co = co @ np.array(obj.matrix_world, dtype=np.float32)[:3, :3].T \
+                + np.array(obj.matrix_world.translation, dtype=np.float32)
+            edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+            mesh.edges.foreach_get("vertices", edges)
+            segments.append(co[edges.reshape(-1, 2)])
+        finally:
+            obj.to_mesh_clear()
+    return segments
+
+
+def _write_thumbnail(objects, path: str) -> bool:
+    """Rasterize the objects' edges into a square PNG at ``path``.
+    Returns False when there is nothing to draw."""
+    segments = _object_edges(objects)
+    if not segments:
+        return False
+    segs = np.concatenate(segments)
+    # Details live in the XY plane of their scene; use whichever of
+    # Y and Z actually has extent.
+    extent = np.ptp(segs.reshape(-1, 3), axis=0)
+    axes = [0, 2] if extent[2] > extent[1] else [0, 1]
+    segs = segs[:, :, axes]
+
+    size = THUMBNAIL_SIZE
+    margin = 6
+    lo = segs.reshape(-1, 2).min(axis=0)
+    span = float((segs.reshape(-1, 2).max(axis=0) - lo).max()) or 1.0
+    scale = (size - 2 * margin - 1) / span
+    pts = (segs - lo) * scale + margin
+    # Center the drawing in the square
+    pts += (size - 2 * margin - 1 - (pts.reshape(-1, 2).max(axis=0) - margin)) / 2
+
+    # Sample every segment at roughly one point per pixel
+    lengths = np.linalg.norm(pts[:, 1] - pts[:, 0], axis=1)
+    steps = np.maximum(np.ceil(lengths).astype(np.int32), 1)
+    seg_index = np.repeat(np.arange(len(pts)), steps + 1)
+    t = np.concatenate([np.linspace(0.0, 1.0, n + 1) for n in steps])[:, None]
+    samples = pts[seg_index, 0] * (1.0 - t) + pts[seg_index, 1] * t
+    px = np.clip(np.rint(samples).astype(np.int32), 0, size - 1)
+
+    pixels = np.ones((size, size, 4), dtype=np.float32)
+    pixels[px[:, 1], px[:, 0], :3] = 0.0
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    image = bpy.data.images.new("HB Detail Thumbnail", size, size, alpha=True)
+    try:
+        image.pixels.foreach_set(pixels.ravel())
+        image.filepath_raw = path
+        image.file_format = 'PNG'
+        image.save()
+    finally:
+        bpy.data.images.remove(image)
+    if _thumb_mtimes is not None:
+        _thumb_mtimes[os.path.splitext(os.path.basename(path))[0]] = \
+            os.path.getmtime(path)
+    return True
+
+
+def _render_thumbnail(filename: str) -> bool:
+    """Load a library file's objects, draw its thumbnail and remove the
+    appended data again."""
+    filepath = os.path.join(get_user_library_path(), filename)
+    if not os.path.exists(filepath):
+        return False
+    with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+        data_to.objects = data_from.objects
+    objects = [obj for obj in data_to.objects if obj is not None]
+    data = {obj.data for obj in objects if obj.data is not None}
+    materials = {mat for datablock in data
+                 for mat in getattr(datablock, 'materials', ()) if mat}
+    try:
+        return _write_thumbnail(objects, get_thumbnail_path(filename))
+    finally:
+        # Library files are written with fake users; clear them so the
+        # appended data can go again.
+        bpy.data.batch_remove(objects)
+        for datablocks in (data, materials):
+            for datablock in datablocks:
+                datablock.use_fake_user = False
+            bpy.data.batch_remove([d for d in datablocks if d.users == 0])
+
+
+def _process_thumbnail_queue():
+    """Timer: render one queued thumbnail per tick, then redraw menus if
+    any were written. Files that draw nothing are remembered with their
+    mtime and not queued again until they change."""
+    global _thumbnails_written
+    if not _thumbnail_queue:
+        return None
+    job = _thumbnail_queue.pop(0)
+    try:
+        written = _render_thumbnail(job[0])
+    except (OSError, RuntimeError):
+        written = False
+    if written:
+        _thumbnails_written = True
+    else:
+        _thumbnail_failed.add(job)
+    if not _thumbnail_queue:
+        if _thumbnails_written:
+            _thumbnails_written = False
+            for window in bpy.context.window_manager.windows:
+                for area in window.screen.areas:
+                    area.tag_redraw()
+        return None
+    return 0.01
+
+
+def get_detail_icon(detail: dict) -> int:
+    """
+    Get the preview icon id for a library entry.
+
+    Returns 0 while the thumbnail is missing or out of date; the entry
+    is then queued and rendered on a timer, never while drawing, unless
+    rendering this version of the file already failed.
+    """
+    global _previews
+    filename = detail.get("filename", "")
+    if not filename:
+        return 0
+    thumb_mtime = _thumbnail_mtime(filename)
+
+    mtime = detail.get("mtime", 0.0)
+    if thumb_mtime is None or thumb_mtime < mtime:
+        job = (filename, mtime)
+        if job not in _thumbnail_failed:
+            _queue(_thumbnail_queue, (job,), _process_thumbnail_queue)
+        return 0
+
+    if _previews is None:
+        _previews = bpy.utils.previews.new()
+    # Key on the thumbnail mtime so a re-rendered PNG is loaded fresh;
+    # the preview it replaces is released.
+    key = f"{filename}:{thumb_mtime}"
+    if key not in _previews:
+        old_key = _preview_keys.get(filename)
+        if old_key in _previews:
+            del _previews[old_key]
+        _previews.load(key, get_thumbnail_path(filename), 'IMAGE')
+        _preview_keys[filename] = key
+    return _previews[key].icon_id
+
+
+def icon_args(detail: dict) -> dict:
+    """Icon keyword arguments for a menu item: the detail's thumbnail
+    once it is rendered, the generic import icon until then."""
+    icon_id = get_detail_icon(detail)
+    if icon_id:
+        return {"icon_value": icon_id}
+    return {"icon": 'IMPORT'}
+
+
+def unregister():
+    global _previews
+    for timer in (_process_thumbnail_queue, _process_count_queue):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+    _thumbnail_queue.clear()
+    _thumbnail_failed.clear()
+    _count_queue.clear()
+    if _previews is not None:
+        bpy.utils.previews.remove(_previews)
+        _previews = None
+    _preview_keys.clear()
+    close_library_index()
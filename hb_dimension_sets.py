@@ -0,0 +1,431 @@
+import json
+import bpy
+import bmesh
+from mathutils import Matrix
+from . import hb_types
+from . import hb_utils
+
+# Dimension sets: one object per layout sheet standing in for its
+# dimensions.
+#
+# Every dimension is a curve object with its own GeoNodeDimension
+# modifier, evaluated on its own; a heavily dimensioned sheet pays for
+# hundreds of node tree evaluations on every depsgraph update.
+# collapse_dimensions() evaluates them once, joins their geometry into a
+# single static mesh object and keeps each dimension as a record (curve
+# points, transform, node inputs - leader length, text offsets, decimals,
+# text - color, tags and collections) in HB_DIMENSION_RECORDS. Each
+# vertex carries its record index in the 'dim_record' attribute, so the
+# record under the mouse can be found and expanded back into a live
+# GeoNodeDimension object for the regular dimension edit operators.
+#
+# The set is plain mesh geometry in the sheet's Ignore collection, so
+# raster, vector and cached sheet export draw it like any annotation.
+# It is a baked mesh rather than point records drawn by one shared
+# geometry node tree: that would mean re-authoring GeoNodeDimension's
+# drawing, including its unit-formatted text, which String to Curves
+# cannot take per point.
+#
+# Annotation rescaling (set_record_inputs) updates the records in place
+# and re-evaluates only the records whose inputs changed, one at a time
+# through a single hidden evaluator curve that is linked into the scene
+# only while it is evaluated.
+
+DIMENSION_SET_PROP = 'IS_DIMENSION_SET'
+EVALUATOR_PROP = 'IS_DIMENSION_SET_EVALUATOR'
+EVALUATOR_NAME = "HB Dimension Set Evaluator"
+RECORDS_PROP = 'HB_DIMENSION_RECORDS'
+RECORD_ATTRIBUTE = 'dim_record'
+
+_ID_COLLECTIONS = {
+    'MATERIAL': 'materials',
+    'OBJECT': 'objects',
+    'FONT': 'fonts',
+    'COLLECTION': 'collections',
+    'IMAGE': 'images',
+}
+
+
+def get_dimension_set(scene):
+    for obj in scene.objects:
+        if obj.get(DIMENSION_SET_PROP):
+            return obj
+    return None
+
+
+def get_records(set_obj):
+    return json.loads(set_obj.get(RECORDS_PROP, "[]"))
+
+
+def _set_records(set_obj, records):
+    set_obj[RECORDS_PROP] = json.dumps(records)
+
+
+def is_collapsible(obj):
+    """Live dimensions that can join a set: plain GeoNodeDimension curves
+    without animation or drivers (a static record can't follow them)."""
+    if not obj.get('IS_DIMENSION') or obj.type != 'CURVE':
+        return False
+    if obj.animation_data is not None:
+        return False
+    return hb_types.GeoNodeDimension(obj).has_modifier()
+
+
+# =============================================================================
+# RECORDS
+# =============================================================================
+
+def _input_value(value):
+    if isinstance(value, bpy.types.ID):
+        return {'ID': value.name, 'TYPE': value.id_type}
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    try:
+        return [float(v) for v in value]
+    except TypeError:
+        return None
+
+
+def _restore_input_value(value):
+    if isinstance(value, dict):
+        data = getattr(bpy.data, _ID_COLLECTIONS.get(value.get('TYPE'), ''), None)
+        return data.get(value['ID']) if data is not None else None
+    return value
+
+
+def _record(obj, scene_collection):
+    mod = obj.modifiers[obj.home_builder.mod_name]
+    inputs = {}
+    for item in mod.node_group.interface.items_tree:
+        if item.item_type != 'SOCKET' or item.in_out != 'INPUT':
+            continue
+        value = _input_value(hb_utils.try_get_gn_input(mod, item.identifier))
+        if value is not None:
+            inputs[item.name] = value
+    props = {k: v for k, v in obj.items()
+             if isinstance(v, (bool, int, float, str))}
+    return {
+        'name': obj.name,
+        'points': [list(p.co) for p in obj.data.splines[0].points],
+        'matrix': [list(row) for row in obj.matrix_basis],
+        'parent': obj.parent.name if obj.parent else None,
+        'parent_inverse': [list(row) for row in obj.matrix_parent_inverse],
+        'color': list(obj.color),
+        'hide_render': obj.hide_render,
+        'props': props,
+        'inputs': inputs,
+        'in_scene_collection': obj.name in scene_collection.objects,
+        'collections': [c.name for c in obj.users_collection
+                        if c is not scene_collection],
+    }
+
+
+def _apply_shape(dim, record):
+    """Write a record's curve points and node inputs onto a dimension."""
+    spline = dim.obj.data.splines[0]
+    extra = len(record['points']) - len(spline.points)
+    if extra > 0:
+        spline.points.add(extra)
+    for point, co in zip(spline.points, record['points']):
+        point.co = co
+    for name, value in record['inputs'].items():
+        value = _restore_input_value(value)
+        if value is None:
+            continue
+        try:
+            dim.set_input(name, value)
+        except (ValueError, TypeError, KeyError):
+            continue
+
+
+def _restore(record, scene):
+    """Recreate a live dimension object from a record."""
+    dim = hb_types.GeoNodeDimension()
+    dim.create(record['name'])
+    obj = dim.obj
+    # create_curve links to the context scene and names the object
+    # "Dimension"; put it where the record says.
+    for coll in list(obj.users_collection):
+        coll.objects.unlink(obj)
+    if record['in_scene_collection']:
+        scene.collection.objects.link(obj)
+    for name in record['collections']:
+        coll = bpy.data.collections.get(name)
+        if coll is not None and obj.name not in coll.objects:
+            coll.objects.link(obj)
+    obj.name = record['name']
+    obj.data.name = obj.name
+
+    _apply_shape(dim, record)
+    for key, value in record['props'].items():
+        obj[key] = value
+    obj.color = record['color']
+    obj.hide_render = record['hide_render']
+    parent = bpy.data.objects.get(record['parent']) if record['parent'] else None
+    if parent is not None:
+        obj.parent = parent
+        obj.matrix_parent_inverse = Matrix(record['parent_inverse'])
+    obj.matrix_basis = Matrix(record['matrix'])
+    return obj
+
+
+# =============================================================================
+# COLLAPSE / EXPAND
+# =============================================================================
+
+class _scene_depsgraph:
+    """The evaluated depsgraph of ``scene``, read through a context
+    override so the window's scene is never switched."""
+
+    def __init__(self, scene):
+        view_layer = (bpy.context.view_layer if bpy.context.scene is scene
+                      else scene.view_layers[0])
+        self.override = bpy.context.temp_override(scene=scene,
+                                                  view_layer=view_layer)
+
+    def __enter__(self):
+        self.override.__enter__()
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        depsgraph.update()
+        return depsgraph
+
+    def __exit__(self, exc_type, exc, tb):
+        return self.override.__exit__(exc_type, exc, tb)
+
+
+def _collect_geometry(depsgraph, index_of, verts, edges, faces, record_ids):
+    """Append the evaluated geometry of the objects named in index_of
+    ({name: record index}), in world space, to the given lists."""
+    for owner, matrix, ob in hb_utils.evaluated_mesh_instances(depsgraph, index_of):
+        try:
+            src = ob.to_mesh()
+        except RuntimeError:
+            continue
+        if src is None:
+            continue
+        try:
+            base = len(verts)
+            verts.extend(matrix @ v.co for v in src.vertices)
+            record_ids.extend([index_of[owner.name]] * len(src.vertices))
+            face_edges = {key for poly in src.polygons for key in poly.edge_keys}
+            edges.extend((base + e.vertices[0], base + e.vertices[1])
+                         for e in src.edges if e.key not in face_edges)
+            faces.extend([base + i for i in poly.vertices] for poly in src.polygons)
+        finally:
+            ob.to_mesh_clear()
+
+
+def _build_mesh(mesh, depsgraph, dims):
+    """Join the evaluated geometry of dims into mesh, in world space,
+    tagging every vertex with its record index."""
+    index_of = {obj.name: i for i, obj in enumerate(dims)}
+    verts, edges, faces, record_ids = [], [], [], []
+    _collect_geometry(depsgraph, index_of, verts, edges, faces, record_ids)
+    mesh.clear_geometry()
+    mesh.from_pydata(verts, edges, faces)
+    attr = mesh.attributes.new(RECORD_ATTRIBUTE, 'INT', 'POINT')
+    attr.data.foreach_set('value', record_ids)
+    mesh.update()
+
+
+def collapse_dimensions(scene):
+    """Fold the scene's live dimensions (plus any set already on the
+    sheet) into its dimension set. Dimensions whose color differs from
+    the set's keep their own objects: the set draws in one object color.
+    Returns the number of records in the set."""
+    set_obj = get_dimension_set(scene)
+    if set_obj is not None:
+        expand_dimensions(scene)
+        set_obj = get_dimension_set(scene)
+
+    dims = [o for o in scene.objects if is_collapsible(o)]
+    if not dims:
+        return 0
+    color = tuple(round(c, 4) for c in dims[0].color)
+    dims = [o for o in dims if tuple(round(c, 4) for c in o.color) == color]
+
+    records = [_record(o, scene.collection) for o in dims]
+    with _scene_depsgraph(scene) as depsgraph:
+        if set_obj is None:
+            mesh = bpy.data.meshes.new(f"{scene.name} Dimensions")
+            set_obj = bpy.data.objects.new(f"{scene.name} Dimensions", mesh)
+            set_obj[DIMENSION_SET_PROP] = True
+            set_obj['IS_2D_ANNOTATION'] = True
+            set_obj['MENU_ID'] = 'HOME_BUILDER_MT_dimension_set_commands'
+            scene.collection.objects.link(set_obj)
+        _build_mesh(set_obj.data, depsgraph, dims)
+
+    set_obj.color = dims[0].color
+    for record in records:
+        for name in record['collections']:
+            coll = bpy.data.collections.get(name)
+            if coll is not None and set_obj.name not in coll.objects:
+                coll.objects.link(set_obj)
+    _set_records(set_obj, records)
+
+    for obj in dims:
+        curve = obj.data
+        bpy.data.objects.remove(obj)
+        if curve.users == 0:
+            bpy.data.curves.remove(curve)
+    return len(records)
+
+
+def expand_dimensions(scene, indices=None):
+    """Turn records of the scene's dimension set back into live
+    dimension objects (all of them by default) and drop their geometry
+    from the set; the set is removed once it has no records left.
+    Returns the new objects."""
+    set_obj = get_dimension_set(scene)
+    if set_obj is None:
+        return []
+    records = get_records(set_obj)
+    if indices is None:
+        indices = range(len(records))
+    indices = [i for i in indices if 0 <= i < len(records) and records[i] is not None]
+
+    objects = [_restore(records[i], scene) for i in indices]
+    for i in indices:
+        records[i] = None
+
+    if not any(r is not None for r in records):
+        mesh = set_obj.data
+        bpy.data.objects.remove(set_obj)
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+        return objects
+
+    bm = bmesh.new()
+    bm.from_mesh(set_obj.data)
+    layer = bm.verts.layers.int.get(RECORD_ATTRIBUTE)
+    drop = set(indices)
+    if layer is not None:
+        bmesh.ops.delete(bm, geom=[v for v in bm.verts if v[layer] in drop],
+                         context='VERTS')
+    bm.to_mesh(set_obj.data)
+    bm.free()
+    set_obj.data.update()
+    _set_records(set_obj, records)
+    return objects
+
+
+def record_at_vertex(set_obj, vertex_index):
+    attr = set_obj.data.attributes.get(RECORD_ATTRIBUTE)
+    if attr is None or not 0 <= vertex_index < len(attr.data):
+        return None
+    return attr.data[vertex_index].value
+
+
+def _evaluator():
+    """The hidden GeoNodeDimension curve records are re-evaluated
+    through. Lives in no scene between uses; None when the node group
+    is not in the file."""
+    obj = bpy.data.objects.get(EVALUATOR_NAME)
+    if obj is not None and obj.get(EVALUATOR_PROP):
+        return obj
+    node_group = bpy.data.node_groups.get('GeoNodeDimension')
+    if node_group is None:
+        return None
+    curve = bpy.data.curves.new(EVALUATOR_NAME, 'CURVE')
+    curve.splines.new('POLY').points.add(1)
+    obj = bpy.data.objects.new(EVALUATOR_NAME, curve)
+    obj[EVALUATOR_PROP] = True
+    mod = obj.modifiers.new(name='GeoNodeDimension', type='NODES')
+    mod.node_group = node_group
+    obj.home_builder.mod_name = mod.name
+    obj.hide_render = True
+    return obj
+
+
+def _record_matrix(record):
+    matrix = Matrix(record['matrix'])
+    parent = bpy.data.objects.get(record['parent']) if record['parent'] else None
+    if parent is not None:
+        matrix = parent.matrix_world @ Matrix(record['parent_inverse']) @ matrix
+    return matrix
+
+
+def _replace_record_geometry(mesh, indices, verts, edges, faces, record_ids):
+    """Swap the geometry of the given records in the set's mesh for the
+    new geometry; every other record's geometry is left as it is."""
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    layer = bm.verts.layers.int.get(RECORD_ATTRIBUTE)
+    if layer is None:
+        layer = bm.verts.layers.int.new(RECORD_ATTRIBUTE)
+    drop = set(indices)
+    bmesh.ops.delete(bm, geom=[v for v in bm.verts if v[layer] in drop],
+                     context='VERTS')
+    new_verts = []
+    for co, record_id in zip(verts, record_ids):
+        vert = bm.verts.new(co)
+        vert[layer] = record_id
+        new_verts.append(vert)
+    for a, b in edges:
+        bm.edges.new((new_verts[a], new_verts[b]))
+    for face in faces:
+        try:
+            bm.faces.new([new_verts[i] for i in face])
+        except ValueError:
+            continue  # duplicate face
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+
+
+def _rebuild_records(scene, set_obj, records, indices):
+    """Re-evaluate the geometry of the given records in place."""
+    evaluator = _evaluator()
+    if evaluator is None:
+        # The records hold the new inputs; expanding applies them.
+        return
+    dim = hb_types.GeoNodeDimension(evaluator)
+    geometry = ([], [], [], [])
+    scene.collection.objects.link(evaluator)
+    try:
+        with _scene_depsgraph(scene) as depsgraph:
+            for i in indices:
+                record = records[i]
+                curve = evaluator.data
+                if len(curve.splines[0].points) > len(record['points']):
+                    curve.splines.clear()
+                    curve.splines.new('POLY').points.add(len(record['points']) - 1)
+                _apply_shape(dim, record)
+                evaluator.matrix_world = _record_matrix(record)
+                evaluator.update_tag()
+                depsgraph.update()
+                _collect_geometry(depsgraph, {evaluator.name: i}, *geometry)
+    finally:
+        scene.collection.objects.unlink(evaluator)
+    _replace_record_geometry(set_obj.data, indices, *geometry)
+
+
+def set_record_inputs(scene, values):
+    """Write dimension node input values ({input name: value}) into the
+    scene's dimension set records and re-evaluate the geometry of the
+    records that changed (annotation rescaling). No dimension objects
+    are recreated, and dimensions expanded for editing are left alone.
+    Returns True when the set changed."""
+    set_obj = get_dimension_set(scene)
+    if set_obj is None:
+        return False
+    records = get_records(set_obj)
+    changed = []
+    for i, record in enumerate(records):
+        if record is None:
+            continue
+        dirty = False
+        for name, value in values.items():
+            old = record['inputs'].get(name)
+            # Records hold the float32 values read from the modifier
+            if name in record['inputs'] and isinstance(old, (int, float)) \
+                    and abs(old - value) > 1e-6:
+                record['inputs'][name] = value
+                dirty = True
+        if dirty:
+            changed.append(i)
+    if not changed:
+        return False
+    _set_records(set_obj, records)
+    _rebuild_records(scene, set_obj, records, changed)
+    return True
@@ -0,0 +1,180 @@
+"""Frame-time instrumentation for the add-on's viewport draw handlers.
+
+Every SpaceView3D draw handler the add-on installs -- the permanent
+overlays (HUD, dimension overlays, split preview) and the ones modal
+operators add while they run -- goes through draw_handler_add here
+instead of bpy.types.SpaceView3D.draw_handler_add. The wrapper costs one
+flag check while recording is off. While it is on, each call's wall time
+is kept in a rolling window per handler, so the sidebar panel and the
+optional on-screen strip can show what each overlay costs per frame
+(average, 95th percentile and worst case, in milliseconds).
+
+A handler runs once per region it draws in, so one sample is one
+viewport redraw; with several 3D viewports open a frame shows up as one
+sample per viewport. Handles returned by draw_handler_add are the real
+Blender handles and are removed with SpaceView3D.draw_handler_remove as
+before.
+
+Recording and the strip are session state, not saved with the file.
+"""
+
+import time
+from collections import deque
+
+import bpy
+import gpu
+
+from .hb_gpu_draw import DrawList, get_visible_window_bounds, text_dimensions
+
+
+WINDOW = 240            # samples kept per handler
+
+STRIP_FONT_SIZE = 11
+STRIP_PAD = 6
+STRIP_MARGIN = 12
+STRIP_BG = (0.08, 0.08, 0.09, 0.80)
+STRIP_TEXT = (0.90, 0.90, 0.90, 1.0)
+STRIP_HOT = (1.0, 0.55, 0.35, 1.0)
+STRIP_HOT_MS = 4.0      # rows averaging above this are highlighted
+
+_recording = False
+_samples = {}           # handler name -> deque of milliseconds
+_strip_handle = None
+
+
+def _timed(name, callback):
+    samples = _samples.setdefault(name, deque(maxlen=WINDOW))
+
+    def wrapper(*args):
+        if not _recording:
+            return callback(*args)
+        start = time.perf_counter()
+        try:
+            return callback(*args)
+        finally:
+            samples.append((time.perf_counter() - start) * 1000.0)
+
+    wrapper.__name__ = getattr(callback, "__name__", "draw")
+    return wrapper
+
+
+def draw_handler_add(callback, args, region_type, draw_type, name=None,
+                     space=None):
+    """SpaceView3D.draw_handler_add (or ``space``'s) with the callback
+    timed under ``name`` -- "module.qualname" unless given."""
+    if name is None:
+        module = getattr(callback, "__module__", None) or ""
+        name = (module.rsplit(".", 1)[-1] + "."
+                + getattr(callback, "__qualname__", repr(callback)))
+    if space is None:
+        space = bpy.types.SpaceView3D
+    return space.draw_handler_add(_timed(name, callback), args,
+                                  region_type, draw_type)
+
+
+# ---- Statistics ---------------------------------------------------------------
+
+def is_recording():
+    return _recording
+
+
+def set_recording(value):
+    global _recording
+    _recording = bool(value)
+    if not _recording:
+        reset()
+
+
+def reset():
+    for samples in _samples.values():
+        samples.clear()
+
+
+def summary():
+    """[(name, average ms, p95 ms, max ms, samples)] for every handler
+    with samples, most expensive average first."""
+    rows = []
+    for name, samples in _samples.items():
+        if not samples:
+            continue
+        ordered = sorted(samples)
+        count = len(ordered)
+        p95 = ordered[min(count - 1, int(count * 0.95))]
+        rows.append((name, sum(ordered) / count, p95, ordered[-1], count))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows
+
+
+# ---- On-screen strip --------------------------------------------------------------
+
+def _draw_strip():
+    area = bpy.context.area
+    if area is None or not _recording:
+        return
+    rows = summary()
+    if not rows:
+        return
+    try:
+        s = bpy.context.preferences.system.ui_scale
+    except AttributeError:
+        s = 1.0
+    font_sz = STRIP_FONT_SIZE * s
+    pad = STRIP_PAD * s
+    gap = STRIP_PAD * 2 * s
+    lines = [(("avg", "p95", "max", "Draw handler (ms)"), STRIP_TEXT)]
+    for name, avg, p95, worst, _count in rows:
+        lines.append(((f"{avg:.2f}", f"{p95:.2f}", f"{worst:.2f}", name),
+                      STRIP_HOT if avg >= STRIP_HOT_MS else STRIP_TEXT))
+    # Numbers right-aligned in their columns, the handler name last.
+    widths = [max(text_dimensions(0, font_sz, cells[i])[0]
+                  for cells, _c in lines) for i in range(4)]
+    line_h = text_dimensions(0, font_sz, "Aj")[1] * 1.5
+    width = sum(widths) + gap * 3
+
+    x_min, _x_max, y_min, _y_max = get_visible_window_bounds(area)
+    x = x_min + STRIP_MARGIN * s
+    y = y_min + STRIP_MARGIN * s
+    dl = DrawList()
+    dl.rect(x, y, width + pad * 2, line_h * len(lines) + pad * 2, STRIP_BG)
+    baseline = y + pad + line_h * (len(lines) - 1) + line_h * 0.25
+    for cells, color in lines:
+        cx = x + pad
+        for i, text in enumerate(cells):
+            tx = cx if i == 3 else cx + widths[i] - text_dimensions(
+                0, font_sz, text)[0]
+            dl.text(0, tx, baseline, font_sz, color, text)
+            cx += widths[i] + gap
+        baseline -= line_h
+    gpu.state.blend_set('ALPHA')
+    dl.draw()
+    gpu.state.blend_set('NONE')
+
+
+def is_strip_shown():
+    return _strip_handle is not None
+
+
+def set_strip_shown(value):
+    """Add / remove the strip's draw handler. The strip itself is drawn
+    untimed so it does not show up in its own numbers."""
+    global _strip_handle
+    if value and _strip_handle is None:
+        _strip_handle = bpy.types.SpaceView3D.draw_handler_add(
+            _draw_strip, (), 'WINDOW', 'POST_PIXEL')
+    elif not value and _strip_handle is not None:
+        bpy.types.SpaceView3D.draw_handler_remove(_strip_handle, 'WINDOW')
+        _strip_handle = None
+    _redraw_viewports()
+
+
+def _redraw_viewports():
+    wm = getattr(bpy.context, "window_manager", None)
+    for window in getattr(wm, "windows", ()):
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def unregister():
+    set_strip_shown(False)
+    set_recording(False)
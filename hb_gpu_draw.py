@@ -3,9 +3,24 @@
 Region-bounds math and low-level rect/text primitives used by the scene
 navigator overlay and the viewport HUD. Kept here so both draw paths share
 one implementation rather than carrying private copies that can drift.
+
+Overlays that draw many labels or buttons per frame accumulate them in a
+DrawList instead of calling draw_rect / draw_rect_outline / draw_lines per
+primitive: the list collects triangles and line segments with per-vertex
+colors and submits one batch per primitive type, then draws its text on
+top, so the draw-call count no longer grows with the number of labels.
+A BatchCache keeps the GPU batches of a list whose geometry repeats from
+frame to frame (HUD buttons) so they are not rebuilt at all.
+
+Text is measured through text_dimensions, which memoizes blf.dimensions
+on (font id, size, text); labels that repeat every frame are measured
+once.
 """
 
+import functools
+
 import blf
+import gpu
 from gpu_extras.batch import batch_for_shader
 
 
@@ -93,11 +108,20 @@ def draw_text(font_id, x, y, size, color, text):
     blf.draw(font_id, text)
 
 
+@functools.lru_cache(maxsize=4096)
+def text_dimensions(font_id, size, text):
+    """blf.dimensions of ``text`` at ``size``, memoized. Callers pass the
+    size with the UI scale already applied, so a scale change measures
+    afresh under new keys and the old entries age out of the LRU. Leaves
+    blf's size untouched on a cache hit; set it before drawing."""
+    blf.size(font_id, size)
+    return blf.dimensions(font_id, text)
+
+
 def vcenter_baseline(rect, font_id, size):
     """Y baseline that vertically centers a line of text in `rect`."""
     rx, ry, rw, rh = rect
-    blf.size(font_id, size)
-    text_h = blf.dimensions(font_id, "Aj")[1]
+    text_h = text_dimensions(font_id, size, "Aj")[1]
     return ry + (rh - text_h) / 2.0
 
 
@@ -112,3 +136,109 @@ def draw_lines(shader, points, color):
     two at a time as segment endpoints."""
     shader.uniform_float("color", color)
     batch_for_shader(shader, 'LINES', {"pos": points}).draw(shader)
+
+
+# ---- Batched drawing ---------------------------------------------------------
+
+class DrawList:
+    """Per-frame accumulator of filled rects, outlines, line segments and
+    text. Everything added is drawn by draw(): triangles first, then lines,
+    then text, so within one list text is always on top of shapes. Draw
+    separate lists for separately layered (or scissored) parts."""
+
+    __slots__ = ("tris", "tri_colors", "lines", "line_colors", "texts")
+
+    def __init__(self):
+        self.tris = []
+        self.tri_colors = []
+        self.lines = []
+        self.line_colors = []
+        self.texts = []
+
+    def __bool__(self):
+        return bool(self.tris or self.lines or self.texts)
+
+    def rect(self, x, y, w, h, color):
+        """Filled rectangle via two triangles."""
+        self.tris += ((x, y), (x + w, y), (x + w, y + h),
+                      (x, y), (x + w, y + h), (x, y + h))
+        self.tri_colors += (color,) * 6
+
+    def rect_outline(self, x, y, w, h, color):
+        """Rectangle border via line segments."""
+        self.lines += ((x, y), (x + w, y),
+                       (x + w, y), (x + w, y + h),
+                       (x + w, y + h), (x, y + h),
+                       (x, y + h), (x, y))
+        self.line_colors += (color,) * 8
+
+    def segments(self, points, color):
+        """Line segments; ``points`` is consumed two at a time, as in
+        draw_lines."""
+        self.lines += points
+        self.line_colors += (color,) * len(points)
+
+    def text(self, font_id, x, y, size, color, text):
+        """Queue a line of text at a baseline position (see draw_text)."""
+        self.texts.append((font_id, x, y, size, color, text))
+
+    def shape_key(self):
+        """Everything the GPU batches are built from, for BatchCache."""
+        return (self.tris, self.tri_colors, self.lines, self.line_colors)
+
+    def batches(self):
+        """(triangle batch or None, line batch or None)."""
+        shader = _flat_color_shader()
+        tri_batch = line_batch = None
+        if self.tris:
+            tri_batch = batch_for_shader(
+                shader, 'TRIS', {"pos": self.tris, "color": self.tri_colors})
+        if self.lines:
+            line_batch = batch_for_shader(
+                shader, 'LINES', {"pos": self.lines, "color": self.line_colors})
+        return tri_batch, line_batch
+
+    def draw(self, cache=None):
+        """Submit the list: at most one triangle batch and one line batch
+        (reused from ``cache`` when the geometry is unchanged), then the
+        text. Callers own the blend state."""
+        if cache is not None:
+            tri_batch, line_batch = cache.batches(self)
+        else:
+            tri_batch, line_batch = self.batches()
+        if tri_batch is not None or line_batch is not None:
+            shader = _flat_color_shader()
+            shader.bind()
+            if tri_batch is not None:
+                tri_batch.draw(shader)
+            if line_batch is not None:
+                line_batch.draw(shader)
+        for font_id, x, y, size, color, text in self.texts:
+            draw_text(font_id, x, y, size, color, text)
+
+
+class BatchCache:
+    """Keeps the GPU batches of the last DrawList drawn through it and
+    reuses them while the next list has the same shapes and colors.
+    Comparing the vertex lists is far cheaper than uploading new buffers."""
+
+    __slots__ = ("_key", "_batches")
+
+    def __init__(self):
+        self._key = None
+        self._batches = (None, None)
+
+    def batches(self, draw_list):
+        key = draw_list.shape_key()
+        if key != self._key:
+            self._batches = draw_list.batches()
+            self._key = key
+        return self._batches
+
+    def clear(self):
+        self._key = None
+        self._batches = (None, None)
+
+
+def _flat_color_shader():
+    return gpu.shader.from_builtin('FLAT_COLOR')
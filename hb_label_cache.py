@@ -0,0 +1,143 @@
+"""Two-level label cache for editable viewport dimension overlays.
+
+The product overlays (face frame dims, closet dims) draw value labels on
+every redraw of every 3D viewport, and their click operators ask for the
+same labels again to hit-test. Building those labels means walking the
+scene for product roots, walking their cages and parts, formatting unit
+strings and measuring text -- none of which changes while the user just
+orbits. The cache splits the work in two:
+
+- World labels: whatever the overlay's build function returns (groups of
+  world-space anchors, texts and text sizes). Rebuilt only when the build
+  key changes (mode, units, UI scale) or a depsgraph update touches an
+  object the overlay cares about (its ``is_relevant`` test), or a
+  collection changes (objects added / removed).
+- Screen labels: the overlay's projection of the world labels into a
+  region. Cached per region and re-projected only when that region's
+  view matrix or size changes, or the world labels were rebuilt.
+
+Everything cached is by name, never by object reference, so undo and
+file loads can't leave dangling pointers; both clear every cache anyway.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+
+
+_caches = []
+
+
+class LabelCache:
+    """Cache for one overlay. ``is_relevant(obj)`` decides whether a
+    depsgraph update to ``obj`` (an original object) invalidates the
+    world labels."""
+
+    def __init__(self, is_relevant):
+        self.is_relevant = is_relevant
+        self._key = None
+        self._world = None
+        self._generation = 0
+        self._views = {}
+
+    def invalidate(self):
+        self._world = None
+        self._views.clear()
+
+    def world(self, key, build):
+        """World labels for ``key``; calls ``build()`` when stale."""
+        if self._world is None or key != self._key:
+            self._world = build()
+            self._key = key
+            self._generation += 1
+            self._views.clear()
+        return self._world
+
+    def projected(self, region, rv3d, project):
+        """Screen labels for the region; calls ``project()`` when the
+        view, the region size or the world labels changed."""
+        key = (self._generation, region.width, region.height,
+               tuple(tuple(row) for row in rv3d.perspective_matrix))
+        pointer = region.as_pointer()
+        cached = self._views.get(pointer)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        screen = project()
+        self._views[pointer] = (key, screen)
+        return screen
+
+
+def unit_key(unit_settings):
+    """The unit settings that change how a length is formatted."""
+    return (unit_settings.system, unit_settings.length_unit,
+            round(unit_settings.scale_length, 9),
+            unit_settings.use_separate)
+
+
+def ui_scale():
+    try:
+        return bpy.context.preferences.system.ui_scale
+    except AttributeError:
+        return 1.0
+
+
+# ---- Invalidation ---------------------------------------------------------------
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    pending = [cache for cache in _caches if cache._world is not None]
+    if not pending:
+        return
+    for update in depsgraph.updates:
+        id_data = update.id
+        if isinstance(id_data, bpy.types.Collection):
+            # Objects linked / unlinked / deleted
+            for cache in pending:
+                cache.invalidate()
+            return
+        if not isinstance(id_data, bpy.types.Object):
+            continue
+        obj = id_data.original
+        for cache in pending[:]:
+            if cache.is_relevant(obj):
+                cache.invalidate()
+                pending.remove(cache)
+        if not pending:
+            return
+
+
+@persistent
+def _on_reset(*_args):
+    for cache in _caches:
+        cache.invalidate()
+
+
+_HANDLERS = (
+    ('depsgraph_update_post', _on_depsgraph_update),
+    ('undo_post', _on_reset),
+    ('redo_post', _on_reset),
+    ('load_post', _on_reset),
+)
+
+
+def watch(cache):
+    """Start invalidating ``cache`` from depsgraph updates (call from the
+    overlay's register)."""
+    if cache not in _caches:
+        _caches.append(cache)
+    for name, handler in _HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if handler not in handlers:
+            handlers.append(handler)
+
+
+def unwatch(cache):
+    """Stop invalidating ``cache``; the handlers go with the last one."""
+    cache.invalidate()
+    if cache in _caches:
+        _caches.remove(cache)
+    if _caches:
+        return
+    for name, handler in _HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if handler in handlers:
+            handlers.remove(handler)
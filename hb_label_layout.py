@@ -0,0 +1,154 @@
+"""Screen-space de-overlap for viewport overlay labels.
+
+In head-on views (plan view of a wall, elevation of a tall stack)
+several label anchors project to the same screen point. Overlays stack
+such labels below each other instead of letting them pile up. Checking
+every new label against every placed one is O(n^2) per frame; LabelStack
+keeps placed rects in a uniform bucket grid so a label is only tested
+against the labels in the cells it covers, and remembers which labels
+were pushed under which so a label landing on an existing stack jumps
+straight to its bottom instead of walking down it one label at a time.
+Placement is roughly linear in the label count, including the worst
+case of every label sharing one anchor. A label still colliding after
+MAX_SHIFTS shifts goes below the lowest placed label it shares any
+x-range with, so the result never overlaps; that fallback scans every
+placed label, but only dense tangles of partly overlapping stacks need
+it.
+
+Pure Python with no bpy dependency, so the benchmark runs standalone:
+``python hb_label_layout.py [count]``.
+"""
+
+import math
+import time
+
+
+DEFAULT_CELL = 64.0
+MAX_SHIFTS = 64
+
+
+class LabelStack:
+    """Places (x, y, w, h) rects one at a time, shifting each down until
+    it clears every rect placed before it. ``gap`` is the spacing kept
+    between stacked rects; ``cell`` the grid bucket size in pixels
+    (about one label's width works best)."""
+
+    __slots__ = ("gap", "cell", "_grid", "_rects", "_below", "_span")
+
+    def __init__(self, gap=0.0, cell=DEFAULT_CELL):
+        self.gap = gap
+        self.cell = float(cell)
+        self._grid = {}
+        self._rects = []
+        # index -> index of the rect last pushed directly under it
+        self._below = {}
+        # index of a pushed rect -> x range shared by it and every rect
+        # above it in its stack
+        self._span = {}
+
+    def __len__(self):
+        return len(self._rects)
+
+    def _cells(self, x, y, w, h):
+        c = self.cell
+        x0 = math.floor(x / c)
+        x1 = math.floor((x + w) / c)
+        y0 = math.floor(y / c)
+        y1 = math.floor((y + h) / c)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield (cx, cy)
+
+    def _first_hit(self, x, y, w, h):
+        """Index of the earliest-placed rect overlapping (x, y, w, h),
+        or None -- the same rect a linear scan would find first."""
+        rects = self._rects
+        best = None
+        for key in self._cells(x, y, w, h):
+            for i in self._grid.get(key, ()):
+                if best is not None and i >= best:
+                    break
+                ex, ey, ew, eh = rects[i]
+                if x < ex + ew and ex < x + w and y < ey + eh and ey < y + h:
+                    best = i
+                    break
+        return best
+
+    def _stack_bottom(self, i):
+        """Last rect in the chain pushed under ``i``, compressing the
+        chain so later lookups take one step."""
+        below = self._below
+        tail = i
+        while tail in below:
+            tail = below[tail]
+        while i in below and below[i] != tail:
+            below[i], i = tail, below[i]
+        return tail
+
+    def place(self, rect):
+        """Shifted copy of ``rect`` that clears the placed rects; the
+        result is recorded as placed."""
+        x, y, w, h = rect
+        pushed_under = None
+        for _ in range(MAX_SHIFTS):
+            hit = self._first_hit(x, y, w, h)
+            if hit is None:
+                break
+            bottom = self._stack_bottom(hit)
+            if bottom != hit:
+                # Walking down would hit every rect of the stack in turn
+                # while this rect overlaps all of them horizontally.
+                lo, hi = self._span[bottom]
+                if x < hi and lo < x + w:
+                    hit = bottom
+            pushed_under = hit
+            y = self._rects[hit][1] - h - self.gap
+        else:
+            if self._first_hit(x, y, w, h) is not None:
+                y = min(ey for ex, ey, ew, _eh in self._rects
+                        if x < ex + ew and ex < x + w) - h - self.gap
+                pushed_under = None
+        index = len(self._rects)
+        self._rects.append((x, y, w, h))
+        for key in self._cells(x, y, w, h):
+            self._grid.setdefault(key, []).append(index)
+        if pushed_under is not None:
+            self._below[pushed_under] = index
+            ex, _ey, ew, _eh = self._rects[pushed_under]
+            lo, hi = self._span.get(pushed_under, (ex, ex + ew))
+            self._span[index] = (max(lo, x), min(hi, x + w))
+        return (x, y, w, h)
+
+
+def _overlap_count(rects):
+    count = 0
+    for i, (x, y, w, h) in enumerate(rects):
+        for ex, ey, ew, eh in rects[:i]:
+            if x < ex + ew and ex < x + w and y < ey + eh and ey < y + h:
+                count += 1
+    return count
+
+
+def benchmark(count=1000, repeat=5):
+    """Time placing ``count`` synthetic labels that all project to one
+    anchor (the head-on elevation worst case). Returns the best time in
+    seconds and prints a summary with an overlap check."""
+    rects = [(400.0 - (40 + i % 5 * 8) / 2.0, 300.0, 40.0 + i % 5 * 8, 18.0)
+             for i in range(count)]
+    best = None
+    placed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stack = LabelStack(gap=2.0, cell=48.0)
+        placed = [stack.place(r) for r in rects]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{count} labels on one anchor: {best * 1000.0:.2f} ms "
+          f"({best * 1e6 / count:.2f} us/label), "
+          f"{_overlap_count(placed)} overlaps")
+    return best
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
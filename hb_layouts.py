@@ -2,6 +2,7 @@ import bpy
 import math
 from mathutils import Vector, Matrix, Euler
 from . import hb_types
+from . import hb_wall_cutters
 from . import units
 
 # =============================================================================
@@ -252,6 +253,71 @@ def _reset_layer_frame(layer, scene):
     return frame.drawing
 
 
+# Bulk drawing access for bake/unbake: (attribute, domain, data type,
+# components, default when the attribute is absent). Point data is moved
+# with foreach_get/foreach_set on whole attribute arrays; a per-point
+# Python loop is far too slow for dense elevations.
+_BAKE_ATTRIBUTES = (
+    ('position', 'POINT', 'FLOAT_VECTOR', 3, 0.0),
+    ('radius', 'POINT', 'FLOAT', 1, 0.01),
+    ('opacity', 'POINT', 'FLOAT', 1, 1.0),
+    ('material_index', 'CURVE', 'INT', 1, 0),
+    ('cyclic', 'CURVE', 'BOOLEAN', 1, False),
+)
+
+# Most recent bake / unbake timings, newest last:
+# {'scene', 'action', 'strokes', 'points', 'seconds'}
+BAKE_LOG = []
+BAKE_LOG_SIZE = 20
+
+
+def _log_bake(scene, action, strokes, points, seconds):
+    BAKE_LOG.append({'scene': scene.name, 'action': action,
+                     'strokes': strokes, 'points': points, 'seconds': seconds})
+    del BAKE_LOG[:-BAKE_LOG_SIZE]
+
+
+def _attribute_array(attr, dtype, width, count):
+    import numpy as np
+    data = np.empty(count * width, dtype=dtype)
+    attr.data.foreach_get('vector' if width == 3 else 'value', data)
+    return data
+
+
+def _read_drawing(drawing):
+    """Snapshot a drawing's strokes as flat arrays: (stroke sizes,
+    {attribute name: array}). Returns None for an empty drawing."""
+    import numpy as np
+    stroke_count = len(drawing.strokes)
+    if not stroke_count:
+        return None
+    offsets = np.empty(stroke_count + 1, dtype=np.int32)
+    drawing.curve_offsets.foreach_get('value', offsets)
+    sizes = np.diff(offsets)
+    counts = {'POINT': int(offsets[-1]), 'CURVE': stroke_count}
+    arrays = {}
+    for name, domain, data_type, width, default in _BAKE_ATTRIBUTES:
+        dtype = {'INT': np.int32, 'BOOLEAN': bool}.get(data_type, np.float32)
+        attr = drawing.attributes.get(name)
+        if attr is None:
+            arrays[name] = np.full(counts[domain] * width, default, dtype=dtype)
+        else:
+            arrays[name] = _attribute_array(attr, dtype, width, counts[domain])
+    return sizes, arrays
+
+
+def _write_drawing(drawing, sizes, arrays):
+    """Add strokes of the given sizes to an empty drawing and fill their
+    attributes from _read_drawing arrays."""
+    drawing.add_strokes(sizes.tolist())
+    for name, domain, data_type, width, _default in _BAKE_ATTRIBUTES:
+        attr = drawing.attributes.get(name)
+        if attr is None:
+            attr = drawing.attributes.new(name, data_type, domain)
+        attr.data.foreach_set('vector' if width == 3 else 'value', arrays[name])
+    drawing.tag_positions_changed()
+
+
 def bake_line_art_editable(scene):
     """Convert the view's generated line art into editable strokes.
 
@@ -261,11 +327,13 @@ def bake_line_art_editable(scene):
     to with the standard Grease Pencil edit tools. The trade: baked
     lines no longer follow cabinet changes -- unbake_line_art (or
     regenerating the view) returns to automatic tracing. Returns True
-    when strokes were baked.
+    when strokes were baked. Timings go to BAKE_LOG.
     """
+    import time
     gp_obj = get_line_art_object(scene)
     if gp_obj is None:
         return False
+    start = time.perf_counter()
 
     # The evaluated depsgraph belongs to the active window scene; make
     # sure we snapshot THIS scene's evaluation even when called for a
@@ -285,20 +353,11 @@ def bake_line_art_editable(scene):
             frame = layer.current_frame()
             if frame is None:
                 continue
-            rows = []
-            for s in frame.drawing.strokes:
-                rows.append((
-                    [tuple(p.position) for p in s.points],
-                    [p.radius for p in s.points],
-                    [p.opacity for p in s.points],
-                    s.material_index,
-                    s.cyclic,
-                ))
-            snapshot[layer.name] = rows
+            snapshot[layer.name] = _read_drawing(frame.drawing)
     finally:
         if window and original_scene is not None and window.scene is not original_scene:
             window.scene = original_scene
-    if not any(snapshot.values()):
+    if not any(data is not None for data in snapshot.values()):
         return False
 
     # Disable the whole generating stack. The resample + dash modifiers
@@ -308,34 +367,39 @@ def bake_line_art_editable(scene):
         mod.show_viewport = False
         mod.show_render = False
 
-    for layer_name, rows in snapshot.items():
+    strokes = points = 0
+    for layer_name, data in snapshot.items():
         layer = gp_obj.data.layers.get(layer_name)
         if layer is None:
             continue
         drawing = _reset_layer_frame(layer, scene)
-        if not rows:
+        if data is None:
             continue
-        drawing.add_strokes([len(r[0]) for r in rows])
-        for si, (positions, radii, opacities, mat_idx, cyclic) in enumerate(rows):
-            stroke = drawing.strokes[si]
-            stroke.material_index = mat_idx
-            stroke.cyclic = cyclic
-            for pi, point in enumerate(stroke.points):
-                point.position = positions[pi]
-                point.radius = radii[pi]
-                point.opacity = opacities[pi]
+        sizes, arrays = data
+        _write_drawing(drawing, sizes, arrays)
+        strokes += len(sizes)
+        points += int(sizes.sum())
 
     gp_obj[LINEART_BAKED_PROP] = True
     gp_obj.data.update_tag()
+    _log_bake(scene, "baked", strokes, points, time.perf_counter() - start)
     return True
 
 
 def unbake_line_art(scene):
     """Discard baked/edited strokes and return to automatic tracing."""
+    import time
     gp_obj = get_line_art_object(scene)
     if gp_obj is None:
         return
+    start = time.perf_counter()
+    strokes = points = 0
     for layer in gp_obj.data.layers:
+        frame = layer.current_frame()
+        if frame is not None:
+            strokes += len(frame.drawing.strokes)
+            position = frame.drawing.attributes.get('position')
+            points += len(position.data) if position is not None else 0
         _reset_layer_frame(layer, scene)
         layer.hide = False
     if LINEART_BAKED_PROP in gp_obj:
@@ -344,6 +408,7 @@ def unbake_line_art(scene):
         mod.show_viewport = True
         mod.show_render = True
     refresh_line_art(scene)
+    _log_bake(scene, "unbaked", strokes, points, time.perf_counter() - start)
 
 
 def _ensure_lineart_layer(gp_data, scene, name):
@@ -503,16 +568,24 @@ def update_line_art_sizes(scene):
     except Exception:
         return
     jitter = _ensure_lineart_camera(scene)
+    # Write only what changed: every modifier write re-runs Line Art, and
+    # batched rescales (rescale_layout_annotations) call this for every
+    # sheet whether or not its scale moved.
     for mod in gp_obj.modifiers:
         if mod.name in ("Lineart Solid", "Lineart Marked"):
-            mod.radius = solid_radius
+            if abs(mod.radius - solid_radius) > 1e-9:
+                mod.radius = solid_radius
         elif mod.name == "Lineart Dashed":
-            mod.radius = dashed_radius
+            if abs(mod.radius - dashed_radius) > 1e-9:
+                mod.radius = dashed_radius
         elif mod.name == "Resample Dashed":
-            mod.length = sample_length
+            if abs(mod.length - sample_length) > 1e-9:
+                mod.length = sample_length
         if mod.type == 'LINEART' and jitter is not None:
-            mod.use_custom_camera = True
-            mod.source_camera = jitter
+            if not mod.use_custom_camera:
+                mod.use_custom_camera = True
+            if mod.source_camera != jitter:
+                mod.source_camera = jitter
 
 
 _EMISSION_COPY_SUFFIX = " LAEmit"
@@ -1422,6 +1495,186 @@ class LayoutView:
             self.camera = None
 
 
+# Product root cages that get per-product content collections in views
+PRODUCT_ROOT_TAGS = (
+    'IS_FRAMELESS_CABINET_CAGE',
+    'IS_FACE_FRAME_CABINET_CAGE',
+    'IS_CLOSET_STARTER_CAGE',
+    'IS_FRAMELESS_PRODUCT_CAGE',
+    'IS_FACE_FRAME_PRODUCT_CAGE',
+)
+
+# Tags on view content collections and their instances, so a view can be
+# re-synced against the model without rebuilding it.
+CONTENT_SOURCE_PROP = 'HB_CONTENT_SOURCE'
+CONTENT_KIND_PROP = 'HB_CONTENT_KIND'
+CONTENT_SIG_PROP = 'HB_CONTENT_SIG'
+CONTENT_KIND_WALL = 'WALL'
+CONTENT_KIND_SOLID = 'SOLID'
+CONTENT_KIND_DASHED = 'DASHED'
+
+
+def _split_signature(solid_objs, dashed_objs):
+    """Order-independent signature of a product's solid/dashed split."""
+    import hashlib
+    h = hashlib.sha1()
+    h.update("|".join(sorted(o.name for o in solid_objs)).encode())
+    h.update(b"#")
+    h.update("|".join(sorted(o.name for o in dashed_objs)).encode())
+    return h.hexdigest()
+
+
+def _sync_collection_objects(collection, objects):
+    """Make collection.objects equal objects, touching only the
+    difference. Returns True when anything changed."""
+    wanted = {o.name: o for o in objects}
+    current = {o.name for o in collection.objects}
+    changed = False
+    for name in current - wanted.keys():
+        collection.objects.unlink(collection.objects[name])
+        changed = True
+    for name in wanted.keys() - current:
+        collection.objects.link(wanted[name])
+        changed = True
+    return changed
+
+
+# =============================================================================
+# SHARED CONTENT REGISTRY
+# =============================================================================
+#
+# One content collection per wall (the wall mesh and its loose parts) and
+# one solid / dashed pair per product, shared by every layout view that
+# draws them: views only add collection instances. A second view of an
+# already drawn wall links nothing, and the file no longer carries a
+# copy of every product's collections per sheet. A shared collection is
+# found by name and confirmed by its CONTENT_SOURCE_PROP tag; once the
+# last view instancing it is deleted it has no users and is dropped on
+# save.
+
+def is_product_root(obj) -> bool:
+    """Product root cages that get their own per-product content
+    collections. Closet starters join the cabinet branch here --
+    their root is a cage, so without this they would only contribute
+    the (invisible) cage object and never walk the subtree: no
+    geometry in elevation views. PRODUCT_CAGE roots (Support Frame,
+    Half Wall, ...) share the same shape -- a cage root over part
+    children -- and were dropped the same way, so they join too."""
+    return any(obj.get(tag) for tag in PRODUCT_ROOT_TAGS)
+
+
+def split_product_objects(obj):
+    """(solid objects, dashed objects) of an object tree.
+
+    Interior parts (frameless or face frame) go to dashed, all other
+    visible geometry goes to solid. Cages and helpers are skipped but
+    their children are processed.
+    """
+    solid_objs = []
+    dashed_objs = []
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if not is_cage_object(o) and not is_helper_object(o):
+            if o.get('IS_FRAMELESS_INTERIOR_PART') or o.get('IS_FACE_FRAME_INTERIOR_PART'):
+                dashed_objs.append(o)
+            else:
+                solid_objs.append(o)
+        stack.extend(reversed(o.children))
+    return solid_objs, dashed_objs
+
+
+def wall_content_objects(wall_obj):
+    """Objects a wall's own content collection holds: the (possibly
+    pre-cut) wall plus loose non-product children such as applied end
+    panels. With the cut cache preference on, the static pre-cut proxy
+    stands in for the live wall so sheets don't re-run its opening
+    booleans."""
+    objects = [hb_wall_cutters.drafting_wall_object(wall_obj)]
+    for child in wall_obj.children:
+        # Skip helper empties
+        if child.get('obj_x') or 'Overlay Prompt Obj' in child.name:
+            continue
+        if is_product_root(child):
+            continue
+        if not is_cage_object(child) and not is_helper_object(child):
+            objects.append(child)
+    return objects
+
+
+def _shared_content_collection(source_obj, kind, create=True):
+    name = f"HB Content {source_obj.name} {kind.title()}"
+    coll = bpy.data.collections.get(name)
+    if coll is not None and coll.get(CONTENT_SOURCE_PROP) == source_obj.name:
+        return coll
+    if not create:
+        return None
+    coll = bpy.data.collections.new(name)
+    coll[CONTENT_SOURCE_PROP] = source_obj.name
+    coll[CONTENT_KIND_PROP] = kind
+    return coll
+
+
+def get_wall_content(wall_obj):
+    """The wall's shared content collection, brought up to date."""
+    coll = _shared_content_collection(wall_obj, CONTENT_KIND_WALL)
+    _sync_collection_objects(coll, wall_content_objects(wall_obj))
+    return coll
+
+
+def get_product_content(product):
+    """The product's shared (solid, dashed, changed) content. dashed is
+    None when the product has no interior parts; changed is True when
+    the split had to be redone (the part list or the interior flags
+    changed since the last sync)."""
+    solid_objs, dashed_objs = split_product_objects(product)
+    signature = _split_signature(solid_objs, dashed_objs)
+    solid = _shared_content_collection(product, CONTENT_KIND_SOLID)
+    dashed = _shared_content_collection(product, CONTENT_KIND_DASHED,
+                                        create=bool(dashed_objs))
+    if solid.get(CONTENT_SIG_PROP) == signature:
+        return solid, (dashed if dashed_objs else None), False
+    _sync_collection_objects(solid, solid_objs)
+    if dashed is not None:
+        _sync_collection_objects(dashed, dashed_objs)
+    solid[CONTENT_SIG_PROP] = signature
+    return solid, (dashed if dashed_objs else None), True
+
+
+def link_walls_content(collection, walls, use_wall_content=True):
+    """Fill a whole-room view's content collection from the registry.
+
+    Each wall's shared collections become children of ``collection``;
+    whatever else of the wall trees is visible geometry (children of
+    non-product cages, ...) is linked directly, so the collection draws
+    exactly the walls' visible subtrees. use_wall_content=False leaves
+    the live wall meshes (not the drafting proxies) as direct links.
+    """
+    for wall_obj in walls:
+        shared = [get_wall_content(wall_obj)] if use_wall_content else []
+        for child in wall_obj.children:
+            if is_product_root(child):
+                solid, dashed, _changed = get_product_content(child)
+                shared.append(solid)
+                if dashed is not None:
+                    shared.append(dashed)
+        # The wall itself is drawn by its content collection, possibly
+        # through the cut cache proxy
+        covered = {wall_obj.name} if use_wall_content else set()
+        for coll in shared:
+            if coll.name not in collection.children:
+                collection.children.link(coll)
+            covered.update(o.name for o in coll.objects)
+        stack = [wall_obj]
+        while stack:
+            obj = stack.pop()
+            stack.extend(obj.children)
+            if is_cage_object(obj) or is_helper_object(obj) or obj.name in covered:
+                continue
+            if obj.name not in collection.objects:
+                collection.objects.link(obj)
+
+
 class ElevationView(LayoutView):
     """Elevation view of a wall - front orthographic projection."""
     
@@ -1679,64 +1932,44 @@ class ElevationView(LayoutView):
         return dim
 
     def _create_content_collections(self, wall_obj: bpy.types.Object, view_name: str):
-        """Create per-cabinet collections with solid/dashed split for Freestyle rendering.
+        """Instance the wall's and each cabinet's shared content collections.
         
-        Each cabinet gets its own solid collection (and dashed collection if it has interior parts).
-        The wall mesh itself gets a separate solid collection.
+        Each cabinet has a solid collection (and a dashed collection if it has
+        interior parts), the wall mesh has its own; see get_product_content.
         Each collection gets a collection instance in the elevation scene, enabling
         independent selection, color changes, and duplication of individual cabinets.
         """
-        solid_freestyle = self.get_freestyle_collection('SOLID')
-        dashed_freestyle = self.get_freestyle_collection('DASHED')
-        
-        # Create a solid collection for the wall mesh itself
-        wall_solid = bpy.data.collections.new(f"{view_name}_{wall_obj.name}_Solid")
-        if wall_obj.name not in wall_solid.objects:
-            wall_solid.objects.link(wall_obj)
-        self._create_collection_instance(wall_solid, f"{view_name}_{wall_obj.name}", solid_freestyle)
+        self._add_wall_instance(get_wall_content(wall_obj), view_name)
         
         # Process each direct child of the wall
         for child in wall_obj.children:
-            # Skip helper empties
-            if child.get('obj_x') or 'Overlay Prompt Obj' in child.name:
-                continue
-            
-            # Product root cages that get their own per-product content
-            # collections. Closet starters join the cabinet branch here --
-            # their root is a cage, so without this they fall to the else
-            # branch, which links only the (invisible) cage object and
-            # never walks the subtree: no geometry in elevation views.
-            # PRODUCT_CAGE roots (Support Frame, Half Wall, ...) share the
-            # same shape -- a cage root over part children -- and were
-            # dropped the same way, so they join this branch too.
-            if (child.get('IS_FRAMELESS_CABINET_CAGE')
-                    or child.get('IS_FACE_FRAME_CABINET_CAGE')
-                    or child.get('IS_CLOSET_STARTER_CAGE')
-                    or child.get('IS_FRAMELESS_PRODUCT_CAGE')
-                    or child.get('IS_FACE_FRAME_PRODUCT_CAGE')):
-                # Cabinet: create solid and dashed collections
-                cabinet_name = child.name
-                cab_solid = bpy.data.collections.new(f"{view_name}_{cabinet_name}_Solid")
-                cab_dashed = bpy.data.collections.new(f"{view_name}_{cabinet_name}_Dashed")
-                
-                # Recursively sort cabinet parts into solid vs dashed
-                self._collect_objects_split(child, cab_solid, cab_dashed)
-                
-                # Always create solid instance
-                self._create_collection_instance(cab_solid, f"{view_name}_{cabinet_name}_Solid", solid_freestyle)
-                
-                # Only create dashed instance if there are dashed objects
-                if len(cab_dashed.objects) > 0:
-                    self._create_collection_instance(cab_dashed, f"{view_name}_{cabinet_name}_Dashed", dashed_freestyle)
-                else:
-                    # Clean up empty collection
-                    bpy.data.collections.remove(cab_dashed)
-            else:
-                # Non-cabinet child (e.g. applied end panels, other geometry)
-                if not self._is_cage(child) and not self._is_helper(child):
-                    # Add to wall solid collection
-                    if child.name not in wall_solid.objects:
-                        wall_solid.objects.link(child)
+            if is_product_root(child):
+                solid, dashed, _changed = get_product_content(child)
+                self._add_product_instances(child, view_name, solid, dashed)
+    
+    def _add_wall_instance(self, wall_content, view_name):
+        instance = self._create_collection_instance(
+            wall_content, f"{view_name}_{self.wall_obj.name}", self.get_freestyle_collection('SOLID'))
+        self._tag_content(instance, self.wall_obj, CONTENT_KIND_WALL)
+    
+    def _add_product_instances(self, product, view_name, solid, dashed):
+        instance = self._create_collection_instance(
+            solid, f"{view_name}_{product.name}_Solid", self.get_freestyle_collection('SOLID'))
+        self._tag_content(instance, product, CONTENT_KIND_SOLID)
+        
+        # Only create dashed instance if there are dashed objects
+        if dashed is not None:
+            self._add_dashed_instance(product, view_name, dashed)
+    
+    def _add_dashed_instance(self, product, view_name, dashed):
+        instance = self._create_collection_instance(
+            dashed, f"{view_name}_{product.name}_Dashed", self.get_freestyle_collection('DASHED'))
+        self._tag_content(instance, product, CONTENT_KIND_DASHED)
+    
+    @staticmethod
+    def _tag_content(idblock, source_obj, kind):
+        idblock[CONTENT_SOURCE_PROP] = source_obj.name
+        idblock[CONTENT_KIND_PROP] = kind
     
     def _create_collection_instance(self, collection: bpy.types.Collection, name: str, 
                                      freestyle_collection: bpy.types.Collection) -> bpy.types.Object:
@@ -1756,21 +1989,129 @@ class ElevationView(LayoutView):
     
     def _collect_objects_split(self, obj: bpy.types.Object, solid_col: bpy.types.Collection, 
                                dashed_col: bpy.types.Collection):
-        """Recursively sort an object tree into solid and dashed collections.
-        
-        Interior parts (frameless or face frame) go to dashed, all other visible
-        geometry goes to solid. Cages and helpers are skipped but their children are processed.
+        """Recursively sort an object tree into solid and dashed collections
+        (see split_product_objects)."""
+        solid_objs, dashed_objs = split_product_objects(obj)
+        for o in solid_objs:
+            if o.name not in solid_col.objects:
+                solid_col.objects.link(o)
+        for o in dashed_objs:
+            if o.name not in dashed_col.objects:
+                dashed_col.objects.link(o)
+    
+    # -------------------------------------------------------------------------
+    # Incremental sync
+    # -------------------------------------------------------------------------
+    
+    def _content_instances(self):
+        """{(source name, kind): instance} for the view's content
+        instances. Views built before content tagging are matched by the
+        '<view>_<source>_Solid' / '_Dashed' naming."""
+        view_name = self.scene.name
+        found = {}
+        for obj in self.scene.collection.all_objects:
+            if obj.type != 'EMPTY' or obj.instance_type != 'COLLECTION':
+                continue
+            coll = obj.instance_collection
+            if coll is None:
+                continue
+            source = obj.get(CONTENT_SOURCE_PROP)
+            kind = obj.get(CONTENT_KIND_PROP)
+            if source is None:
+                name = coll.name
+                if not name.startswith(view_name + "_"):
+                    continue
+                rest = name[len(view_name) + 1:]
+                if rest.startswith("Freestyle_"):
+                    continue
+                if self.wall_obj and rest == f"{self.wall_obj.name}_Solid":
+                    source, kind = self.wall_obj.name, CONTENT_KIND_WALL
+                elif rest.endswith("_Solid"):
+                    source, kind = rest[:-len("_Solid")], CONTENT_KIND_SOLID
+                elif rest.endswith("_Dashed"):
+                    source, kind = rest[:-len("_Dashed")], CONTENT_KIND_DASHED
+                else:
+                    continue
+                obj[CONTENT_SOURCE_PROP] = source
+                obj[CONTENT_KIND_PROP] = kind
+            found[(source, kind)] = obj
+        return found
+    
+    @staticmethod
+    def _set_instance_collection(instance, collection):
+        """Point an instance at a (shared) collection, dropping the old
+        collection once nothing uses it. Returns True when it changed."""
+        old = instance.instance_collection
+        if old is collection:
+            return False
+        instance.instance_collection = collection
+        if old is not None and old.users == 0:
+            bpy.data.collections.remove(old)
+        return True
+    
+    def _remove_content_instance(self, instance):
+        coll = instance.instance_collection
+        bpy.data.objects.remove(instance)
+        if coll is not None and coll.users == 0:
+            bpy.data.collections.remove(coll)
+    
+    def sync_content(self):
+        """Bring the view's content instances in line with the wall.
+        
+        Diffs the wall's current product children against the view's
+        content instances: instances are only created or removed for
+        products that were added or deleted, and a product's shared
+        solid/dashed split is only redone when its part list (or which
+        parts are interior) changed. Views built before the shared
+        registry are moved onto it here. Returns (added, removed,
+        resplit) product counts.
         """
-        if not self._is_cage(obj) and not self._is_helper(obj):
-            if obj.get('IS_FRAMELESS_INTERIOR_PART') or obj.get('IS_FACE_FRAME_INTERIOR_PART'):
-                if obj.name not in dashed_col.objects:
-                    dashed_col.objects.link(obj)
-            else:
-                if obj.name not in solid_col.objects:
-                    solid_col.objects.link(obj)
+        if not self.wall_obj or not self.scene:
+            return (0, 0, 0)
+        view_name = self.scene.name
+        instances = self._content_instances()
+        
+        wall_content = get_wall_content(self.wall_obj)
+        wall_instance = instances.get((self.wall_obj.name, CONTENT_KIND_WALL))
+        if wall_instance is None:
+            self._add_wall_instance(wall_content, view_name)
+        else:
+            self._set_instance_collection(wall_instance, wall_content)
         
-        for child in obj.children:
-            self._collect_objects_split(child, solid_col, dashed_col)
+        products = {c.name: c for c in self.wall_obj.children if is_product_root(c)}
+        
+        removed = set()
+        for (source, kind), instance in list(instances.items()):
+            if kind == CONTENT_KIND_WALL or source in products:
+                continue
+            self._remove_content_instance(instance)
+            del instances[(source, kind)]
+            removed.add(source)
+        
+        added = resplit = 0
+        for name, product in products.items():
+            solid, dashed, changed = get_product_content(product)
+            solid_instance = instances.get((name, CONTENT_KIND_SOLID))
+            if solid_instance is None:
+                self._add_product_instances(product, view_name, solid, dashed)
+                added += 1
+                continue
+            
+            changed |= self._set_instance_collection(solid_instance, solid)
+            dashed_instance = instances.get((name, CONTENT_KIND_DASHED))
+            if dashed is not None and dashed_instance is None:
+                self._add_dashed_instance(product, view_name, dashed)
+                changed = True
+            elif dashed is not None:
+                changed |= self._set_instance_collection(dashed_instance, dashed)
+            elif dashed_instance is not None:
+                self._remove_content_instance(dashed_instance)
+                changed = True
+            resplit += changed
+        
+        if added or removed or resplit:
+            refresh_line_art(self.scene)
+        return (added, len(removed), resplit)
     
     @staticmethod
     def _is_cage(obj: bpy.types.Object) -> bool:
@@ -1783,14 +2124,22 @@ class ElevationView(LayoutView):
         return is_helper_object(obj)
     
     def update(self):
-        """Update the elevation view to reflect changes in the 3D model."""
+        """Update the elevation view to reflect changes in the 3D model.
+        Returns sync_content's (added, removed, resplit) counts."""
         if not self.wall_obj or not self.camera:
-            return
+            return (0, 0, 0)
         
         wall = hb_types.GeoNodeWall(self.wall_obj)
         wall_length = wall.get_input('Length')
         wall_height = wall.get_input('Height')
         
+        # Re-cut cached wall meshes only if an opening moved
+        hb_wall_cutters.refresh_cut_cache(self.wall_obj)
+        hb_wall_cutters.refresh_stale_cut_caches()
+        
+        # Pick up added / removed / changed products
+        changes = self.sync_content()
+        
         # Update camera position
         wall_center_local = Vector((wall_length / 2, -2, wall_height / 2))
         wall_center_world = self.wall_obj.matrix_world @ wall_center_local
@@ -1804,6 +2153,7 @@ class ElevationView(LayoutView):
         margin = 0.2
         max_dimension = max(wall_length, wall_height) + margin * 2
         self.set_camera_ortho_scale(max_dimension)
+        return changes
 
 
 class PlanView(LayoutView):
@@ -1882,11 +2232,10 @@ class PlanView(LayoutView):
         self.create_camera(f"{name} Camera", center, camera_rotation)
         self.set_camera_ortho_scale(size)
         
-        # Create collection for all walls and their children
+        # Create collection for all walls and their children, built from
+        # the walls' and products' shared content collections
         self.content_collection = bpy.data.collections.new(f"{name} Content")
-        
-        for wall_obj in walls:
-            self._add_object_to_collection(wall_obj, self.content_collection)
+        link_walls_content(self.content_collection, walls)
         
         # Create collection instance
         self.collection_instance = bpy.data.objects.new(f"{name} Instance", None)
@@ -1972,21 +2321,6 @@ class PlanView(LayoutView):
         max_dimension = max(width, height)
         self.set_camera_ortho_scale(max_dimension)
 
-    def _add_object_to_collection(self, obj: bpy.types.Object, collection: bpy.types.Collection):
-        """Recursively add object and its children to collection.
-        Skips cage objects (GeoNodeCage) as they are containers, not visible geometry."""
-        
-        # Skip cage objects and helper empties - they are organizational, not visible geometry
-        is_cage = is_cage_object(obj)
-        is_helper = is_helper_object(obj)
-        
-        if not is_cage and not is_helper:
-            if obj.name not in collection.objects:
-                collection.objects.link(obj)
-        
-        for child in obj.children:
-            self._add_object_to_collection(child, collection)
-
 
 class View3D(LayoutView):
     """3D perspective or isometric view."""
@@ -2066,11 +2400,11 @@ class View3D(LayoutView):
         
         self.scene.camera = self.camera
         
-        # Create collection for all objects
+        # Create collection for all objects. The products come from the
+        # shared registry; the walls stay the live meshes (the cut cache
+        # proxy is a drafting stand-in).
         self.content_collection = bpy.data.collections.new(f"{name} Content")
-        
-        for wall_obj in walls:
-            self._add_object_to_collection(wall_obj, self.content_collection)
+        link_walls_content(self.content_collection, walls, use_wall_content=False)
         
         # Create collection instance
         self.collection_instance = bpy.data.objects.new(f"{name} Instance", None)
@@ -2156,21 +2490,6 @@ class View3D(LayoutView):
         max_dimension = max(width, height)
         self.set_camera_ortho_scale(max_dimension)
 
-    def _add_object_to_collection(self, obj: bpy.types.Object, collection: bpy.types.Collection):
-        """Recursively add object and its children to collection.
-        Skips cage objects (GeoNodeCage) as they are containers, not visible geometry."""
-        
-        # Skip cage objects and helper empties - they are organizational, not visible geometry
-        is_cage = is_cage_object(obj)
-        is_helper = is_helper_object(obj)
-        
-        if not is_cage and not is_helper:
-            if obj.name not in collection.objects:
-                collection.objects.link(obj)
-        
-        for child in obj.children:
-            self._add_object_to_collection(child, collection)
-
 
 class MultiView(LayoutView):
     """Multi-view layout showing multiple orthographic views of an object (plan, elevations, sides)."""
@@ -0,0 +1,181 @@
+import os
+import zlib
+
+# Minimal PDF writer for layout sheet export.
+#
+# Pages are written to the file as they are added; only the object byte
+# offsets and page ids are kept in memory, and the page tree, catalog
+# and cross-reference table are written by close(). Supports vector
+# pages (a ready-made content stream) and full-page RGB image pages,
+# which can be streamed in bands of rows (add_image_page_rows).
+
+# PDF user space unit: 1/72 inch
+POINTS_PER_INCH = 72.0
+
+_CATALOG_ID = 1
+_PAGES_ID = 2
+
+
+def fmt(value):
+    """Compact number formatting for content streams (0.01pt precision)."""
+    text = f"{value:.2f}".rstrip('0').rstrip('.')
+    return "0" if text in ("", "-0") else text
+
+
+class PdfWriter:
+    """Write a multi-page PDF one page at a time.
+
+    with PdfWriter(path) as pdf:
+        pdf.add_vector_page(width_pt, height_pt, content)
+        pdf.add_image_page(width_pt, height_pt, px_w, px_h, rgb_bytes)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._offsets = {}
+        self._next_id = _PAGES_ID + 1
+        self._page_ids = []
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    @property
+    def page_count(self):
+        return len(self._page_ids)
+
+    def _write(self, data):
+        if isinstance(data, str):
+            data = data.encode('latin-1')
+        self._file.write(data)
+
+    def _alloc(self):
+        obj_id = self._next_id
+        self._next_id += 1
+        return obj_id
+
+    def _begin(self, obj_id):
+        self._offsets[obj_id] = self._file.tell()
+        self._write(f"{obj_id} 0 obj\n")
+
+    def _end(self):
+        self._write("\nendobj\n")
+
+    def _dict_obj(self, obj_id, body):
+        self._begin(obj_id)
+        self._write(body)
+        self._end()
+
+    def _stream_obj(self, obj_id, entries, data):
+        self._begin(obj_id)
+        self._write(f"<< {entries} /Length {len(data)} >>\nstream\n")
+        self._write(data)
+        self._write("\nendstream")
+        self._end()
+
+    def _page(self, width, height, contents_id, resources):
+        page_id = self._alloc()
+        self._dict_obj(page_id,
+                       f"<< /Type /Page /Parent {_PAGES_ID} 0 R "
+                       f"/MediaBox [0 0 {fmt(width)} {fmt(height)}] "
+                       f"/Contents {contents_id} 0 R /Resources {resources} >>")
+        self._page_ids.append(page_id)
+        return page_id
+
+    def add_vector_page(self, width, height, content):
+        """Add a page drawn by a PDF content stream (str or bytes) in
+        points, origin bottom-left."""
+        if isinstance(content, str):
+            content = content.encode('latin-1')
+        contents_id = self._alloc()
+        self._stream_obj(contents_id, "/Filter /FlateDecode",
+                         zlib.compress(content, 6))
+        return self._page(width, height, contents_id, "<< >>")
+
+    def add_image_page(self, width, height, pixel_width, pixel_height, rgb):
+        """Add a page filled by an 8-bit RGB image, rows top to bottom."""
+        return self.add_image_page_rows(width, height, pixel_width, pixel_height, [rgb])
+
+    def add_image_page_rows(self, width, height, pixel_width, pixel_height, chunks, tee=None):
+        """Like add_image_page, but the pixels arrive as an iterable of
+        byte chunks (bands of rows, top to bottom). Each chunk is
+        compressed and written as it comes, so a page never has to be
+        held in memory whole. The compressed stream is also written to
+        ``tee`` (a binary file) when given, for add_compressed_image_page."""
+        def compressed():
+            compressor = zlib.compressobj(6)
+            for chunk in chunks:
+                yield compressor.compress(chunk)
+            yield compressor.flush()
+        return self._image_page(width, height, pixel_width, pixel_height, compressed(), tee)
+
+    def add_compressed_image_page(self, width, height, pixel_width, pixel_height, path):
+        """Add an image page from a file holding an already compressed
+        image stream (see the ``tee`` of add_image_page_rows)."""
+        def read():
+            with open(path, 'rb') as f:
+                while True:
+                    data = f.read(1 << 20)
+                    if not data:
+                        return
+                    yield data
+        return self._image_page(width, height, pixel_width, pixel_height, read())
+
+    def _image_page(self, width, height, pixel_width, pixel_height, compressed, tee=None):
+        image_id = self._alloc()
+        length_id = self._alloc()
+        self._begin(image_id)
+        self._write(f"<< /Type /XObject /Subtype /Image "
+                    f"/Width {pixel_width} /Height {pixel_height} "
+                    f"/ColorSpace /DeviceRGB /BitsPerComponent 8 "
+                    f"/Filter /FlateDecode /Length {length_id} 0 R >>\nstream\n")
+        length = 0
+        for data in compressed:
+            length += len(data)
+            self._write(data)
+            if tee is not None:
+                tee.write(data)
+        self._write("\nendstream")
+        self._end()
+        self._dict_obj(length_id, str(length))
+
+        contents_id = self._alloc()
+        content = f"q {fmt(width)} 0 0 {fmt(height)} 0 0 cm /Im0 Do Q".encode()
+        self._stream_obj(contents_id, "", content)
+        return self._page(width, height, contents_id,
+                          f"<< /XObject << /Im0 {image_id} 0 R >> >>")
+
+    def abort(self):
+        """Close and delete an unfinished file."""
+        self._file.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def close(self):
+        if self._file.closed:
+            return
+        kids = " ".join(f"{i} 0 R" for i in self._page_ids)
+        self._dict_obj(_PAGES_ID,
+                       f"<< /Type /Pages /Kids [{kids}] "
+                       f"/Count {len(self._page_ids)} >>")
+        self._dict_obj(_CATALOG_ID,
+                       f"<< /Type /Catalog /Pages {_PAGES_ID} 0 R >>")
+
+        xref_offset = self._file.tell()
+        size = self._next_id
+        self._write(f"xref\n0 {size}\n")
+        self._write("0000000000 65535 f \n")
+        for obj_id in range(1, size):
+            self._write(f"{self._offsets.get(obj_id, 0):010d} 00000 n \n")
+        self._write(f"trailer\n<< /Size {size} /Root {_CATALOG_ID} 0 R >>\n"
+                    f"startxref\n{xref_offset}\n%%EOF\n")
+        self._file.close()
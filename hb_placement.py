@@ -8,6 +8,7 @@ from enum import Enum, auto
 from bpy_extras import view3d_utils
 from gpu_extras.batch import batch_for_shader
 from . import hb_snap, units
+from . import hb_draw_stats
 
 
 # Placement-dimension spec consumed by draw_placement_dimensions.
@@ -139,7 +140,7 @@ class PlacementMixin:
         if getattr(self, '_placement_dim_handle', None):
             return
         self._placement_dim_specs = []
-        self._placement_dim_handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._placement_dim_handle = hb_draw_stats.draw_handler_add(
             draw_placement_dimensions, (self, context),
             'WINDOW', 'POST_PIXEL',
         )
@@ -1421,7 +1422,7 @@ class DimensionOperatorMixin:
     def add_dimension_draw_handler(self, context):
         """Add the visual feedback draw handler."""
         args = (self, context)
-        self._dim_draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._dim_draw_handle = hb_draw_stats.draw_handler_add(
             draw_dimension_snap_indicator, args, 'WINDOW', 'POST_PIXEL')
     
     def remove_dimension_draw_handler(self):
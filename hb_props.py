@@ -21,6 +21,7 @@ from . import hb_utils, hb_types
 from .units import inch
 from .hb_types import Variable
 from . import hb_project
+from . import hb_draw_stats
 
 def update_main_tab(self,context):
     # TODO: Load the correct library based on the main_tab
@@ -32,16 +33,89 @@ def update_product_tab(self,context):
     print("update_product_tab")
 
 
+# Scene annotation sizes and where they are written: (home_builder
+# property, target, setting). 'CURVE' targets are detail lines,
+# polylines and circles, 'TEXT' detail text, 'DIMENSION' the named
+# GeoNodeDimension input.
+ANNOTATION_SIZE_TARGETS = (
+    ('annotation_line_thickness', 'CURVE', 'bevel_depth'),
+    ('annotation_text_size', 'TEXT', 'size'),
+    ('annotation_dimension_text_size', 'DIMENSION', "Text Size"),
+    ('annotation_dimension_tick_length', 'DIMENSION', "Tick Length"),
+    ('annotation_dimension_line_thickness', 'DIMENSION', "Line Thickness"),
+    ('annotation_dimension_tick_thickness', 'DIMENSION', "Tick Thickness"),
+)
+
+
+def _annotation_target(obj):
+    if obj.type == 'CURVE':
+        # Skip dimensions (they have their own thickness via geometry nodes)
+        if obj.get('IS_2D_ANNOTATION'):
+            return 'DIMENSION' if obj.get('IS_DIMENSION') else None
+        # Detail lines, polylines, circles, rectangles
+        if obj.get('IS_DETAIL_LINE') or obj.get('IS_DETAIL_POLYLINE') or obj.get('IS_DETAIL_CIRCLE'):
+            return 'CURVE'
+        return None
+    if obj.type == 'FONT' and obj.get('IS_DETAIL_TEXT'):
+        return 'TEXT'
+    if obj.get('IS_DIMENSION'):
+        return 'DIMENSION'
+    return None
+
+
+def apply_annotation_sizes(scene, props=None):
+    """Write the scene's annotation sizes into its annotation objects.
+
+    One pass over the scene for any number of sizes (props: the
+    home_builder property names to apply, default all of
+    ANNOTATION_SIZE_TARGETS). Only values that differ are written, so
+    annotations that already match are not tagged for re-evaluation.
+    Returns the number of objects changed.
+    """
+    hb_scene = scene.home_builder
+    writes = {'CURVE': [], 'TEXT': [], 'DIMENSION': []}
+    for prop, target, setting in ANNOTATION_SIZE_TARGETS:
+        if props is None or prop in props:
+            writes[target].append((setting, getattr(hb_scene, prop)))
+    if not any(writes.values()):
+        return 0
+
+    changed = 0
+    for obj in scene.objects:
+        target = _annotation_target(obj)
+        if target is None or not writes[target]:
+            continue
+        dirty = False
+        if target == 'DIMENSION':
+            dim = hb_types.GeoNodeDimension(obj)
+            if not dim.has_modifier():
+                continue
+            for name, value in writes[target]:
+                try:
+                    if abs(dim.get_input(name) - value) > 1e-9:
+                        dim.set_input(name, value)
+                        dirty = True
+                except (ValueError, TypeError):
+                    continue
+        else:
+            for attr, value in writes[target]:
+                if abs(getattr(obj.data, attr) - value) > 1e-9:
+                    setattr(obj.data, attr, value)
+                    dirty = True
+        changed += dirty
+
+    # Dimensions folded into the sheet's dimension set take the new
+    # sizes through their records
+    if writes['DIMENSION']:
+        from . import hb_dimension_sets
+        if hb_dimension_sets.set_record_inputs(scene, dict(writes['DIMENSION'])):
+            changed += 1
+    return changed
+
+
 def update_line_thickness(self, context):
     """Update all curve line thicknesses in the scene."""
-    for obj in context.scene.objects:
-        if obj.type == 'CURVE':
-            # Skip dimensions (they have their own thickness via geometry nodes)
-            if obj.get('IS_2D_ANNOTATION'):
-                continue
-            # Update detail lines, polylines, circles, rectangles
-            if obj.get('IS_DETAIL_LINE') or obj.get('IS_DETAIL_POLYLINE') or obj.get('IS_DETAIL_CIRCLE'):
-                obj.data.bevel_depth = self.annotation_line_thickness
+    apply_annotation_sizes(context.scene, ('annotation_line_thickness',))
 
 
 def update_line_color(self, context):
@@ -62,9 +136,7 @@ def update_line_color(self, context):
 
 def update_text_size(self, context):
     """Update all text annotation sizes in the scene."""
-    for obj in context.scene.objects:
-        if obj.type == 'FONT' and obj.get('IS_DETAIL_TEXT'):
-            obj.data.size = self.annotation_text_size
+    apply_annotation_sizes(context.scene, ('annotation_text_size',))
 
 
 def update_text_color(self, context):
@@ -108,36 +180,28 @@ def update_ceiling_height(self, context):
 
 def update_dimension_text_size(self, context):
     """Update all dimension text sizes in the scene."""
-    for obj in context.scene.objects:
-        if obj.get('IS_DIMENSION'):
-            dim = hb_types.GeoNodeDimension(obj)
-            dim.set_input("Text Size", self.annotation_dimension_text_size)
+    apply_annotation_sizes(context.scene, ('annotation_dimension_text_size',))
 
 
 def update_dimension_tick_length(self, context):
     """Update all dimension arrow sizes in the scene."""
-    for obj in context.scene.objects:
-        if obj.get('IS_DIMENSION'):
-            dim = hb_types.GeoNodeDimension(obj)
-            dim.set_input("Tick Length", self.annotation_dimension_tick_length)
+    apply_annotation_sizes(context.scene, ('annotation_dimension_tick_length',))
 
 
 def update_dimension_line_thickness(self, context):
     """Update all dimension line and tick thicknesses in the scene."""
-    for obj in context.scene.objects:
-        if obj.get('IS_DIMENSION'):
-            dim = hb_types.GeoNodeDimension(obj)
-            dim.set_input("Line Thickness", self.annotation_dimension_line_thickness)
-            dim.set_input("Tick Thickness", self.annotation_dimension_tick_thickness)
+    apply_annotation_sizes(context.scene, ('annotation_dimension_line_thickness',
+                                           'annotation_dimension_tick_thickness'))
 
 
 def update_font(self, context):
     """Update all text annotations to use the selected font."""
-    if not self.annotation_font:
+    font = self.annotation_font
+    if not font:
         return
     for obj in context.scene.objects:
-        if obj.type == 'FONT' and obj.get('IS_DETAIL_TEXT'):
-            obj.data.font = self.annotation_font
+        if obj.type == 'FONT' and obj.get('IS_DETAIL_TEXT') and obj.data.font != font:
+            obj.data.font = font
 
 def update_annotation_paper_size(self, context):
     """Recalculate world annotation sizes when paper-space sizes change."""
@@ -840,10 +904,41 @@ class Home_Builder_Scene_Props(PropertyGroup):
         if hasattr(bpy.types.Scene, 'home_builder'):
             del bpy.types.Scene.home_builder
 
+def _get_record_draw_times(self):
+    return hb_draw_stats.is_recording()
+
+def _set_record_draw_times(self, value):
+    hb_draw_stats.set_recording(value)
+
+def _get_show_draw_time_strip(self):
+    return hb_draw_stats.is_strip_shown()
+
+def _set_show_draw_time_strip(self, value):
+    hb_draw_stats.set_strip_shown(value)
+
+
 class Home_Builder_Window_Manager_Props(PropertyGroup):
 
     progress: FloatProperty(name="Progress",default=1.0)# type: ignore  
 
+    # Draw-time instrumentation. Session state kept in hb_draw_stats, so
+    # nothing is saved with the file.
+    record_draw_times: BoolProperty(
+        name="Record Draw Times",
+        description="Time every Home Builder viewport draw handler and keep "
+                    "its recent average, 95th percentile and worst case",
+        get=_get_record_draw_times,
+        set=_set_record_draw_times,
+    )# type: ignore
+
+    show_draw_time_strip: BoolProperty(
+        name="Show in Viewport",
+        description="Draw the recorded draw times in the bottom-left "
+                    "corner of every 3D viewport",
+        get=_get_show_draw_time_strip,
+        set=_set_show_draw_time_strip,
+    )# type: ignore
+
     def get_user_preferences(self,context):
         preferences = context.preferences
         add_on_prefs = preferences.addons[__package__].preferences
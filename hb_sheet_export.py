@@ -0,0 +1,639 @@
+import bpy
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from array import array
+from . import hb_utils
+
+# Rendering layout sheets for PDF export.
+#
+# render_sheet_to_png() holds the per-sheet render settings (paper-sized
+# resolution, DPI-scaled Freestyle thickness, white compositor
+# background) so the in-process export and the background workers
+# produce identical pages.
+#
+# SheetWorkerPool runs those renders in parallel: the current file is
+# saved to a snapshot, N ``blender -b`` processes each render a share of
+# the sheets from it, and the UI process only assembles the pages.
+#
+# SheetCache keeps every rendered page (its compressed PDF image
+# stream) in a folder next to the .blend, keyed by sheet_content_hash,
+# so re-exporting a set only renders the sheets that changed.
+
+# Paper sizes in inches (width, height) - portrait orientation
+PAPER_SIZES_INCHES = {
+    'LETTER': (8.5, 11.0),
+    'LEGAL': (8.5, 14.0),
+    'TABLOID': (11.0, 17.0),
+    'A4': (8.27, 11.69),
+    'A3': (11.69, 16.54),
+}
+
+# Freestyle line thicknesses are authored for this DPI
+BASE_DPI = 150.0
+
+
+def get_layout_scenes():
+    """Layout view scenes in sheet order."""
+    layout_scenes = [s for s in bpy.data.scenes if s.get('IS_LAYOUT_VIEW')]
+    layout_scenes.sort(key=lambda s: s.home_builder.sort_order)
+    return layout_scenes
+
+
+def sheet_resolution(scene, dpi):
+    """Pixel (width, height) of a sheet at the given DPI."""
+    paper_w, paper_h = PAPER_SIZES_INCHES.get(scene.hb_paper_size, (8.5, 11.0))
+    if scene.hb_paper_landscape:
+        paper_w, paper_h = paper_h, paper_w
+    return int(paper_w * dpi), int(paper_h * dpi)
+
+
+def paper_size_points(scene):
+    """Sheet (width, height) in PDF points (1/72 inch)."""
+    paper_w, paper_h = PAPER_SIZES_INCHES.get(scene.hb_paper_size, (8.5, 11.0))
+    if scene.hb_paper_landscape:
+        paper_w, paper_h = paper_h, paper_w
+    return paper_w * 72.0, paper_h * 72.0
+
+
+def setup_compositor_white_background(scene):
+    """Set up compositor nodes to add white background to transparent render."""
+    scene.render.use_compositing = True
+
+    # Set color management to Standard for accurate colors
+    scene.view_settings.view_transform = 'Standard'
+
+    # In Blender 5.0, compositor uses node group architecture
+    tree = scene.compositing_node_group
+    if tree is None:
+        tree = bpy.data.node_groups.new(
+            name=f"{scene.name}_Compositor",
+            type='CompositorNodeTree'
+        )
+        scene.compositing_node_group = tree
+
+    nodes = tree.nodes
+    links = tree.links
+
+    for node in list(nodes):
+        nodes.remove(node)
+    tree.interface.clear()
+    tree.interface.new_socket(name="Image", in_out='OUTPUT', socket_type='NodeSocketColor')
+
+    render_layers = nodes.new('CompositorNodeRLayers')
+    render_layers.location = (0, 300)
+
+    white_color = nodes.new('CompositorNodeRGB')
+    white_color.location = (0, 100)
+    white_color.outputs[0].default_value = (1, 1, 1, 1)
+
+    alpha_over = nodes.new('CompositorNodeAlphaOver')
+    alpha_over.location = (300, 300)
+
+    group_output = nodes.new('NodeGroupOutput')
+    group_output.location = (600, 300)
+
+    viewer = nodes.new('CompositorNodeViewer')
+    viewer.location = (600, 100)
+
+    # Alpha Over: inputs[0]=Background, inputs[1]=Foreground
+    links.new(white_color.outputs[0], alpha_over.inputs[0])
+    links.new(render_layers.outputs['Image'], alpha_over.inputs[1])
+    links.new(alpha_over.outputs[0], group_output.inputs[0])
+    links.new(alpha_over.outputs[0], viewer.inputs[0])
+
+
+class _sheet_render_settings:
+    """Paper-sized render settings for one sheet, restored on exit."""
+
+    def __init__(self, scene, dpi):
+        self.scene = scene
+        self.dpi = dpi
+        self.width, self.height = sheet_resolution(scene, dpi)
+
+    def __enter__(self):
+        scene = self.scene
+        thickness_scale = self.dpi / BASE_DPI
+        self.orig_resolution_x = scene.render.resolution_x
+        self.orig_resolution_y = scene.render.resolution_y
+        self.orig_film_transparent = scene.render.film_transparent
+        self.orig_use_compositing = scene.render.use_compositing
+
+        self.orig_lineset_thicknesses = {}
+        for view_layer in scene.view_layers:
+            if view_layer.use_freestyle:
+                for lineset in view_layer.freestyle_settings.linesets:
+                    self.orig_lineset_thicknesses[lineset.name] = lineset.linestyle.thickness
+                    lineset.linestyle.thickness = lineset.linestyle.thickness * thickness_scale
+
+        scene.render.resolution_x = self.width
+        scene.render.resolution_y = self.height
+        scene.render.resolution_percentage = 100
+        scene.render.film_transparent = True
+        setup_compositor_white_background(scene)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        scene = self.scene
+        scene.render.resolution_x = self.orig_resolution_x
+        scene.render.resolution_y = self.orig_resolution_y
+        scene.render.film_transparent = self.orig_film_transparent
+        scene.render.use_compositing = self.orig_use_compositing
+        for view_layer in scene.view_layers:
+            if view_layer.use_freestyle:
+                for lineset in view_layer.freestyle_settings.linesets:
+                    if lineset.name in self.orig_lineset_thicknesses:
+                        lineset.linestyle.thickness = self.orig_lineset_thicknesses[lineset.name]
+
+
+def render_sheet_to_png(scene, dpi, path):
+    """Render one layout scene at paper size and save it as a PNG.
+    Render settings are restored afterwards. Returns False when the
+    scene has no camera or produced no render result."""
+    if not scene.camera:
+        return False
+    with _sheet_render_settings(scene, dpi):
+        bpy.ops.render.render(scene=scene.name)
+        render_result = bpy.data.images.get('Render Result')
+        if not render_result:
+            return False
+        render_result.save_render(path, scene=scene)
+        return True
+
+
+# =============================================================================
+# STREAMING PDF PAGES
+# =============================================================================
+
+# Rows converted and compressed per step when streaming a page
+ROW_BAND = 256
+
+VIEWER_IMAGE = 'Viewer Node'
+
+
+def _linear_to_srgb(values):
+    import numpy as np
+    return np.where(values <= 0.0031308,
+                    values * 12.92,
+                    1.055 * np.power(np.maximum(values, 0.0031308), 1.0 / 2.4) - 0.055)
+
+
+def _viewer_rows(image, width, height):
+    """8-bit RGB rows, top to bottom, from the compositor Viewer image.
+    The float pixels are read in one foreach_get; conversion happens a
+    band of rows at a time."""
+    import numpy as np
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    pixels = pixels.reshape(height, width, 4)
+    # Blender images store the bottom row first
+    for top in range(height, 0, -ROW_BAND):
+        band = pixels[max(top - ROW_BAND, 0):top][::-1, :, :3]
+        band = _linear_to_srgb(np.clip(band, 0.0, 1.0))
+        yield (band * 255.0 + 0.5).astype(np.uint8).tobytes()
+
+
+def _png_rows(path):
+    """8-bit RGB rows of a PNG on disk (Pillow), as one chunk."""
+    from PIL import Image
+    with Image.open(path) as img:
+        rgb = img.convert('RGB')
+        size = rgb.size
+        data = rgb.tobytes()
+    return size, [data]
+
+
+def add_png_page(pdf, scene, path, cache=None, key=None):
+    """Append a rendered sheet PNG to ``pdf`` as a full page, storing
+    the page in ``cache`` under ``key`` when given."""
+    (width, height), rows = _png_rows(path)
+    paper_w, paper_h = paper_size_points(scene)
+    with _cache_tee(cache, key, scene, width, height) as tee:
+        pdf.add_image_page_rows(paper_w, paper_h, width, height, rows, tee=tee)
+
+
+def render_sheet_to_pdf(scene, dpi, pdf, cache=None):
+    """Render one layout scene and append it to ``pdf`` right away.
+
+    Pixels come straight from the compositor Viewer image (the white
+    background composite); when the Viewer image isn't produced the
+    render result goes through a temporary PNG instead. Only one page
+    is held in memory. With a SheetCache, an unchanged sheet is copied
+    from the cache instead of rendered, and a rendered one is stored.
+    Returns False when nothing was rendered."""
+    if not scene.camera:
+        return False
+    key = None
+    if cache is not None:
+        key = sheet_content_hash(scene, dpi)
+        if cache.add_cached_page(pdf, key, scene):
+            return True
+    paper_w, paper_h = paper_size_points(scene)
+    with _sheet_render_settings(scene, dpi) as settings:
+        # Drop the previous sheet's viewer image so a stale one can't be
+        # mistaken for this render.
+        viewer = bpy.data.images.get(VIEWER_IMAGE)
+        if viewer is not None:
+            bpy.data.images.remove(viewer)
+
+        bpy.ops.render.render(scene=scene.name)
+
+        viewer = bpy.data.images.get(VIEWER_IMAGE)
+        if viewer is not None and tuple(viewer.size) == (settings.width, settings.height):
+            with _cache_tee(cache, key, scene, settings.width, settings.height) as tee:
+                pdf.add_image_page_rows(paper_w, paper_h, settings.width, settings.height,
+                                        _viewer_rows(viewer, settings.width, settings.height),
+                                        tee=tee)
+            return True
+
+        render_result = bpy.data.images.get('Render Result')
+        if not render_result:
+            return False
+        temp_path = os.path.join(tempfile.gettempdir(), f"{scene.name}_page.png")
+        render_result.save_render(temp_path, scene=scene)
+    try:
+        add_png_page(pdf, scene, temp_path, cache, key)
+    finally:
+        os.remove(temp_path)
+    return True
+
+
+# =============================================================================
+# SHEET RENDER CACHE
+# =============================================================================
+
+def _rna_signature(struct):
+    """Plain property values of an RNA struct (modifier, camera data,
+    line style...). Pointers contribute the target's name."""
+    values = []
+    for prop in struct.bl_rna.properties:
+        if prop.identifier == 'rna_type' or prop.type == 'COLLECTION':
+            continue
+        try:
+            value = getattr(struct, prop.identifier)
+        except AttributeError:
+            continue
+        if prop.type == 'POINTER':
+            value = getattr(value, 'name', None) if isinstance(value, bpy.types.ID) else None
+        values.append((prop.identifier, hb_utils.signature_value(value)))
+    return values
+
+
+def _custom_props_signature(idblock):
+    values = []
+    for key in sorted(idblock.keys()):
+        value = idblock[key]
+        if isinstance(value, (int, float, str)):
+            values.append((key, value))
+    return values
+
+
+def _buffer_digest(seq, attr, width, typecode='f'):
+    """Digest of a bulk-readable float/int attribute (foreach_get)."""
+    buf = array(typecode, bytes(array(typecode).itemsize * len(seq) * width))
+    seq.foreach_get(attr, buf)
+    return hashlib.sha1(buf.tobytes()).hexdigest()
+
+
+def _grease_pencil_signature(gp_data):
+    values = []
+    for layer in gp_data.layers:
+        values.append((layer.name, layer.hide, round(layer.opacity, 6)))
+        frame = layer.current_frame()
+        if frame is None:
+            continue
+        drawing = frame.drawing
+        position = drawing.attributes.get('position')
+        if position is not None:
+            values.append(_buffer_digest(position.data, 'vector', 3))
+        values.append(len(drawing.strokes))
+    return values
+
+
+def _data_signature(obj):
+    data = obj.data
+    if data is None:
+        return None
+    if obj.type == 'MESH':
+        return (data.name, len(data.vertices), len(data.polygons),
+                _buffer_digest(data.vertices, 'co', 3))
+    if obj.type == 'FONT':
+        return (data.name, data.body, round(data.size, 6),
+                data.align_x, data.align_y,
+                data.font.name if data.font else None)
+    if obj.type == 'CURVE':
+        values = [data.name, round(data.bevel_depth, 6)]
+        for spline in data.splines:
+            values.append(_buffer_digest(spline.points, 'co', 4))
+            values.append(_buffer_digest(spline.bezier_points, 'co', 3))
+        return values
+    if obj.type == 'CAMERA':
+        return _rna_signature(data)
+    if obj.type == 'GREASEPENCIL':
+        return _grease_pencil_signature(data)
+    return data.name
+
+
+def _object_signature(obj):
+    mods = []
+    for mod in obj.modifiers:
+        if mod.type != 'NODES':
+            mods.append(_rna_signature(mod))
+    return (obj.name, obj.type, obj.hide_render,
+            hb_utils.matrix_signature(obj.matrix_world),
+            tuple(round(c, 4) for c in obj.color),
+            hb_utils.gn_inputs_signature(obj), mods,
+            _custom_props_signature(obj), _data_signature(obj))
+
+
+def _iter_sheet_objects(collection, seen=None):
+    """Every object a sheet can draw: the scene's own objects plus,
+    recursively, the contents of instanced collections."""
+    if seen is None:
+        seen = set()
+    if collection.name in seen:
+        return
+    seen.add(collection.name)
+    for obj in collection.all_objects:
+        yield obj
+        if obj.instance_type == 'COLLECTION' and obj.instance_collection is not None:
+            yield from _iter_sheet_objects(obj.instance_collection, seen)
+
+
+def sheet_content_hash(scene, dpi):
+    """Hash of everything that shows on a rendered sheet: every object
+    in the scene and its instanced collections (transforms, geometry
+    node inputs, modifiers, data), the annotation settings, paper size,
+    scale, DPI and line settings."""
+    h = hashlib.sha1()
+
+    def add(value):
+        h.update(repr(value).encode())
+
+    add((scene.name, dpi, scene.hb_paper_size, scene.hb_paper_landscape,
+         scene.hb_layout_scale, scene.frame_current,
+         scene.render.engine, scene.render.use_freestyle,
+         scene.view_settings.view_transform))
+    add(_custom_props_signature(scene))
+    add(_rna_signature(scene.display.shading))
+    for prop in ('hb_lineart_solid_scale', 'hb_lineart_dashed_scale', 'hb_lineart_dash_scale'):
+        add(round(getattr(scene, prop, 1.0), 6))
+    add(_rna_signature(scene.home_builder))
+    for view_layer in scene.view_layers:
+        add((view_layer.name, view_layer.use_freestyle))
+        for lineset in view_layer.freestyle_settings.linesets:
+            add(_rna_signature(lineset))
+            if lineset.linestyle:
+                add(_rna_signature(lineset.linestyle))
+    if scene.camera:
+        add(_object_signature(scene.camera))
+
+    for obj in sorted(_iter_sheet_objects(scene.collection),
+                      key=lambda o: o.name_full):
+        add(_object_signature(obj))
+    return h.hexdigest()
+
+
+def sheet_cache_dir():
+    """Project-side cache folder next to the .blend (temp folder for
+    unsaved files)."""
+    if bpy.data.filepath:
+        folder, name = os.path.split(bpy.data.filepath)
+        return os.path.join(folder, f"{os.path.splitext(name)[0]}_hb_cache", "sheets")
+    return os.path.join(tempfile.gettempdir(), "hb_cache", "sheets")
+
+
+class SheetCache:
+    """Rendered sheet pages on disk.
+
+    Each entry is ``<key>.page`` (the page image's compressed PDF
+    stream) plus ``<key>.json`` (scene name and pixel size). Only the
+    most recent entry per scene and pixel size is kept.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or sheet_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + ".page", base + ".json"
+
+    def lookup(self, key):
+        page_path, meta_path = self._paths(key)
+        if not (os.path.isfile(page_path) and os.path.isfile(meta_path)):
+            return None
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        meta['path'] = page_path
+        return meta
+
+    def add_cached_page(self, pdf, key, scene):
+        """Append the cached page for ``key``. False on a cache miss."""
+        meta = self.lookup(key)
+        if meta is None:
+            self.misses += 1
+            return False
+        paper_w, paper_h = paper_size_points(scene)
+        pdf.add_compressed_image_page(paper_w, paper_h, meta['width'], meta['height'],
+                                      meta['path'])
+        self.hits += 1
+        return True
+
+    def store(self, key, scene, width, height, temp_page_path):
+        page_path, meta_path = self._paths(key)
+        os.replace(temp_page_path, page_path)
+        with open(meta_path, 'w') as f:
+            json.dump({'scene': scene.name, 'width': width, 'height': height}, f)
+        self._drop_older(key, scene.name, width, height)
+
+    def _drop_older(self, key, scene_name, width, height):
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json") or name == key + ".json":
+                continue
+            other = name[:-5]
+            meta = self.lookup(other)
+            if meta is None:
+                continue
+            if meta.get('scene') == scene_name and (meta.get('width'), meta.get('height')) == (width, height):
+                for path in self._paths(other):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+
+class _cache_tee:
+    """Context manager giving add_image_page_rows a file to copy the
+    compressed page into; the copy is committed to the cache on success."""
+
+    def __init__(self, cache, key, scene, width, height):
+        self.cache = cache
+        self.key = key
+        self.scene = scene
+        self.width = width
+        self.height = height
+        self.file = None
+        self.path = None
+
+    def __enter__(self):
+        if self.cache is None or self.key is None:
+            return None
+        os.makedirs(self.cache.directory, exist_ok=True)
+        self.path = os.path.join(self.cache.directory, self.key + ".part")
+        self.file = open(self.path, 'wb')
+        return self.file
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.file is None:
+            return
+        self.file.close()
+        if exc_type is None:
+            self.cache.store(self.key, self.scene, self.width, self.height, self.path)
+        else:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+# =============================================================================
+# BACKGROUND WORKERS
+# =============================================================================
+
+_PAGE_NAME = re.compile(r"sheet_\d{4,}\.png")
+
+
+def page_path(out_dir, index):
+    return os.path.join(out_dir, f"sheet_{index:04d}.png")
+
+
+def default_worker_count():
+    return max(1, os.cpu_count() or 1)
+
+
+class SheetWorkerPool:
+    """Render layout sheets in parallel ``blender -b`` processes.
+
+    start() snapshots the open file and launches the workers; poll()
+    reports how many pages are finished and whether every worker has
+    exited. Pages land in out_dir as page_path(out_dir, index), index
+    being the sheet's position in the scene list passed to start().
+    """
+
+    def __init__(self):
+        self.temp_dir = None
+        self.out_dir = None
+        self.processes = []
+        self.logs = []
+        self.total = 0
+
+    def start(self, scene_names, dpi, worker_count=0, skip=()):
+        """Render every sheet in scene_names except the indices in skip
+        (e.g. pages already in the SheetCache)."""
+        indices = [i for i in range(len(scene_names)) if i not in skip]
+        worker_count = worker_count or default_worker_count()
+        worker_count = max(1, min(worker_count, len(indices)))
+        self.total = len(scene_names)
+        self.temp_dir = tempfile.mkdtemp(prefix="hb_sheets_")
+        self.out_dir = os.path.join(self.temp_dir, "pages")
+        os.makedirs(self.out_dir)
+
+        snapshot = os.path.join(self.temp_dir, "snapshot.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=snapshot, copy=True, compress=False)
+
+        threads = max(1, default_worker_count() // worker_count)
+        expr = (f"import importlib; "
+                f"importlib.import_module('{__package__}.hb_sheet_export').worker_main()")
+        for w in range(worker_count):
+            # Round-robin so heavy sheets next to each other split up
+            jobs = [f"{i}={scene_names[i]}" for n, i in enumerate(indices)
+                    if n % worker_count == w]
+            log_path = os.path.join(self.temp_dir, f"worker_{w}.log")
+            log = open(log_path, 'w')
+            cmd = [bpy.app.binary_path, "-b", snapshot,
+                   "--threads", str(threads),
+                   "--python-expr", expr,
+                   "--", "--dpi", str(dpi), "--out", self.out_dir,
+                   "--jobs", *jobs]
+            self.processes.append(subprocess.Popen(
+                cmd, stdout=log, stderr=subprocess.STDOUT))
+            self.logs.append((log, log_path))
+
+    def finished_pages(self):
+        if not self.out_dir or not os.path.isdir(self.out_dir):
+            return 0
+        return sum(1 for f in os.listdir(self.out_dir) if _PAGE_NAME.fullmatch(f))
+
+    def poll(self):
+        """(finished page count, all workers exited)"""
+        running = any(p.poll() is None for p in self.processes)
+        return self.finished_pages(), not running
+
+    def failed(self):
+        return any(p.returncode not in (0, None) for p in self.processes)
+
+    def error_log(self):
+        """Tail of the first failed worker's log, for the report."""
+        for proc, (_log, log_path) in zip(self.processes, self.logs):
+            if proc.returncode not in (0, None):
+                try:
+                    with open(log_path) as f:
+                        return f.read()[-500:]
+                except OSError:
+                    return ""
+        return ""
+
+    def cancel(self):
+        for p in self.processes:
+            if p.poll() is None:
+                p.kill()
+
+    def cleanup(self):
+        self.cancel()
+        for log, _path in self.logs:
+            try:
+                log.close()
+            except OSError:
+                pass
+        if self.temp_dir:
+            import shutil
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
+
+
+def worker_main(argv=None):
+    """Entry point inside a ``blender -b`` worker: render the assigned
+    sheets of the loaded snapshot to PNG pages."""
+    import argparse
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(prog="hb_sheet_export")
+    parser.add_argument('--dpi', type=int, required=True)
+    parser.add_argument('--out', required=True)
+    parser.add_argument('--jobs', nargs='+', default=[])
+    args = parser.parse_args(argv)
+
+    for job in args.jobs:
+        index, name = job.split("=", 1)
+        scene = bpy.data.scenes.get(name)
+        if scene is None:
+            print(f"Home Builder: sheet '{name}' not found in snapshot")
+            continue
+        final_path = page_path(args.out, int(index))
+        # Render next to the final name and rename, so the parent never
+        # sees a half-written page.
+        temp_path = final_path + ".part"
+        if render_sheet_to_png(scene, args.dpi, temp_path):
+            os.replace(temp_path, final_path)
+            print(f"Home Builder: rendered sheet {index} '{name}'")
+        else:
+            print(f"Home Builder: sheet '{name}' has no camera, skipped")
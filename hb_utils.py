@@ -60,6 +60,68 @@ def gn_input_data_path(mod, identifier):
     return 'modifiers["%s"]["%s"]' % (mod.name, identifier)
 
 
+def signature_value(value):
+    """Hashable, rounded form of a property value for change detection."""
+    if hasattr(value, 'to_list'):
+        return tuple(value.to_list())
+    if hasattr(value, 'name'):
+        return value.name
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (set, frozenset)):
+        # Enum-flag values: set order follows string hashing, which is
+        # randomized per session.
+        return tuple(sorted(value))
+    try:
+        return tuple(value)
+    except TypeError:
+        return value
+
+
+def gn_inputs_signature(obj):
+    """Stable, hashable snapshot of every geometry node modifier input on
+    obj - for change detection (cut caches, sheet render caches)."""
+    values = []
+    for mod in obj.modifiers:
+        if mod.type != 'NODES' or mod.node_group is None:
+            continue
+        values.append((mod.name, mod.node_group.name, mod.show_render))
+        for item in mod.node_group.interface.items_tree:
+            if item.item_type != 'SOCKET' or item.in_out != 'INPUT':
+                continue
+            value = try_get_gn_input(mod, item.identifier)
+            values.append((item.identifier, signature_value(value)))
+    return values
+
+
+def matrix_signature(matrix):
+    """Matrix values rounded for change detection."""
+    return tuple(round(v, 6) for row in matrix for v in row)
+
+
+def evaluated_mesh_instances(depsgraph, names):
+    """(owner, matrix_world, evaluated object) for the evaluated mesh,
+    curve and text geometry of the named objects. Text and geometry-node
+    curves also list their evaluated mesh as an instance of themselves;
+    only that copy is yielded. Use ob.to_mesh() on the evaluated object
+    (and to_mesh_clear() after) to read the geometry."""
+    instanced = {inst.parent.original.name for inst in depsgraph.object_instances
+                 if inst.is_instance and inst.parent is not None}
+    for inst in depsgraph.object_instances:
+        owner = (inst.parent if inst.is_instance else inst.object).original
+        if owner.name not in names:
+            continue
+        ob = inst.object
+        if ob.type not in {'MESH', 'CURVE', 'FONT'}:
+            continue
+        if (not inst.is_instance and ob.type in {'CURVE', 'FONT'}
+                and owner.name in instanced):
+            continue
+        yield owner, inst.matrix_world.copy(), ob
+
+
 # =============================================================================
 # BASE POINT HELPER FUNCTIONS
 # =============================================================================
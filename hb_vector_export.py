@@ -0,0 +1,317 @@
+import bpy
+import numpy as np
+from mathutils import Matrix, Vector
+from . import hb_layouts
+from . import hb_pdf
+from . import hb_sheet_export
+from . import hb_utils
+
+# Vector output for layout sheets.
+#
+# Instead of rendering a sheet and embedding the pixels, the evaluated
+# Line Art strokes (the same data bake_line_art_editable snapshots) and
+# the annotation geometry (dimensions, text, details, title block - the
+# IGNORE routing collection) are projected through the sheet camera and
+# written as PDF / SVG paths in paper points.
+#
+# Line weights come from the stroke radii, which update_line_art_sizes
+# already derives from the paper-space constants, so printed weights
+# match the raster output at any drawing scale.
+#
+# Freestyle views (and Line Art views with a Freestyle iso pass) have no
+# stroke data to read; needs_raster() flags them so the exporter can
+# fall back to a rendered page for those sheets.
+
+WHITE = (1.0, 1.0, 1.0)
+
+
+def needs_raster(scene):
+    """True when a sheet's lines only exist in a Freestyle render."""
+    if hb_layouts.get_scene_line_engine(scene) != hb_layouts.LINE_ENGINE_LINEART:
+        return True
+    if hb_layouts.get_line_art_object(scene) is None:
+        return True
+    return hb_layouts.scene_uses_iso_freestyle(scene)
+
+
+# =============================================================================
+# SHEET DRAWING
+# =============================================================================
+
+class SheetDrawing:
+    """Flat list of paper-space paths, in points with the origin at the
+    bottom-left of the sheet. Items draw in the order they were added."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        # ('STROKE', points, width, color, closed) / ('FILL', polygons, color)
+        self.items = []
+
+    def stroke(self, points, width, color, closed=False):
+        if len(points) > 1:
+            self.items.append(('STROKE', points, width, color, closed))
+
+    def fill(self, polygons, color):
+        if polygons:
+            self.items.append(('FILL', polygons, color))
+
+    def to_pdf_content(self):
+        fmt = hb_pdf.fmt
+        out = ["1 J 1 j"]
+        stroke_color = fill_color = line_width = None
+        for item in self.items:
+            if item[0] == 'STROKE':
+                _kind, points, width, color, closed = item
+                if color != stroke_color:
+                    out.append("{} {} {} RG".format(*(fmt(c) for c in color)))
+                    stroke_color = color
+                if width != line_width:
+                    out.append(f"{fmt(width)} w")
+                    line_width = width
+                path = [f"{fmt(points[0][0])} {fmt(points[0][1])} m"]
+                path += [f"{fmt(x)} {fmt(y)} l" for x, y in points[1:]]
+                out.append(" ".join(path) + (" h S" if closed else " S"))
+            else:
+                _kind, polygons, color = item
+                if color != fill_color:
+                    out.append("{} {} {} rg".format(*(fmt(c) for c in color)))
+                    fill_color = color
+                path = []
+                for poly in polygons:
+                    path.append(f"{fmt(poly[0][0])} {fmt(poly[0][1])} m")
+                    path += [f"{fmt(x)} {fmt(y)} l" for x, y in poly[1:]]
+                    path.append("h")
+                out.append(" ".join(path) + " f")
+        return "\n".join(out)
+
+    def to_svg(self):
+        fmt = hb_pdf.fmt
+        h = self.height
+
+        def color_hex(color):
+            return "#{:02x}{:02x}{:02x}".format(
+                *(max(0, min(255, round(c * 255))) for c in color))
+
+        def coords(points):
+            return " ".join(f"{fmt(x)},{fmt(h - y)}" for x, y in points)
+
+        out = ['<?xml version="1.0" encoding="UTF-8"?>',
+               f'<svg xmlns="http://www.w3.org/2000/svg" '
+               f'width="{fmt(self.width)}pt" height="{fmt(h)}pt" '
+               f'viewBox="0 0 {fmt(self.width)} {fmt(h)}">',
+               f'<rect width="{fmt(self.width)}" height="{fmt(h)}" fill="#ffffff"/>',
+               '<g stroke-linecap="round" stroke-linejoin="round">']
+        for item in self.items:
+            if item[0] == 'STROKE':
+                _kind, points, width, color, closed = item
+                tag = "polygon" if closed else "polyline"
+                out.append(f'<{tag} points="{coords(points)}" fill="none" '
+                           f'stroke="{color_hex(color)}" stroke-width="{fmt(width)}"/>')
+            else:
+                _kind, polygons, color = item
+                d = " ".join(f"M{coords(poly)}Z" for poly in polygons)
+                out.append(f'<path d="{d}" fill="{color_hex(color)}"/>')
+        out.append('</g>')
+        out.append('</svg>')
+        return "\n".join(out)
+
+
+# =============================================================================
+# CAMERA PROJECTION
+# =============================================================================
+
+class _Projector:
+    """World space -> sheet points through the scene camera."""
+
+    def __init__(self, scene, depsgraph, width, height):
+        camera = scene.camera
+        # View cameras are scaled by their ortho scale (title block
+        # normalization); the view matrix must ignore that scale.
+        loc, rot, _scale = camera.matrix_world.decompose()
+        view = Matrix.LocRotScale(loc, rot, None).inverted()
+        # High resolution only to pin down the aspect ratio exactly.
+        res_x, res_y = hb_sheet_export.sheet_resolution(scene, 720)
+        self.matrix = camera.calc_matrix_camera(
+            depsgraph, x=res_x, y=res_y) @ view
+        self.right = rot @ Vector((1.0, 0.0, 0.0))
+        self.width = width
+        self.height = height
+
+    def point(self, co):
+        v = self.matrix @ Vector((co[0], co[1], co[2], 1.0))
+        w = v.w if v.w else 1.0
+        return ((v.x / w + 1.0) * 0.5 * self.width,
+                (v.y / w + 1.0) * 0.5 * self.height)
+
+    def points(self, world):
+        """Sheet points of an (n, 3) array of world-space coordinates."""
+        matrix = np.array(self.matrix, dtype=np.float64)
+        v = world @ matrix[:3, :3].T + matrix[:3, 3]
+        w = world @ matrix[3, :3] + matrix[3, 3]
+        w[w == 0.0] = 1.0
+        x = (v[:, 0] / w + 1.0) * 0.5 * self.width
+        y = (v[:, 1] / w + 1.0) * 0.5 * self.height
+        return list(zip(x.tolist(), y.tolist()))
+
+    def length(self, co, world_length):
+        """Paper length of a world-space length at co."""
+        x0, y0 = self.point(co)
+        x1, y1 = self.point(Vector(co) + self.right * world_length)
+        return ((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5
+
+
+# =============================================================================
+# SHEET CONTENT
+# =============================================================================
+
+class _line_art_visible:
+    """Temporarily show a view's line art so the viewport depsgraph
+    evaluates its strokes (views can be hidden for editing speed)."""
+
+    def __init__(self, scene):
+        self.gp_obj = hb_layouts.get_line_art_object(scene)
+        self.scene = scene
+        self.mods = []
+        self.layers = []
+
+    def __enter__(self):
+        if self.gp_obj is not None:
+            self.mods = [(m, m.show_viewport) for m in self.gp_obj.modifiers]
+            self.layers = [(l, l.hide) for l in self.gp_obj.data.layers]
+            hb_layouts.set_line_art_visible(self.scene, True)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        for mod, state in self.mods:
+            if mod.show_viewport != state:
+                mod.show_viewport = state
+        for layer, state in self.layers:
+            if layer.hide != state:
+                layer.hide = state
+
+
+def _material_color(ob_eval, index):
+    if 0 <= index < len(ob_eval.material_slots):
+        mat = ob_eval.material_slots[index].material
+        if mat is not None and mat.grease_pencil is not None:
+            return tuple(mat.grease_pencil.color[:3])
+    return (0.0, 0.0, 0.0)
+
+
+def _add_line_art(sheet, projector, scene, depsgraph):
+    gp_obj = hb_layouts.get_line_art_object(scene)
+    if gp_obj is None:
+        return
+    ob_eval = gp_obj.evaluated_get(depsgraph)
+    matrix = np.array(ob_eval.matrix_world, dtype=np.float64)
+    holdouts = []
+    for layer in ob_eval.data.layers:
+        is_holdout = layer.name == hb_layouts.LINEART_HOLDOUT_LAYER
+        if layer.hide or (layer.opacity <= 0.0 and not is_holdout):
+            continue
+        frame = layer.current_frame()
+        if frame is None:
+            continue
+        # Whole drawing in a few foreach_get calls rather than one
+        # Python attribute access per point.
+        snapshot = hb_layouts._read_drawing(frame.drawing)
+        if snapshot is None:
+            continue
+        sizes, arrays = snapshot
+        world = (arrays['position'].reshape(-1, 3).astype(np.float64)
+                 @ matrix[:3, :3].T + matrix[:3, 3])
+        radius = arrays['radius']
+        opacity = arrays['opacity']
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        for index, (start, size) in enumerate(zip(starts.tolist(),
+                                                  sizes.tolist())):
+            if size < 2:
+                continue
+            end = start + size
+            if not is_holdout and opacity[start:end].max() <= 0.0:
+                continue
+            width = projector.length(Vector(world[start]),
+                                     float(radius[start:end].mean()) * 2.0)
+            paper = projector.points(world[start:end])
+            if is_holdout:
+                # The raster path masks line art under annotation text
+                # with these strokes; painting them white before the
+                # annotations does the same on paper.
+                holdouts.append((paper, width))
+            else:
+                sheet.stroke(paper, width,
+                             _material_color(
+                                 ob_eval, int(arrays['material_index'][index])),
+                             bool(arrays['cyclic'][index]))
+    for paper, width in holdouts:
+        sheet.stroke(paper, width, WHITE)
+
+
+def _annotation_names(scene):
+    ignore = bpy.data.collections.get(f"{scene.name}_Freestyle_Ignore")
+    if ignore is None:
+        return set()
+    return {o.name for o in ignore.all_objects}
+
+
+def _add_annotations(sheet, projector, scene, depsgraph):
+    """Evaluated geometry of every annotation object: faces are filled
+    with the object color (what the Workbench render shows), loose edges
+    are stroked at the scene's annotation line thickness."""
+    names = _annotation_names(scene)
+    if not names:
+        return
+    line_thickness = scene.home_builder.annotation_line_thickness
+    for owner, matrix, ob in hb_utils.evaluated_mesh_instances(depsgraph, names):
+        if owner.hide_render or owner.color[3] <= 0.0:
+            continue
+        color = tuple(owner.color[:3])
+        try:
+            mesh = ob.to_mesh()
+        except RuntimeError:
+            continue
+        if mesh is None:
+            continue
+        try:
+            verts = [projector.point(matrix @ v.co) for v in mesh.vertices]
+            polygons = [[verts[i] for i in poly.vertices] for poly in mesh.polygons]
+            sheet.fill(polygons, color)
+            face_edges = {key for poly in mesh.polygons for key in poly.edge_keys}
+            for edge in mesh.edges:
+                if edge.key in face_edges:
+                    continue
+                a, b = edge.vertices
+                width = projector.length(matrix @ mesh.vertices[a].co, line_thickness)
+                sheet.stroke([verts[a], verts[b]], width, color)
+        finally:
+            ob.to_mesh_clear()
+
+
+def build_sheet_drawing(scene, depsgraph=None):
+    """Vector drawing of a layout sheet. The scene must be the window
+    scene (or depsgraph must be the scene's), and must have a camera."""
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    width, height = hb_sheet_export.paper_size_points(scene)
+    sheet = SheetDrawing(width, height)
+    projector = _Projector(scene, depsgraph, width, height)
+    _add_line_art(sheet, projector, scene, depsgraph)
+    _add_annotations(sheet, projector, scene, depsgraph)
+    return sheet
+
+
+def evaluate_sheet(context, scene):
+    """Make ``scene`` the window scene, evaluate it with its line art
+    visible and return its SheetDrawing."""
+    if context.window and context.window.scene is not scene:
+        context.window.scene = scene
+    with _line_art_visible(scene):
+        depsgraph = context.evaluated_depsgraph_get()
+        depsgraph.update()
+        return build_sheet_drawing(scene, depsgraph)
+
+
+def write_svg(sheet, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(sheet.to_svg())
@@ -0,0 +1,434 @@
+import bpy
+import hashlib
+from bpy.app.handlers import persistent
+from . import hb_utils
+
+# Per-wall cutter manager.
+#
+# Every door, window and drawn wall cutter used to add its own BOOLEAN
+# modifier to the wall, so a wall with eight openings evaluated eight
+# booleans on every depsgraph update. Instead each wall owns one hidden
+# cutter collection and a single collection-operand boolean that cuts all
+# of its openings in one pass.
+#
+# Drafting views (elevations, plans) and Prepare for Export can also use a
+# pre-cut static copy of the wall: the evaluated mesh is snapshotted into a
+# proxy object and only re-evaluated when the wall or one of its openings
+# changes (see cut_signature). A depsgraph handler notes which walls had
+# a cutter or the wall itself change since their proxy was cut;
+# refresh_stale_cut_caches re-cuts just those and is called wherever
+# proxies are about to be looked at (opening or updating a layout view,
+# PDF / SVG export).
+#
+# The cutter collection is not linked into any scene, so duplicating a room
+# scene with FULL_COPY copies the walls and cutters but not the collection:
+# the copied wall still points at the original's. Each collection records
+# the wall that owns it; a wall that finds someone else's collection builds
+# a private one from its own cutters (see get_cutter_collection). Reading
+# the cutters (iter_cutters, cut_signature) never rebuilds anything.
+
+OPENINGS_MOD_NAME = "HB Openings"
+
+# Custom props stored on the wall BP
+CUTTER_COLLECTION_PROP = 'HB_CUTTER_COLLECTION'
+CUT_CACHE_OBJ_PROP = 'HB_CUT_CACHE_OBJ'
+CUT_CACHE_SIG_PROP = 'HB_CUT_CACHE_SIG'
+
+# Custom prop on the cutter collection: name of the wall that owns it
+CUTTER_OWNER_PROP = 'HB_OWNER_WALL'
+
+# Custom prop on every object add_cutter cuts out of a wall
+CUTTER_TAG_PROP = 'IS_HB_OPENING_CUTTER'
+
+# Wall children that are cutters in files from before CUTTER_TAG_PROP
+LEGACY_CUTTER_FLAGS = ('IS_WALL_CUTTER', 'IS_ENTRY_DOOR_BP', 'IS_WINDOW_BP')
+
+# Legacy per-cutter modifier name prefixes (doors/windows, drawn cutters)
+LEGACY_MOD_PREFIXES = ("Boolean_", "Cut - ")
+
+
+def _get_prefs():
+    try:
+        return bpy.context.preferences.addons[__package__].preferences
+    except (KeyError, AttributeError):
+        return None
+
+
+def get_boolean_solver():
+    """Boolean solver for wall openings from the add-on preferences.
+    FLOAT is Blender's fast solver; EXACT handles coplanar faces."""
+    prefs = _get_prefs()
+    if prefs is None:
+        return 'EXACT'
+    return prefs.wall_boolean_solver
+
+
+def use_cut_cache():
+    prefs = _get_prefs()
+    if prefs is None:
+        return False
+    return prefs.use_wall_cut_cache
+
+
+# =============================================================================
+# CUTTER COLLECTION + MODIFIER
+# =============================================================================
+
+def _new_cutter_collection(wall_obj):
+    coll = bpy.data.collections.new(f"{wall_obj.name} Cutters")
+    coll['IS_WALL_CUTTER_COLLECTION'] = True
+    coll[CUTTER_OWNER_PROP] = wall_obj.name
+    coll.hide_render = True
+    wall_obj[CUTTER_COLLECTION_PROP] = coll.name
+    return coll
+
+
+def _is_own_collection(wall_obj, coll):
+    """True if ``coll`` is ``wall_obj``'s own cutter collection, or one
+    it may claim: from an older file (no owner recorded) or left by a
+    renamed wall, as long as every cutter in it belongs to this wall."""
+    owner = coll.get(CUTTER_OWNER_PROP)
+    if owner == wall_obj.name:
+        return True
+    owner_obj = bpy.data.objects.get(owner) if owner else None
+    if owner_obj is not None and owner_obj.get(CUTTER_COLLECTION_PROP) == coll.name:
+        return False
+    descendants = set(wall_obj.children_recursive)
+    return all(obj in descendants for obj in coll.objects)
+
+
+def _owns_collection(wall_obj, coll):
+    """_is_own_collection, recording the claim on the collection."""
+    if not _is_own_collection(wall_obj, coll):
+        return False
+    if coll.get(CUTTER_OWNER_PROP) != wall_obj.name:
+        coll[CUTTER_OWNER_PROP] = wall_obj.name
+    return True
+
+
+def _own_cutters(wall_obj):
+    """The wall's cutters found through parenting rather than through its
+    collection: tagged descendants, plus legacy-flagged children."""
+    cutters = []
+    for obj in wall_obj.children_recursive:
+        if obj.get(CUTTER_TAG_PROP) or (
+                obj.parent == wall_obj
+                and any(flag in obj for flag in LEGACY_CUTTER_FLAGS)):
+            cutters.append(obj)
+    return cutters
+
+
+def _rebuild_private_collection(wall_obj):
+    """Give a copied wall its own cutter collection built from its own
+    cutters, and drop the cut cache it shares with the original."""
+    coll = _new_cutter_collection(wall_obj)
+    for obj in _own_cutters(wall_obj):
+        coll.objects.link(obj)
+    mod = get_openings_modifier(wall_obj)
+    if mod is not None:
+        mod.collection = coll
+    for prop in (CUT_CACHE_OBJ_PROP, CUT_CACHE_SIG_PROP):
+        if prop in wall_obj:
+            del wall_obj[prop]
+    return coll
+
+
+def get_cutter_collection(wall_obj, create=False):
+    """The hidden collection holding every cutter of ``wall_obj``. A wall
+    that references another wall's collection (a FULL_COPY duplicate) is
+    given a private one first, whether or not ``create`` is set."""
+    name = wall_obj.get(CUTTER_COLLECTION_PROP)
+    coll = bpy.data.collections.get(name) if name else None
+    if coll is not None:
+        if _owns_collection(wall_obj, coll):
+            return coll
+        return _rebuild_private_collection(wall_obj)
+    if not create:
+        return None
+    return _new_cutter_collection(wall_obj)
+
+
+def get_openings_modifier(wall_obj, create=False):
+    mod = wall_obj.modifiers.get(OPENINGS_MOD_NAME)
+    if mod is not None or not create:
+        return mod
+    mod = wall_obj.modifiers.new(name=OPENINGS_MOD_NAME, type='BOOLEAN')
+    mod.operation = 'DIFFERENCE'
+    mod.operand_type = 'COLLECTION'
+    mod.collection = get_cutter_collection(wall_obj, create=True)
+    mod.solver = get_boolean_solver()
+    return mod
+
+
+def iter_cutters(wall_obj):
+    """The wall's cutters, without touching any data: a wall still
+    pointing at another wall's collection gets the cutters its private
+    collection will be built from."""
+    name = wall_obj.get(CUTTER_COLLECTION_PROP)
+    coll = bpy.data.collections.get(name) if name else None
+    if coll is None:
+        return []
+    if _is_own_collection(wall_obj, coll):
+        return list(coll.objects)
+    return _own_cutters(wall_obj)
+
+
+def add_cutter(wall_obj, cutter_obj):
+    """Cut ``cutter_obj`` out of ``wall_obj`` through the wall's shared
+    openings boolean. Safe to call repeatedly for the same cutter."""
+    migrate_legacy_booleans(wall_obj)
+    coll = get_cutter_collection(wall_obj, create=True)
+    if cutter_obj.name not in coll.objects:
+        coll.objects.link(cutter_obj)
+    cutter_obj[CUTTER_TAG_PROP] = True
+    mod = get_openings_modifier(wall_obj, create=True)
+    if mod.collection != coll:
+        mod.collection = coll
+    cutter_obj.hide_render = True
+    return mod
+
+
+def remove_cutter(wall_obj, cutter_obj):
+    """Stop cutting ``cutter_obj`` out of ``wall_obj``. Also drops a
+    legacy per-cutter boolean if the wall still carries one."""
+    coll = get_cutter_collection(wall_obj)
+    if coll is not None and cutter_obj.name in coll.objects:
+        coll.objects.unlink(cutter_obj)
+    if CUTTER_TAG_PROP in cutter_obj:
+        del cutter_obj[CUTTER_TAG_PROP]
+    for mod in list(wall_obj.modifiers):
+        if mod.type == 'BOOLEAN' and mod.operand_type == 'OBJECT' and mod.object == cutter_obj:
+            wall_obj.modifiers.remove(mod)
+
+
+def remove_wall(wall_obj):
+    """Drop the cutter collection and cut cache owned by a wall that is
+    about to be deleted. Ones shared with another wall are left alone."""
+    name = wall_obj.get(CUTTER_COLLECTION_PROP)
+    coll = bpy.data.collections.get(name) if name else None
+    if coll is not None and _owns_collection(wall_obj, coll):
+        bpy.data.collections.remove(coll)
+    proxy = get_cut_cache_object(wall_obj)
+    if proxy is not None:
+        mesh = proxy.data
+        bpy.data.objects.remove(proxy, do_unlink=True)
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def migrate_legacy_booleans(wall_obj):
+    """Fold per-cutter BOOLEAN modifiers from older files into the wall's
+    collection boolean. Returns the number of modifiers folded."""
+    legacy = []
+    for mod in wall_obj.modifiers:
+        if (mod.type == 'BOOLEAN'
+                and mod.operand_type == 'OBJECT'
+                and mod.object is not None
+                and mod.name.startswith(LEGACY_MOD_PREFIXES)):
+            legacy.append(mod)
+    if not legacy:
+        return 0
+    coll = get_cutter_collection(wall_obj, create=True)
+    for mod in legacy:
+        if mod.object.name not in coll.objects:
+            coll.objects.link(mod.object)
+        wall_obj.modifiers.remove(mod)
+    get_openings_modifier(wall_obj, create=True)
+    return len(legacy)
+
+
+def migrate_all_walls():
+    count = 0
+    for obj in bpy.data.objects:
+        if obj.get('IS_WALL_BP'):
+            count += migrate_legacy_booleans(obj)
+    return count
+
+
+def apply_solver_to_all_walls():
+    solver = get_boolean_solver()
+    for obj in bpy.data.objects:
+        if not obj.get('IS_WALL_BP'):
+            continue
+        mod = get_openings_modifier(obj)
+        if mod is not None and mod.solver != solver:
+            mod.solver = solver
+
+
+# =============================================================================
+# PRE-CUT WALL CACHE
+# =============================================================================
+
+def cut_signature(wall_obj):
+    """Hash of everything that shapes the cut wall: the wall's own inputs
+    and transform plus every cutter's transform and inputs."""
+    h = hashlib.sha1()
+    h.update(repr(hb_utils.matrix_signature(wall_obj.matrix_world)).encode())
+    h.update(repr(hb_utils.gn_inputs_signature(wall_obj)).encode())
+    mod = get_openings_modifier(wall_obj)
+    h.update(repr(mod.solver if mod else None).encode())
+    for cutter in sorted(iter_cutters(wall_obj), key=lambda o: o.name):
+        h.update(cutter.name.encode())
+        h.update(repr(hb_utils.matrix_signature(cutter.matrix_world)).encode())
+        h.update(repr(hb_utils.gn_inputs_signature(cutter)).encode())
+        if cutter.type == 'MESH' and not cutter.modifiers:
+            # Drawn wall cutters carry their shape in the mesh itself
+            h.update(repr(len(cutter.data.vertices)).encode())
+            h.update(repr(tuple(round(c, 6) for v in cutter.data.vertices for c in v.co)).encode())
+    return h.hexdigest()
+
+
+def get_cut_cache_object(wall_obj):
+    """The wall's pre-cut proxy. A proxy made for another wall (the
+    original of a duplicated room) is never returned."""
+    name = wall_obj.get(CUT_CACHE_OBJ_PROP)
+    proxy = bpy.data.objects.get(name) if name else None
+    if proxy is None or proxy.get('SOURCE_WALL') != wall_obj.name:
+        return None
+    return proxy
+
+
+def is_cut_cache_valid(wall_obj):
+    return (get_cut_cache_object(wall_obj) is not None
+            and wall_obj.get(CUT_CACHE_SIG_PROP) == cut_signature(wall_obj))
+
+
+def ensure_cut_cache(wall_obj, depsgraph=None):
+    """Return a static proxy object holding the evaluated, already-cut
+    wall mesh. The mesh is only re-evaluated when cut_signature changes."""
+    get_cutter_collection(wall_obj)  # a copied wall gets its own first
+    signature = cut_signature(wall_obj)
+    proxy = get_cut_cache_object(wall_obj)
+    if proxy is not None and wall_obj.get(CUT_CACHE_SIG_PROP) == signature:
+        return proxy
+
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    wall_eval = wall_obj.evaluated_get(depsgraph)
+    mesh = bpy.data.meshes.new_from_object(wall_eval, depsgraph=depsgraph)
+    mesh.name = f"{wall_obj.name} Cut Cache"
+
+    if proxy is None:
+        proxy = bpy.data.objects.new(f"{wall_obj.name} Cut Cache", mesh)
+        proxy['IS_WALL_CUT_CACHE'] = True
+        proxy['SOURCE_WALL'] = wall_obj.name
+        wall_obj[CUT_CACHE_OBJ_PROP] = proxy.name
+    else:
+        old_mesh = proxy.data
+        proxy.data = mesh
+        if old_mesh is not None and old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+
+    proxy.matrix_world = wall_obj.matrix_world.copy()
+    proxy.color = wall_obj.color
+    wall_obj[CUT_CACHE_SIG_PROP] = signature
+    return proxy
+
+
+def drafting_wall_object(wall_obj, depsgraph=None):
+    """The object drafting views should show for ``wall_obj``: the cached
+    pre-cut proxy when the preference is on, else the live wall."""
+    if not use_cut_cache() or not wall_obj.get('IS_WALL_BP'):
+        return wall_obj
+    return ensure_cut_cache(wall_obj, depsgraph)
+
+
+def refresh_cut_cache(wall_obj, depsgraph=None):
+    """Re-evaluate the wall's cached cut mesh if an opening moved. No-op
+    for walls that never had a cache."""
+    _stale_walls.discard(wall_obj.name)
+    if get_cut_cache_object(wall_obj) is None:
+        return None
+    return ensure_cut_cache(wall_obj, depsgraph)
+
+
+# =============================================================================
+# STALE CACHE TRACKING
+# =============================================================================
+
+# Names of walls with a cut cache whose wall or cutters changed since
+# their proxy was last checked.
+_stale_walls = set()
+
+
+def _cached_wall(obj):
+    """The wall with a cut cache that ``obj`` (the wall or one of its
+    cutters) shapes, or None."""
+    if obj.get('IS_WALL_BP'):
+        wall = obj
+    elif obj.get(CUTTER_TAG_PROP) or any(flag in obj for flag in LEGACY_CUTTER_FLAGS):
+        wall = obj.parent
+        while wall is not None and not wall.get('IS_WALL_BP'):
+            wall = wall.parent
+        if wall is None:
+            return None
+    else:
+        return None
+    return wall if CUT_CACHE_OBJ_PROP in wall else None
+
+
+def _mark_cached_walls():
+    _stale_walls.clear()
+    for obj in bpy.data.objects:
+        if obj.get('IS_WALL_BP') and CUT_CACHE_OBJ_PROP in obj:
+            _stale_walls.add(obj.name)
+
+
+def refresh_stale_cut_caches(depsgraph=None):
+    """Re-cut the proxies of walls whose openings changed since they were
+    last checked. Returns the number of walls checked."""
+    names = list(_stale_walls)
+    _stale_walls.clear()
+    count = 0
+    for name in names:
+        wall_obj = bpy.data.objects.get(name)
+        if wall_obj is not None:
+            refresh_cut_cache(wall_obj, depsgraph)
+            count += 1
+    return count
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    if not use_cut_cache():
+        return
+    for update in depsgraph.updates:
+        id_data = update.id
+        if isinstance(id_data, bpy.types.Collection):
+            # Cutters linked / unlinked
+            owner = id_data.original.get(CUTTER_OWNER_PROP)
+            wall = bpy.data.objects.get(owner) if owner else None
+        elif isinstance(id_data, bpy.types.Object):
+            wall = _cached_wall(id_data.original)
+        else:
+            continue
+        if wall is not None and CUT_CACHE_OBJ_PROP in wall:
+            _stale_walls.add(wall.name)
+
+
+@persistent
+def _on_load(*_args):
+    # Proxies saved with the file may predate edits made without the
+    # preference on; check each once.
+    _mark_cached_walls()
+
+
+_HANDLERS = (
+    ('depsgraph_update_post', _on_depsgraph_update),
+    ('load_post', _on_load),
+)
+
+
+def register():
+    for name, handler in _HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if handler not in handlers:
+            handlers.append(handler)
+
+
+def unregister():
+    for name, handler in _HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if handler in handlers:
+            handlers.remove(handler)
+    _stale_walls.clear()
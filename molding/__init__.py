@@ -12,6 +12,7 @@ Modules:
     adapters  - per-library fact providers (face frame / frameless)
     packages  - shipped package presets + built-in placeholder profiles
     ops       - apply/refresh operators and sweep object creation
+    benchmark - headless timing + golden checks on generated layouts
 """
 
 from . import ops
@@ -0,0 +1,290 @@
+"""Headless benchmark and golden-output checks for the molding engine.
+
+Drives engine.connected_components / order_chain / chain_sweep_points /
+rail_sweep_segments / kick_sweep_segments with generated layouts of
+plain engine.Member objects - no scene, no cabinets - so engine changes
+can be timed and checked for unintended geometry changes.
+
+Layouts: L-shaped, U-shaped, island (single and back-to-back) and
+peninsula kitchens at 10, 100 and 1000 members.
+
+Run from Blender in background mode, after the extension is installed:
+
+    blender -b --python-expr "from bl_ext.user_default.home_builder_5.molding import benchmark; benchmark.main()"
+
+Arguments after ``--`` are forwarded: ``--record`` rewrites the golden
+file, ``--sizes 10 100`` limits the sizes, ``--repeat N`` sets the
+number of timed repetitions (best is reported).
+"""
+
+import json
+import math
+import os
+import sys
+import time
+
+from . import engine
+from .. import units
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "benchmark_golden.json")
+SIZES = (10, 100, 1000)
+TOLERANCE = 1e-3
+
+_WIDTH = units.inch(24.0)
+_BASE_DEPTH = units.inch(24.0)
+_BASE_HEIGHT = units.inch(34.5)
+_UPPER_DEPTH = units.inch(12.0)
+_UPPER_HEIGHT = units.inch(30.0)
+_UPPER_Z = units.inch(54.0)
+_KICK_SETBACK = units.inch(3.0)
+
+# Any non-None parent marks a member as wall-mounted.
+_WALL = object()
+
+
+# ---------------------------------------------------------------------------
+# Layout generation
+# ---------------------------------------------------------------------------
+
+def _run(prefix, count, origin, rotation_z, depth, height, z, parent):
+    """`count` members side by side along the rotated local +X axis."""
+    dx = math.cos(rotation_z) * _WIDTH
+    dy = math.sin(rotation_z) * _WIDTH
+    return [engine.Member(f"{prefix}{i:04d}", _WIDTH, depth, height,
+                          location=(origin[0] + dx * i, origin[1] + dy * i, z),
+                          rotation_z=rotation_z, parent=parent)
+            for i in range(count)]
+
+
+def _walls(counts, depth, height, z):
+    """Up to three walls of a U: A along +X facing -Y, B down the right
+    wall facing -X, C up the left wall facing +X. B and C butt into
+    A's front so the runs touch at the corners."""
+    a, b, c = counts
+    length = a * _WIDTH
+    members = _run("A", a, (0.0, 0.0), 0.0, depth, height, z, _WALL)
+    if b:
+        members += _run("B", b, (length, -depth), -math.pi / 2,
+                        depth, height, z, _WALL)
+    if c:
+        members += _run("C", c, (0.0, -depth - c * _WIDTH), math.pi / 2,
+                        depth, height, z, _WALL)
+    return members
+
+
+def _split(total, parts):
+    base = [total // parts] * parts
+    for i in range(total - sum(base)):
+        base[i] += 1
+    return base
+
+
+def layout_l(size):
+    bases, uppers = _split(size, 2)
+    a, b = _split(bases, 2)
+    ua, ub = _split(uppers, 2)
+    return (_walls((a, b, 0), _BASE_DEPTH, _BASE_HEIGHT, 0.0)
+            + _walls((ua, ub, 0), _UPPER_DEPTH, _UPPER_HEIGHT, _UPPER_Z))
+
+
+def layout_u(size):
+    bases, uppers = _split(size, 2)
+    return (_walls(_split(bases, 3), _BASE_DEPTH, _BASE_HEIGHT, 0.0)
+            + _walls(_split(uppers, 3), _UPPER_DEPTH, _UPPER_HEIGHT,
+                     _UPPER_Z))
+
+
+def layout_island(size):
+    """Half single-row islands, half back-to-back double islands, each
+    of at most 8 members, laid out on a grid well apart."""
+    members = []
+    remaining = size
+    slot = 0
+    while remaining > 0:
+        count = min(8, remaining)
+        ox = (slot % 10) * 12 * _WIDTH
+        oy = -(slot // 10) * 6 * _BASE_DEPTH
+        if slot % 2 == 0 or count < 2:
+            members += _run(f"I{slot:03d}_", count, (ox, oy), 0.0,
+                            _BASE_DEPTH, _BASE_HEIGHT, 0.0, None)
+        else:
+            front, back = _split(count, 2)
+            members += _run(f"I{slot:03d}F", front, (ox, oy), 0.0,
+                            _BASE_DEPTH, _BASE_HEIGHT, 0.0, None)
+            members += _run(f"I{slot:03d}B", back,
+                            (ox + back * _WIDTH, oy - 2 * _BASE_DEPTH),
+                            math.pi, _BASE_DEPTH, _BASE_HEIGHT, 0.0, None)
+        remaining -= count
+        slot += 1
+    return members
+
+
+def layout_peninsula(size):
+    """A wall run with a free-standing run butting into its front at
+    right angles."""
+    wall, pen = _split(size, 2)
+    members = _run("W", wall, (0.0, 0.0), 0.0,
+                   _BASE_DEPTH, _BASE_HEIGHT, 0.0, _WALL)
+    members += _run("P", pen, (wall * _WIDTH / 2.0, -_BASE_DEPTH),
+                    -math.pi / 2, _BASE_DEPTH, _BASE_HEIGHT, 0.0, None)
+    return members
+
+
+LAYOUTS = {
+    'L': layout_l,
+    'U': layout_u,
+    'ISLAND': layout_island,
+    'PENINSULA': layout_peninsula,
+}
+
+
+def build_facts(members):
+    """Adapter-shaped facts: plain cabinets with a recessed toe kick,
+    finished at both ends (the engine only applies the end treatment
+    at chain extremities)."""
+    return {id(m): {'role': 'CABINET', 'corner': None,
+                    'kick': {'skip': False, 'setback': _KICK_SETBACK},
+                    'finished_left': True, 'finished_right': True}
+            for m in members}
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def _path_length(points, cyclic=False):
+    total = sum((b - a).length for a, b in zip(points, points[1:]))
+    if cyclic and len(points) > 2:
+        total += (points[0] - points[-1]).length
+    return total
+
+
+def _summarize(segment_lists):
+    """(segment count, point count, total length) over a run's
+    [(points, cyclic)] segments."""
+    count = points = 0
+    length = 0.0
+    for segments in segment_lists:
+        for pts, cyclic in segments:
+            count += 1
+            points += len(pts)
+            length += _path_length(pts, cyclic)
+    return [count, points, round(length, 4)]
+
+
+def run_layout(members, facts):
+    """Run every engine stage over a layout. Returns (timings, summary)."""
+    timings = {}
+    summary = {}
+
+    for align, label in (('top', 'crown'), ('bottom', 'base')):
+        t0 = time.perf_counter()
+        components = engine.connected_components(members, align=align)
+        t1 = time.perf_counter()
+        chains = [engine.order_chain(c, align=align) for c in components]
+        t2 = time.perf_counter()
+        timings[f'{label}_components'] = t1 - t0
+        timings[f'{label}_order_chain'] = t2 - t1
+        summary[f'{label}_chains'] = sorted(len(c) for c in chains)
+
+        if label == 'crown':
+            t0 = time.perf_counter()
+            crown = []
+            for chain in chains:
+                result = engine.chain_sweep_points(
+                    chain, facts, 0.0, units.inch(0.75))
+                if result is not None:
+                    crown.append([(result[0], False)])
+            timings['chain_sweep_points'] = time.perf_counter() - t0
+            summary['chain_sweep_points'] = _summarize(crown)
+        else:
+            t0 = time.perf_counter()
+            rail = []
+            for chain in chains:
+                result = engine.rail_sweep_segments(
+                    chain, facts, 0.0, units.inch(0.5))
+                if result is not None:
+                    rail.append(result[0])
+            timings['rail_sweep_segments'] = time.perf_counter() - t0
+            summary['rail_sweep_segments'] = _summarize(rail)
+
+            t0 = time.perf_counter()
+            kick = [engine.kick_sweep_segments(chain, facts, 0.0, True)
+                    for chain in chains]
+            timings['kick_sweep_segments'] = time.perf_counter() - t0
+            summary['kick_sweep_segments'] = _summarize(kick)
+    return timings, summary
+
+
+def _matches(expected, actual):
+    if isinstance(expected, list):
+        return (isinstance(actual, list) and len(expected) == len(actual)
+                and all(_matches(e, a) for e, a in zip(expected, actual)))
+    if isinstance(expected, float) or isinstance(actual, float):
+        return abs(expected - actual) <= TOLERANCE
+    return expected == actual
+
+
+def run(sizes=SIZES, repeat=3, record=False, out=print):
+    """Time every layout at every size and check (or record) goldens.
+    Returns True when every summary matches its golden."""
+    golden = {}
+    if os.path.isfile(GOLDEN_PATH):
+        with open(GOLDEN_PATH) as f:
+            golden = json.load(f)
+
+    ok = True
+    results = {}
+    for name, make in LAYOUTS.items():
+        for size in sizes:
+            key = f"{name}_{size}"
+            members = make(size)
+            facts = build_facts(members)
+            best = None
+            summary = None
+            for _ in range(max(repeat, 1)):
+                timings, summary = run_layout(members, facts)
+                if best is None:
+                    best = timings
+                else:
+                    best = {k: min(v, best[k]) for k, v in timings.items()}
+            results[key] = summary
+            status = "recorded"
+            if not record:
+                if key not in golden:
+                    status = "no golden"
+                elif _matches(golden[key], summary):
+                    status = "ok"
+                else:
+                    status = "MISMATCH"
+                    ok = False
+            total_ms = sum(best.values()) * 1000.0
+            stages = "  ".join(f"{k}={v * 1000.0:.2f}ms"
+                               for k, v in best.items())
+            out(f"{key:<16} {len(members):>5} members  "
+                f"{total_ms:9.2f}ms  [{status}]  {stages}")
+            if status == "MISMATCH":
+                out(f"    expected {golden[key]}")
+                out(f"    actual   {summary}")
+
+    if record:
+        golden.update(results)
+        with open(GOLDEN_PATH, 'w') as f:
+            json.dump(golden, f, indent=1, sort_keys=True)
+        out(f"Golden outputs written to {GOLDEN_PATH}")
+    return ok
+
+
+def main(argv=None):
+    """Command-line entry; reads the arguments after ``--``."""
+    import argparse
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(prog="molding.benchmark")
+    parser.add_argument('--record', action='store_true',
+                        help="Rewrite the golden outputs")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+    if not run(args.sizes, args.repeat, args.record):
+        sys.exit(1)
@@ -22,6 +22,11 @@ Paths are built as raw front polylines, offset to the RIGHT of travel
 with mitred joins (winding is normalized so right-of-travel is always
 outward), and returned as world XY point lists ready for the caller
 to localize and extrude.
+
+Members are normally cabinet root objects, but the engine only reads a
+member's matrix_world, parent and cage size, so a plain Member (below)
+stands in for one - that is how molding.benchmark drives the engine
+with generated layouts and no scene.
 """
 
 import bpy
@@ -31,6 +36,30 @@ import mathutils
 from .. import hb_types, units
 
 
+# ---------------------------------------------------------------------------
+# Members
+# ---------------------------------------------------------------------------
+
+class Member:
+    """Plain-data stand-in for a cabinet root: world transform plus cage
+    size (width along local +X, depth toward local -Y - the front - and
+    height up +Z). parent is only tested for None (free-standing
+    islands)."""
+
+    def __init__(self, name, width, depth, height,
+                 location=(0.0, 0.0, 0.0), rotation_z=0.0, parent=None):
+        self.name = name
+        self.hb_dims = (width, depth, height)
+        self.matrix_world = mathutils.Matrix.LocRotScale(
+            mathutils.Vector(location),
+            mathutils.Euler((0.0, 0.0, rotation_z)),
+            None)
+        self.parent = parent
+
+    def __repr__(self):
+        return f"<Member {self.name}>"
+
+
 # ---------------------------------------------------------------------------
 # Object measurements
 # ---------------------------------------------------------------------------
@@ -38,6 +67,9 @@ from .. import hb_types, units
 def cage_dims(obj):
     """(width, depth, height) from the root's GeoNode Dim inputs, with
     an evaluated-dimensions fallback."""
+    dims = getattr(obj, 'hb_dims', None)
+    if dims is not None:
+        return dims
     try:
         geo = hb_types.GeoNodeObject(obj)
         x = geo.get_input('Dim X')
@@ -85,42 +117,107 @@ def front_normal_xy(obj):
 # Run grouping
 # ---------------------------------------------------------------------------
 
+def member_bounds(obj):
+    """(min_x, max_x, min_y, max_y, top_z, bottom_z) plan AABB and Z
+    lines of a member, read from the object once."""
+    fp = footprint_xy(obj)
+    xs = [p.x for p in fp]
+    ys = [p.y for p in fp]
+    return (min(xs), max(xs), min(ys), max(ys), top_z(obj), bottom_z(obj))
+
+
+def _bounds_touch(ba, bb, tolerance, align):
+    z = 4 if align == 'top' else 5
+    if abs(ba[z] - bb[z]) > tolerance:
+        return False
+    if ba[0] - tolerance > bb[1] or bb[0] - tolerance > ba[1]:
+        return False
+    if ba[2] - tolerance > bb[3] or bb[2] - tolerance > ba[3]:
+        return False
+    return True
+
+
 def members_touch(a, b, tolerance=0.02, align='top'):
     """True when two members' world plan AABBs touch (overlap once each
     is expanded by the tolerance) and they line up vertically. Crown
     groups on a shared TOP line; base and light rail on the BOTTOM."""
-    if align == 'top':
-        if abs(top_z(a) - top_z(b)) > tolerance:
-            return False
-    else:
-        if abs(bottom_z(a) - bottom_z(b)) > tolerance:
-            return False
-    fa = footprint_xy(a)
-    fb = footprint_xy(b)
-    if (min(p.x for p in fa) - tolerance > max(p.x for p in fb)
-            or min(p.x for p in fb) - tolerance > max(p.x for p in fa)):
-        return False
-    if (min(p.y for p in fa) - tolerance > max(p.y for p in fb)
-            or min(p.y for p in fb) - tolerance > max(p.y for p in fa)):
-        return False
-    return True
+    return _bounds_touch(member_bounds(a), member_bounds(b),
+                         tolerance, align)
+
+
+def touching_pairs(members, tolerance=0.02, align='top'):
+    """Index pairs (i, j), i < j, of touching members.
+
+    Sort-and-sweep instead of testing every pair: members are bucketed
+    on their alignment Z (bucket size = tolerance, so a touching pair
+    always shares a bucket or sits in neighboring ones), and each
+    bucket plus the one above it is swept along the plan axis the
+    members spread out on, comparing a member only against those whose
+    interval is still open. About O(n log n) for wall runs."""
+    bounds = [member_bounds(m) for m in members]
+    z = 4 if align == 'top' else 5
+    buckets = {}
+    for i, b in enumerate(bounds):
+        buckets.setdefault(math.floor(b[z] / tolerance), []).append(i)
+
+    pairs = set()
+    for key, own in buckets.items():
+        group = own + buckets.get(key + 1, [])
+        if len(group) < 2:
+            continue
+        own_set = set(own)
+        spread_x = (max(bounds[i][1] for i in group)
+                    - min(bounds[i][0] for i in group))
+        spread_y = (max(bounds[i][3] for i in group)
+                    - min(bounds[i][2] for i in group))
+        lo, hi = (0, 1) if spread_x >= spread_y else (2, 3)
+        group.sort(key=lambda i: bounds[i][lo])
+        active = []
+        for i in group:
+            start = bounds[i][lo] - tolerance
+            active = [j for j in active if bounds[j][hi] >= start]
+            for j in active:
+                if i not in own_set and j not in own_set:
+                    # Both in the bucket above - swept on its own turn.
+                    continue
+                if _bounds_touch(bounds[i], bounds[j], tolerance, align):
+                    pairs.add((min(i, j), max(i, j)))
+            active.append(i)
+    return sorted(pairs)
+
+
+def _adjacency(members, align):
+    """Touch neighbors per member index, in member order."""
+    adjacent = [[] for _ in members]
+    for i, j in touching_pairs(members, align=align):
+        adjacent[i].append(j)
+        adjacent[j].append(i)
+    for neighbors in adjacent:
+        neighbors.sort()
+    return adjacent
 
 
 def connected_components(members, align='top'):
     """Partition members into touch-connected components."""
-    remaining = list(members)
+    members = list(members)
+    adjacent = _adjacency(members, align)
+    remaining = list(range(len(members)))
+    unvisited = set(remaining)
     components = []
     while remaining:
-        comp = [remaining.pop()]
-        queue = list(comp)
+        seed = remaining.pop()
+        unvisited.discard(seed)
+        comp = [seed]
+        queue = [seed]
         while queue:
             current = queue.pop()
-            for other in list(remaining):
-                if members_touch(current, other, align=align):
+            for other in adjacent[current]:
+                if other in unvisited:
+                    unvisited.discard(other)
                     remaining.remove(other)
                     comp.append(other)
                     queue.append(other)
-        components.append(comp)
+        components.append([members[i] for i in comp])
     return components
 
 
@@ -131,28 +228,23 @@ def order_chain(component, align='top'):
     segment."""
     if len(component) <= 2:
         return list(component)
-    neighbors = {
-        id(c): [o for o in component
-                if o is not c and members_touch(c, o, align=align)]
-        for c in component
-    }
+    adjacent = _adjacency(component, align)
     start = next(
-        (c for c in component if len(neighbors[id(c)]) == 1), component[0])
+        (i for i in range(len(component)) if len(adjacent[i]) == 1), 0)
     chain = [start]
-    used = {id(start)}
+    used = {start}
     current = start
     while True:
-        nxt = next(
-            (o for o in neighbors[id(current)] if id(o) not in used), None)
+        nxt = next((o for o in adjacent[current] if o not in used), None)
         if nxt is None:
             break
         chain.append(nxt)
-        used.add(id(nxt))
+        used.add(nxt)
         current = nxt
-    for c in component:
-        if id(c) not in used:
-            chain.append(c)
-    return chain
+    for i in range(len(component)):
+        if i not in used:
+            chain.append(i)
+    return [component[i] for i in chain]
 
 
 # ---------------------------------------------------------------------------
@@ -1,12 +1,21 @@
 """Apply molding packages to a room.
 
-apply_scene_packages(scene) is the single entry point: it clears every
-package sweep in the scene and rebuilds from the scene's three package
-props. The scene-prop update callbacks and the refresh operator both
-route through it, so the dropdowns are the whole UI.
+apply_scene_packages(scene) is the single entry point: it rebuilds the
+scene's package sweeps from its three package props. The scene-prop
+update callbacks and the refresh operator both route through it, so the
+dropdowns are the whole UI.
+
+Regeneration is incremental. Every sweep is stamped with a run KEY
+(molding type, chain members, stack entry) and a HASH of everything it
+was built from - the chain's facts, member transforms and sizes, style
+finishes, the resolved stack entry and the room options. A refresh
+keeps sweeps whose key and hash still match, respawns the ones whose
+hash changed and deletes runs that no longer exist, so moving one upper
+cabinet leaves the base molding on the other walls untouched.
 """
 
 import bpy
+import hashlib
 import mathutils
 
 from . import adapters, engine, packages
@@ -15,6 +24,8 @@ from .. import hb_types, hb_utils, units
 MOLDING_TAG = 'IS_HB_MOLDING_SWEEP'
 MOLDING_TYPE = 'HB_MOLDING_TYPE'
 MOLDING_MEMBERS = 'HB_MOLDING_MEMBERS'
+MOLDING_KEY = 'HB_MOLDING_KEY'
+MOLDING_HASH = 'HB_MOLDING_HASH'
 
 # (prop name, molding type, grouping alignment)
 _TYPES = (
@@ -24,24 +35,121 @@ _TYPES = (
 )
 
 
+def _remove_sweep(obj):
+    """Delete one package sweep. Shared profiles stay until
+    packages.release_unused_profiles() finds them unreferenced; a
+    per-sweep profile from an older file goes with its sweep."""
+    doomed = [obj]
+    bevel = obj.data.bevel_object if obj.type == 'CURVE' else None
+    if (bevel is not None and bevel.get('IS_HB_MOLDING_PROFILE')
+            and not bevel.get(packages.PROFILE_KEY)):
+        doomed.append(bevel)
+    for o in doomed:
+        data = o.data
+        bpy.data.objects.remove(o, do_unlink=True)
+        if data is not None and data.users == 0:
+            bpy.data.curves.remove(data)
+
+
 def clear_scene_molding(scene, molding_type=None):
     """Remove package sweeps (and their hidden profiles) from the
     scene, optionally scoped to one molding type."""
-    doomed = []
     for obj in list(scene.objects):
         if not obj.get(MOLDING_TAG):
             continue
         if molding_type and obj.get(MOLDING_TYPE) != molding_type:
             continue
-        bevel = obj.data.bevel_object if obj.type == 'CURVE' else None
-        doomed.append(obj)
-        if bevel is not None and bevel.get('IS_HB_MOLDING_PROFILE'):
-            doomed.append(bevel)
-    for obj in doomed:
-        data = obj.data
-        bpy.data.objects.remove(obj, do_unlink=True)
-        if data is not None and data.users == 0:
-            bpy.data.curves.remove(data)
+        _remove_sweep(obj)
+    packages.release_unused_profiles()
+
+
+class _SweepIndex:
+    """Existing package sweeps in a scene keyed by run key, and the
+    bookkeeping for one incremental refresh: which runs were kept,
+    which respawned."""
+
+    def __init__(self, scene):
+        self.existing = {}
+        self.seen = set()
+        for obj in scene.objects:
+            if obj.get(MOLDING_TAG):
+                key = obj.get(MOLDING_KEY)
+                if key is None or key in self.existing:
+                    # Legacy (pre-key) sweep or duplicate - always stale.
+                    key = f"__stale__{obj.name}"
+                self.existing[key] = obj
+
+    def keep(self, key, run_hash):
+        """True (and the run is marked seen) when a sweep already
+        exists for this key with a matching hash. Otherwise the stale
+        sweep, if any, is deleted so the caller can respawn it."""
+        self.seen.add(key)
+        obj = self.existing.get(key)
+        if obj is None:
+            return False
+        if obj.get(MOLDING_HASH) == run_hash:
+            return True
+        del self.existing[key]
+        _remove_sweep(obj)
+        return False
+
+    def mark(self, key):
+        self.seen.add(key)
+
+    def remove_unseen(self):
+        removed = 0
+        for key, obj in list(self.existing.items()):
+            if key in self.seen:
+                continue
+            _remove_sweep(obj)
+            del self.existing[key]
+            removed += 1
+        return removed
+
+
+def _canonical(value):
+    """Hashable, rounding-stable form of a facts / options value."""
+    if isinstance(value, float):
+        return round(value, 5)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(v) for v in value)
+    if isinstance(value, (mathutils.Vector, mathutils.Matrix)):
+        return _canonical([tuple(row) if hasattr(row, '__len__') else row
+                           for row in value])
+    if hasattr(value, 'name'):
+        return value.name
+    return value
+
+
+def _chain_hash(molding_type, chain, facts, opts):
+    """Hash of everything a run's geometry is derived from: the chain's
+    facts (adapters.build_facts), each member's transform, size and
+    style finish, and the room options."""
+    h = hashlib.sha1()
+    h.update(molding_type.encode())
+    h.update(repr(_canonical(opts)).encode())
+    for m in chain:
+        h.update(m.name.encode())
+        h.update(repr(_canonical(facts.get(id(m)))).encode())
+        h.update(repr(_canonical(m.matrix_world)).encode())
+        h.update(repr(_canonical(engine.cage_dims(m))).encode())
+        h.update(repr(_canonical(adapters.finish_material(m))).encode())
+        wall = hb_utils.get_wall_bp(m) if molding_type == 'CROWN' else None
+        if wall is not None:
+            # Crown-to-ceiling sizing reads the wall height.
+            h.update(repr(_canonical(
+                hb_types.GeoNodeObject(wall).get_input('Height'))).encode())
+    return h.hexdigest()
+
+
+def _run_hash(chain_hash, entry, extra=None):
+    h = hashlib.sha1(chain_hash.encode())
+    h.update(repr(_canonical(entry)).encode())
+    if extra is not None:
+        h.update(repr(_canonical(extra)).encode())
+    return h.hexdigest()
 
 
 def _resolve_stack(stack, opts):
@@ -268,13 +376,14 @@ def _material_slot(curve, material):
 
 
 def _spawn_sweep(scene, molding_type, chain, segments, profile_ref,
-                 fallback_key, dy, facts, opts, height=None):
+                 fallback_key, dy, facts, opts, height=None,
+                 run_key=None, run_hash=None):
     """Create one sweep object: hidden profile + curve through the
-    world-space segments, localized to (and parented on) chain[0]."""
+    world-space segments, localized to (and parented on) chain[0].
+    run_key / run_hash stamp the sweep for incremental refresh."""
     first = chain[0]
-    profile = packages.make_profile_object(
-        profile_ref, fallback_key,
-        f"Molding_Profile_{fallback_key}", scene.collection, height=height)
+    profile = packages.acquire_profile(
+        profile_ref, fallback_key, scene.collection, height=height)
     if profile is None:
         return None
     curve = bpy.data.curves.new("MoldingSweep", type='CURVE')
@@ -289,7 +398,6 @@ def _spawn_sweep(scene, molding_type, chain, segments, profile_ref,
     sweep[MOLDING_MEMBERS] = ",".join(c.name for c in chain)
     sweep.parent = first
     sweep.location.z = _sweep_z(molding_type, first, dy, facts, opts)
-    profile.parent = sweep
 
     # Each stretch of the sweep takes the style finish of the cabinet
     # it fronts: mixed-style chains split into per-style splines at the
@@ -330,12 +438,15 @@ def _spawn_sweep(scene, molding_type, chain, segments, profile_ref,
             wrote += 1
     if wrote == 0:
         bpy.data.objects.remove(sweep, do_unlink=True)
-        bpy.data.objects.remove(profile, do_unlink=True)
+        bpy.data.curves.remove(curve)
         return None
+    if run_key is not None:
+        sweep[MOLDING_KEY] = run_key
+        sweep[MOLDING_HASH] = run_hash
     return sweep
 
 
-def _apply_type(scene, molding_type, align, stack, opts):
+def _apply_type(scene, molding_type, align, stack, opts, index):
     targets = adapters.collect_targets(scene, molding_type)
     if not targets:
         return 0
@@ -345,12 +456,17 @@ def _apply_type(scene, molding_type, align, stack, opts):
                     if b not in members]
     facts = adapters.build_facts(scene, members)
     resolved_stack = _resolve_stack(stack, opts)
+    run_opts = {k: v for k, v in opts.items() if k != 'crown_stack'}
+    if molding_type == 'CAP':
+        run_opts['crown_stack'] = opts.get('crown_stack')
 
     made = 0
     for component in engine.connected_components(members, align=align):
         if not any(m in targets for m in component):
             continue
         chain = engine.order_chain(component, align=align)
+        chain_hash = _chain_hash(molding_type, chain, facts, run_opts)
+        chain_key = f"{molding_type}|" + ",".join(m.name for m in chain)
         run_stack = resolved_stack
         if molding_type == 'CROWN' and opts['to_ceiling']:
             # Ceiling-relative sizing is per run: the datum and the
@@ -362,7 +478,23 @@ def _apply_type(scene, molding_type, align, stack, opts):
             _pts, norm_chain = result
             run_stack = _ceiling_stack(norm_chain[0], facts,
                                        resolved_stack, opts)
-        for profile_ref, fallback_key, dx, dy, height in run_stack:
+        for stack_idx, entry in enumerate(run_stack):
+            profile_ref, fallback_key, dx, dy, height = entry
+            run_key = f"{chain_key}|{stack_idx}"
+            run_hash = _run_hash(chain_hash, entry)
+            if molding_type == 'LIGHT_RAIL':
+                # Raised-bay rails hang off the same run; keep them
+                # together with it so a changed chain respawns both.
+                if index.keep(run_key, run_hash):
+                    made += 1
+                    for key in index.existing:
+                        if key.startswith(run_key + "|"):
+                            index.mark(key)
+                            made += 1
+                    continue
+            elif index.keep(run_key, run_hash):
+                made += 1
+                continue
             if molding_type == 'BASE':
                 segments = engine.kick_sweep_segments(
                     chain, facts, dx, opts['include_recessed'])
@@ -384,10 +516,16 @@ def _apply_type(scene, molding_type, align, stack, opts):
                 continue
             if _spawn_sweep(scene, molding_type, sweep_chain, segments,
                             profile_ref, fallback_key, dy, facts,
-                            opts, height=height) is not None:
+                            opts, height=height,
+                            run_key=run_key, run_hash=run_hash) is not None:
                 made += 1
             if molding_type != 'LIGHT_RAIL':
                 continue
+            # The run itself was respawned: drop its old raised-bay
+            # rails too, they are rebuilt below.
+            for key in [k for k in index.existing
+                        if k.startswith(run_key + "|")]:
+                index.keep(key, None)
             # Raised bays carry their own rail at their own bottom
             # line, one sweep per member and level so each hangs at
             # its height (the bottom-line run skips those spans).
@@ -396,13 +534,16 @@ def _apply_type(scene, molding_type, align, stack, opts):
                 if not fmem.get('rail_bays'):
                     continue
                 open_l, open_r = _member_open_sides(member, sweep_chain)
-                for pts, dz in engine.raised_rail_runs(
+                for run_idx, (pts, dz) in enumerate(engine.raised_rail_runs(
                         member, fmem, dx, dx,
-                        open_left=open_l, open_right=open_r):
+                        open_left=open_l, open_right=open_r)):
+                    sub_key = f"{run_key}|{member.name}|{run_idx}"
+                    index.mark(sub_key)
                     if _spawn_sweep(scene, molding_type, [member],
                                     [(pts, False)], profile_ref,
                                     fallback_key, dy + dz, facts, opts,
-                                    height=height) is not None:
+                                    height=height, run_key=sub_key,
+                                    run_hash=run_hash) is not None:
                         made += 1
     return made
 
@@ -428,14 +569,16 @@ def _base_stack(hb, stack):
 
 
 def apply_scene_packages(scene):
-    """Rebuild every molding-package sweep in the scene from its three
-    package props. Safe to call from prop update callbacks."""
+    """Bring every molding-package sweep in the scene up to date with
+    its three package props, respawning only runs whose inputs changed
+    (see _SweepIndex). Safe to call from prop update callbacks.
+    Returns the number of sweeps in the scene afterwards."""
     hb = getattr(scene, 'home_builder', None)
     if hb is None:
         return 0
     if scene.get('IS_LAYOUT_VIEW') or scene.get('IS_DETAIL_VIEW'):
         return 0
-    clear_scene_molding(scene)
+    index = _SweepIndex(scene)
 
     def _override(prop_name):
         value = getattr(hb, prop_name, 'DEFAULT')
@@ -475,13 +618,18 @@ def apply_scene_packages(scene):
             stack = _base_stack(hb, stack or [])
         if not stack:
             continue
-        made += _apply_type(scene, molding_type, align, stack, opts)
+        made += _apply_type(scene, molding_type, align, stack, opts, index)
 
     # The furniture cap is an independent toggle: it caps the top line
     # over whichever crown package (or none) sits at the reveal.
     if getattr(hb, 'molding_crown_furniture_cap', False):
         made += _apply_type(scene, 'CAP', 'top',
-                            packages.FURNITURE_CAP_STACK, opts)
+                            packages.FURNITURE_CAP_STACK, opts, index)
+
+    # Runs that no longer exist (package set to None, cabinet deleted,
+    # chain split or merged).
+    index.remove_unseen()
+    packages.release_unused_profiles()
     return made
 
 
@@ -503,7 +651,7 @@ class home_builder_OT_refresh_room_molding(bpy.types.Operator):
 
     def execute(self, context):
         made = apply_scene_packages(context.scene)
-        self.report({'INFO'}, f"Rebuilt {made} molding run(s)")
+        self.report({'INFO'}, f"Refreshed {made} molding run(s)")
         return {'FINISHED'}
 
 
@@ -380,3 +380,78 @@ def make_profile_object(profile_ref, fallback_key, name, collection,
     if height is not None and height > 1e-5:
         _scale_profile_height(obj, height)
     return obj
+
+
+# ---------------------------------------------------------------------------
+# Shared profile registry
+# ---------------------------------------------------------------------------
+# Every run of the same crown stack sweeps the same cross-section, so
+# sweeps share one hidden profile curve per unique (profile ref,
+# fallback, height) instead of each carrying its own copy. The bevel
+# pointer does not hold a Blender user, so release_unused_profiles()
+# counts references itself by scanning the curves' bevel objects.
+
+PROFILE_KEY = 'HB_PROFILE_KEY'
+
+# key string -> object name; validated on every lookup, rebuilt from the
+# tagged objects after a file load or undo.
+_shared_profiles = {}
+
+
+def _profile_key(profile_ref, fallback_key, height):
+    h = round(height, 5) if height is not None and height > 1e-5 else None
+    return f"{profile_ref}|{fallback_key}|{h}"
+
+
+def _find_shared_profile(key):
+    name = _shared_profiles.get(key)
+    obj = bpy.data.objects.get(name) if name else None
+    if obj is not None and obj.get(PROFILE_KEY) == key:
+        return obj
+    for obj in bpy.data.objects:
+        if obj.get(PROFILE_KEY) == key:
+            _shared_profiles[key] = obj.name
+            return obj
+    _shared_profiles.pop(key, None)
+    return None
+
+
+def acquire_profile(profile_ref, fallback_key, collection, height=None):
+    """Shared bevel profile for a sweep: reuses the hidden profile curve
+    already built for this (profile ref, fallback, height), linking it
+    into `collection` when it isn't there yet; builds it on first use.
+    Returns None when the profile doesn't resolve."""
+    key = _profile_key(profile_ref, fallback_key, height)
+    obj = _find_shared_profile(key)
+    if obj is None:
+        obj = make_profile_object(
+            profile_ref, fallback_key, f"Molding_Profile_{fallback_key}",
+            collection, height=height)
+        if obj is None:
+            return None
+        obj[PROFILE_KEY] = key
+        _shared_profiles[key] = obj.name
+    elif obj.name not in collection.objects:
+        collection.objects.link(obj)
+    return obj
+
+
+def release_unused_profiles():
+    """Delete shared profiles no sweep references any more. Returns the
+    number removed."""
+    refs = {}
+    for curve in bpy.data.curves:
+        bevel = curve.bevel_object
+        if bevel is not None:
+            refs[bevel.name] = refs.get(bevel.name, 0) + 1
+    removed = 0
+    for obj in [o for o in bpy.data.objects if o.get(PROFILE_KEY)]:
+        if refs.get(obj.name, 0) > 0:
+            continue
+        _shared_profiles.pop(obj.get(PROFILE_KEY), None)
+        data = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+        if data is not None and data.users == 0:
+            bpy.data.curves.remove(data)
+        removed += 1
+    return removed
@@ -9,6 +9,7 @@ from .. import hb_placement
 from .. import hb_detail_library
 from .. import units
 from .. import hb_utils
+from .. import hb_draw_stats
 from bpy_extras import view3d_utils
 from bpy_extras.view3d_utils import region_2d_to_origin_3d, region_2d_to_vector_3d
 from mathutils import Matrix
@@ -884,7 +885,7 @@ class home_builder_details_OT_draw_line(bpy.types.Operator, hb_placement.Placeme
         
         # Add draw handler for snap indicator
         args = (self, context)
-        self._handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._handle = hb_draw_stats.draw_handler_add(
             draw_snap_indicator, args, 'WINDOW', 'POST_PIXEL')
         
         # Create polyline
@@ -1611,7 +1612,7 @@ class home_builder_details_OT_draw_rectangle(bpy.types.Operator, hb_placement.Pl
         
         # Add draw handler for snap indicator
         args = (self, context)
-        self._handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._handle = hb_draw_stats.draw_handler_add(
             draw_snap_indicator, args, 'WINDOW', 'POST_PIXEL')
         
         # Create rectangle
@@ -1901,7 +1902,7 @@ class home_builder_details_OT_draw_circle(bpy.types.Operator, hb_placement.Place
         
         # Add draw handler for snap indicator
         args = (self, context)
-        self._handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._handle = hb_draw_stats.draw_handler_add(
             draw_snap_indicator, args, 'WINDOW', 'POST_PIXEL')
         
         # Create circle
@@ -2126,7 +2127,7 @@ class home_builder_details_OT_add_text(bpy.types.Operator, hb_placement.Placemen
         
         # Add draw handler for snap indicator
         args = (self, context)
-        self._handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._handle = hb_draw_stats.draw_handler_add(
             draw_snap_indicator, args, 'WINDOW', 'POST_PIXEL')
         
         # Create text object
@@ -2966,6 +2967,12 @@ class home_builder_details_OT_save_detail_to_library(bpy.types.Operator):
         default=""
     )
     
+    tags: bpy.props.StringProperty(
+        name="Tags",
+        description="Optional comma separated tags for finding the detail later",
+        default=""
+    )
+    
     @classmethod
     def poll(cls, context):
         # Allow saving from both regular details and crown details
@@ -2980,7 +2987,7 @@ class home_builder_details_OT_save_detail_to_library(bpy.types.Operator):
     
     def execute(self, context):
         success, message, filepath = hb_detail_library.save_detail_to_library(
-            context, self.name, self.description
+            context, self.name, self.description, self.tags
         )
         
         if success:
@@ -2995,6 +3002,7 @@ class home_builder_details_OT_save_detail_to_library(bpy.types.Operator):
         layout = self.layout
         layout.prop(self, "name")
         layout.prop(self, "description")
+        layout.prop(self, "tags")
 
 
 class home_builder_details_OT_load_detail_from_library(bpy.types.Operator):
@@ -3248,3 +3256,4 @@ def register():
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
+    hb_detail_library.unregister()
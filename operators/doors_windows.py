@@ -3,7 +3,8 @@ import gpu
 import blf
 from gpu_extras.batch import batch_for_shader
 from bpy_extras import view3d_utils
-from .. import hb_types, hb_snap, hb_placement, units
+from .. import hb_types, hb_snap, hb_placement, hb_wall_cutters, units
+from .. import hb_draw_stats
 import math
 from mathutils import Vector
 from ..hb_details import GeoNodeText
@@ -248,7 +249,7 @@ class WallObjectPlacementMixin(hb_placement.PlacementMixin):
         self._dim_draw_handle = None
         self._dims_visible = False
         self._hide_total_width_dim = False
-        self._dim_draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._dim_draw_handle = hb_draw_stats.draw_handler_add(
             _draw_placement_dimensions, (self,), 'WINDOW', 'POST_PIXEL')
 
     def update_placement_dimensions(self, context, obj_width, obj_height, wall_thickness, z_offset=0):
@@ -443,24 +444,9 @@ class WallObjectPlacementMixin(hb_placement.PlacementMixin):
             return f"Offset (←): {units.unit_to_string(unit_settings, self.placement_x)}"
     
     def cut_wall(self, wall_obj, cutting_obj):
-        """Add a boolean modifier to the wall to cut a hole for the door/window."""
-        # Create a unique modifier name based on the cutting object
-        mod_name = f"Boolean_{cutting_obj.name}"
-        
-        # Check if modifier already exists
-        if mod_name in wall_obj.modifiers:
-            return wall_obj.modifiers[mod_name]
-        
-        # Add boolean modifier
-        mod = wall_obj.modifiers.new(name=mod_name, type='BOOLEAN')
-        mod.operation = 'DIFFERENCE'
-        mod.object = cutting_obj
-        mod.solver = 'EXACT'
-        
-        # Hide the cutting object from render
-        cutting_obj.hide_render = True
-        
-        return mod
+        """Cut a hole for the door/window through the wall's shared
+        openings boolean (one collection boolean per wall)."""
+        return hb_wall_cutters.add_cutter(wall_obj, cutting_obj)
 
     def find_nearest_wall_to_cursor(self, threshold=0.3):
         """Find the closest wall to the current hit location in 2D plan-view
@@ -1645,13 +1631,9 @@ class home_builder_doors_windows_OT_delete_door_window(bpy.types.Operator):
         obj = _resolve_door_window_bp(context.object)
         wall = obj.parent
         
-        # Remove the boolean modifier from the wall if present
+        # Stop cutting the wall for this door/window
         if wall and 'IS_WALL_BP' in wall:
-            # Find and remove the boolean modifier for this door/window
-            for mod in wall.modifiers:
-                if mod.type == 'BOOLEAN' and mod.object == obj:
-                    wall.modifiers.remove(mod)
-                    break
+            hb_wall_cutters.remove_cutter(wall, obj)
         
         # Delete all children first
         children_to_delete = list(obj.children)
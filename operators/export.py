@@ -1,4 +1,5 @@
 import bpy
+from .. import hb_wall_cutters
 
 # Custom properties that mark objects we should DELETE during export prep
 DELETE_FLAGS = {
@@ -95,6 +96,14 @@ class HOME_BUILDER_OT_prepare_for_export(bpy.types.Operator):
         for scene in scenes_to_process:
             context.window.scene = scene
 
+            # Walls whose pre-cut cache still matches their openings skip
+            # the boolean evaluation in PASS 4. Checked before anything is
+            # unparented or un-driven so the signature sees the live state.
+            cached_walls = {}
+            for obj in scene.objects:
+                if obj.get('IS_WALL_BP') and hb_wall_cutters.is_cut_cache_valid(obj):
+                    cached_walls[obj.name] = hb_wall_cutters.get_cut_cache_object(obj)
+
             # --- PASS 1: Remove all drivers ---
             # Done before conversion so driven values don't interfere with modifier eval.
             for obj in scene.objects:
@@ -150,6 +159,12 @@ class HOME_BUILDER_OT_prepare_for_export(bpy.types.Operator):
             for obj in list(scene.objects):
                 if should_delete_object(obj):
                     continue
+                proxy = cached_walls.get(obj.name)
+                if proxy is not None:
+                    obj.data = proxy.data.copy()
+                    obj.modifiers.clear()
+                    converted_count += 1
+                    continue
                 if obj.type in {'MESH', 'CURVE', 'SURFACE', 'FONT'}:
                     bpy.ops.object.select_all(action='DESELECT')
                     obj.select_set(True)
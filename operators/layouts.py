@@ -14,6 +14,13 @@ from .. import hb_placement
 from .. import units
 from .. import hb_utils
 from .. import hb_snap
+from .. import hb_sheet_export
+from .. import hb_vector_export
+from .. import hb_pdf
+from .. import hb_dimension_sets
+from .. import hb_props
+from .. import hb_draw_stats
+from .. import hb_wall_cutters
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -88,13 +95,7 @@ DRAWING_SCALES = {
 }
 
 # Paper sizes in inches (width, height) - portrait orientation
-PAPER_SIZES_INCHES = {
-    'LETTER': (8.5, 11.0),
-    'LEGAL': (8.5, 14.0),
-    'TABLOID': (11.0, 17.0),
-    'A4': (8.27, 11.69),
-    'A3': (11.69, 16.54),
-}
+PAPER_SIZES_INCHES = hb_sheet_export.PAPER_SIZES_INCHES
 
 
 def get_scale_factor(scale_str):
@@ -218,54 +219,81 @@ def paper_to_world(paper_inches, scale_str):
         return paper_inches * scale_factor * 0.3048
 
 
+# World-space annotation sizes kept in step with their paper-space sizes
+# by auto-scale: (world property, paper property) on scene.home_builder.
+AUTO_SCALED_SIZES = (
+    ('annotation_text_size', 'annotation_text_paper_height'),
+    ('annotation_line_thickness', 'annotation_line_paper_thickness'),
+    ('annotation_dimension_text_size', 'annotation_dim_text_paper_height'),
+    ('annotation_dimension_tick_length', 'annotation_dim_tick_paper_length'),
+    ('annotation_dimension_line_thickness', 'annotation_dim_line_paper_thickness'),
+    ('annotation_dimension_tick_thickness', 'annotation_dim_tick_paper_thickness'),
+)
+
+
 def recalculate_annotation_sizes_for_scene(scene):
     """Recalculate annotation world sizes from paper-space sizes and current scale.
     
     Called when layout scale changes or when auto-scale is enabled.
     Only acts on layout view scenes with auto-scale enabled.
     """
-    if not scene.get('IS_LAYOUT_VIEW'):
-        return
-    if not hasattr(scene, 'home_builder'):
-        return
-    
-    hb_scene = scene.home_builder
+    rescale_layout_annotations([scene])
 
-    # Line-art layout views: stroke widths are world-space, so they track
-    # the drawing scale the same way the annotation sizes below do. Runs
-    # regardless of annotation_auto_scale -- line weights aren't user-sized
-    # annotations, and this pass also attaches the line art jitter camera
-    # once the view camera exists.
-    hb_layouts.update_line_art_sizes(scene)
 
-    if not hb_scene.annotation_auto_scale:
-        return
+def rescale_layout_annotations(scenes=None):
+    """Batched recalculate_annotation_sizes_for_scene over layout scenes
+    (default: every layout view).
 
-    scale_str = scene.hb_layout_scale
-    
-    # Recalculate text size
-    hb_scene.annotation_text_size = paper_to_world(
-        hb_scene.annotation_text_paper_height, scale_str)
-    
-    # Recalculate line thickness
-    hb_scene.annotation_line_thickness = paper_to_world(
-        hb_scene.annotation_line_paper_thickness, scale_str)
-    
-    # Recalculate dimension text size
-    hb_scene.annotation_dimension_text_size = paper_to_world(
-        hb_scene.annotation_dim_text_paper_height, scale_str)
-    
-    # Recalculate dimension tick length
-    hb_scene.annotation_dimension_tick_length = paper_to_world(
-        hb_scene.annotation_dim_tick_paper_length, scale_str)
-    
-    # Recalculate dimension line thickness
-    hb_scene.annotation_dimension_line_thickness = paper_to_world(
-        hb_scene.annotation_dim_line_paper_thickness, scale_str)
+    World sizes are computed once per scale bucket -- the drawing scale
+    plus the paper-space sizes -- and shared by every sheet in it. They
+    are stored on the scene without firing the per-property update
+    callbacks (each of which walks the whole scene), then written into
+    the scene's annotations in one pass that skips values already in
+    place. Returns (scenes changed, objects changed).
+    """
+    if scenes is None:
+        scenes = [s for s in bpy.data.scenes if s.get('IS_LAYOUT_VIEW')]
+    buckets = {}
+    scenes_changed = objects_changed = 0
+    for scene in scenes:
+        if not scene.get('IS_LAYOUT_VIEW'):
+            continue
+        if not hasattr(scene, 'home_builder'):
+            continue
+        hb_scene = scene.home_builder
 
-    # Recalculate dimension tick thickness
-    hb_scene.annotation_dimension_tick_thickness = paper_to_world(
-        hb_scene.annotation_dim_tick_paper_thickness, scale_str)
+        # Line-art layout views: stroke widths are world-space, so they track
+        # the drawing scale the same way the annotation sizes below do. Runs
+        # regardless of annotation_auto_scale -- line weights aren't user-sized
+        # annotations, and this pass also attaches the line art jitter camera
+        # once the view camera exists.
+        hb_layouts.update_line_art_sizes(scene)
+
+        if not hb_scene.annotation_auto_scale:
+            continue
+
+        scale_str = scene.hb_layout_scale
+        key = (scale_str,) + tuple(getattr(hb_scene, paper) for _world, paper in AUTO_SCALED_SIZES)
+        sizes = buckets.get(key)
+        if sizes is None:
+            sizes = buckets[key] = [paper_to_world(paper_inches, scale_str)
+                                    for paper_inches in key[1:]]
+
+        changed = []
+        rna_props = hb_scene.bl_rna.properties
+        for (world, _paper), value in zip(AUTO_SCALED_SIZES, sizes):
+            # Clamp as the property setter would
+            prop = rna_props[world]
+            value = min(max(value, prop.hard_min), prop.hard_max)
+            if abs(getattr(hb_scene, world) - value) > 1e-9:
+                # Item assignment skips the property's update callback;
+                # apply_annotation_sizes below does all of their work.
+                hb_scene[world] = value
+                changed.append(world)
+        if changed:
+            scenes_changed += 1
+            objects_changed += hb_props.apply_annotation_sizes(scene, changed)
+    return scenes_changed, objects_changed
 
 
 def update_title_block_border(scene):
@@ -490,9 +518,26 @@ class home_builder_layouts_OT_update_elevation_view(bpy.types.Operator):
     
     def execute(self, context):
         view = hb_layouts.ElevationView(context.scene)
-        view.update()
+        added, removed, resplit = view.update()
         
-        self.report({'INFO'}, "Updated elevation view")
+        if added or removed or resplit:
+            self.report({'INFO'}, f"Updated elevation view: {added} added, "
+                                  f"{removed} removed, {resplit} changed")
+        else:
+            self.report({'INFO'}, "Updated elevation view")
+        return {'FINISHED'}
+
+
+class home_builder_layouts_OT_rescale_all_annotations(bpy.types.Operator):
+    bl_idname = "home_builder_layouts.rescale_all_annotations"
+    bl_label = "Rescale All Layout Annotations"
+    bl_description = ("Recalculate auto-scaled annotation and line art sizes on every "
+                      "layout view from its drawing scale and paper-space sizes")
+    bl_options = {'UNDO'}
+    
+    def execute(self, context):
+        scenes, objects = rescale_layout_annotations()
+        self.report({'INFO'}, f"Rescaled annotations: {objects} object(s) in {scenes} layout view(s)")
         return {'FINISHED'}
 
 
@@ -605,6 +650,9 @@ class home_builder_layouts_OT_go_to_layout_view(bpy.types.Operator):
             
             # Set appropriate view for the scene type
             if target_scene.get('IS_LAYOUT_VIEW'):
+                # Plan and 3D views show the cut cache proxies as they
+                # were; re-cut any whose openings changed meanwhile.
+                hb_wall_cutters.refresh_stale_cut_caches()
                 # Layout views use camera view with solid shading
                 hb_utils.set_layout_shading()
                 hb_utils.set_camera_view()
@@ -779,62 +827,7 @@ class home_builder_layouts_OT_render_layout(bpy.types.Operator):
     
     def _setup_compositor_white_background(self, context, scene):
         """Set up compositor nodes to add white background to transparent render."""
-        # Enable compositing
-        scene.render.use_compositing = True
-        
-        # Set color management to Standard for accurate colors
-        scene.view_settings.view_transform = 'Standard'
-        
-        # In Blender 5.0, compositor uses node group architecture
-        tree = scene.compositing_node_group
-        
-        if tree is None:
-            # Create a new compositor node tree
-            tree = bpy.data.node_groups.new(
-                name=f"{scene.name}_Compositor",
-                type='CompositorNodeTree'
-            )
-            scene.compositing_node_group = tree
-        
-        nodes = tree.nodes
-        links = tree.links
-        
-        # Clear existing nodes
-        for node in list(nodes):
-            nodes.remove(node)
-        
-        # Clear existing interface sockets
-        tree.interface.clear()
-        
-        # Create output socket on the node group interface
-        tree.interface.new_socket(name="Image", in_out='OUTPUT', socket_type='NodeSocketColor')
-        
-        # Create nodes
-        render_layers = nodes.new('CompositorNodeRLayers')
-        render_layers.location = (0, 300)
-        
-        # White color input
-        white_color = nodes.new('CompositorNodeRGB')
-        white_color.location = (0, 100)
-        white_color.outputs[0].default_value = (1, 1, 1, 1)  # White
-        
-        alpha_over = nodes.new('CompositorNodeAlphaOver')
-        alpha_over.location = (300, 300)
-        
-        # Group Output node (replaces CompositorNodeComposite in Blender 5.0)
-        group_output = nodes.new('NodeGroupOutput')
-        group_output.location = (600, 300)
-        
-        # Viewer node for preview
-        viewer = nodes.new('CompositorNodeViewer')
-        viewer.location = (600, 100)
-        
-        # Link nodes: White background under render
-        # Alpha Over: inputs[0]=Background, inputs[1]=Foreground
-        links.new(white_color.outputs[0], alpha_over.inputs[0])  # Background (white)
-        links.new(render_layers.outputs['Image'], alpha_over.inputs[1])  # Foreground (render)
-        links.new(alpha_over.outputs[0], group_output.inputs[0])  # To output
-        links.new(alpha_over.outputs[0], viewer.inputs[0])  # To viewer
+        hb_sheet_export.setup_compositor_white_background(scene)
 
 
 # =============================================================================
@@ -866,6 +859,24 @@ class home_builder_layouts_OT_export_all_to_pdf(bpy.types.Operator):
         default='300'
     )  # type: ignore
     
+    output: bpy.props.EnumProperty(
+        name="Output",
+        description="How sheets are written to the PDF",
+        items=[
+            ('RASTER', 'Rendered', 'Render every sheet and embed the image'),
+            ('VECTOR', 'Vector', 'Write Line Art strokes and annotations as vector paths. '
+                                 'Freestyle sheets are still rendered'),
+        ],
+        default='RASTER'
+    )  # type: ignore
+    
+    use_sheet_cache: bpy.props.BoolProperty(
+        name="Reuse Unchanged Sheets",
+        description="Keep rendered sheets in a cache folder next to the .blend file "
+                    "and only re-render sheets whose content changed",
+        default=True
+    )  # type: ignore
+    
     filter_glob: bpy.props.StringProperty(
         default="*.pdf",
         options={'HIDDEN'}
@@ -883,209 +894,240 @@ class home_builder_layouts_OT_export_all_to_pdf(bpy.types.Operator):
         return {'RUNNING_MODAL'}
     
     def execute(self, context):
-        try:
-            from PIL import Image
-        except ImportError:
-            self.report({'ERROR'}, "Pillow is required for PDF export. Please reinstall the Home Builder extension.")
-            return {'CANCELLED'}
-        
-        import tempfile
-        
         # Get all layout view scenes, sorted by sort_order
-        layout_scenes = [s for s in bpy.data.scenes if s.get('IS_LAYOUT_VIEW')]
-        layout_scenes.sort(key=lambda s: s.home_builder.sort_order)
+        layout_scenes = [s for s in hb_sheet_export.get_layout_scenes() if s.camera]
         
         if not layout_scenes:
             self.report({'WARNING'}, "No layout views found")
             return {'CANCELLED'}
         
+        hb_wall_cutters.refresh_stale_cut_caches()
+        
+        if self.output == 'VECTOR' and not all(
+                hb_vector_export.needs_raster(s) for s in layout_scenes):
+            return self._export_vector(context, layout_scenes)
+        
+        prefs = get_addon_prefs()
+        use_workers = prefs.use_pdf_background_workers if prefs else True
+        if use_workers and len(layout_scenes) > 1:
+            try:
+                import PIL
+            except ImportError:
+                self.report({'ERROR'}, "Pillow is required for PDF export. Please reinstall the Home Builder extension.")
+                return {'CANCELLED'}
+            return self._start_workers(context, layout_scenes, prefs)
+        return self._render_in_process(context, layout_scenes)
+    
+    def _render_in_process(self, context, layout_scenes):
+        output_path = bpy.path.abspath(self.filepath)
+        self._cache = hb_sheet_export.SheetCache() if self.use_sheet_cache else None
+        
         # Store original scene
         original_scene = context.window.scene
         
-        # Render each layout and collect images
-        temp_images = []
-        pil_images = []
-        
         try:
-            for scene in layout_scenes:
-                # Switch to this scene
-                context.window.scene = scene
-                
-                if not scene.camera:
-                    continue
-                
-                # Get paper size and calculate render resolution
-                paper_size = scene.hb_paper_size
-                landscape = scene.hb_paper_landscape
-                
-                paper_w, paper_h = PAPER_SIZES_INCHES.get(paper_size, (8.5, 11.0))
-                if landscape:
-                    paper_w, paper_h = paper_h, paper_w
-                
-                dpi = int(self.dpi)
-                width = int(paper_w * dpi)
-                height = int(paper_h * dpi)
-                
-                # Calculate Freestyle thickness scale (base DPI is 150)
-                thickness_scale = dpi / 150.0
-                
-                # Store original settings
-                orig_resolution_x = scene.render.resolution_x
-                orig_resolution_y = scene.render.resolution_y
-                orig_film_transparent = scene.render.film_transparent
-                orig_use_compositing = scene.render.use_compositing
-                
-                # Store and scale Freestyle line thicknesses
-                orig_lineset_thicknesses = {}
-                for view_layer in scene.view_layers:
-                    if view_layer.use_freestyle:
-                        for lineset in view_layer.freestyle_settings.linesets:
-                            orig_lineset_thicknesses[lineset.name] = lineset.linestyle.thickness
-                            lineset.linestyle.thickness = lineset.linestyle.thickness * thickness_scale
-                
-                # Set render resolution
-                scene.render.resolution_x = width
-                scene.render.resolution_y = height
-                scene.render.resolution_percentage = 100
-                
-                # Enable transparency for render
-                scene.render.film_transparent = True
-                
-                # Enable compositing
-                scene.render.use_compositing = True
-                
-                # Set up compositor for white background
-                self._setup_compositor_white_background(context, scene)
-                
-                # Render
-                bpy.ops.render.render()
-                
-                # Save to temp file
-                temp_path = os.path.join(tempfile.gettempdir(), f"{scene.name}_temp.png")
-                temp_images.append(temp_path)
-                
-                render_result = bpy.data.images.get('Render Result')
-                if render_result:
-                    render_result.save_render(temp_path, scene=scene)
-                    
-                    # Load with PIL and convert to RGB (PDF doesn't support RGBA)
-                    pil_img = Image.open(temp_path).convert('RGB')
-                    pil_images.append(pil_img)
-                
-                # Restore settings
-                scene.render.resolution_x = orig_resolution_x
-                scene.render.resolution_y = orig_resolution_y
-                scene.render.film_transparent = orig_film_transparent
-                scene.render.use_compositing = orig_use_compositing
-                
-                # Restore Freestyle line thicknesses
-                for view_layer in scene.view_layers:
-                    if view_layer.use_freestyle:
-                        for lineset in view_layer.freestyle_settings.linesets:
-                            if lineset.name in orig_lineset_thicknesses:
-                                lineset.linestyle.thickness = orig_lineset_thicknesses[lineset.name]
-            
-            # Save as PDF
-            if pil_images:
-                output_path = bpy.path.abspath(self.filepath)
-                
-                # First image saves, rest are appended
-                pil_images[0].save(
-                    output_path,
-                    "PDF",
-                    resolution=int(self.dpi),
-                    save_all=True,
-                    append_images=pil_images[1:] if len(pil_images) > 1 else []
-                )
-                
-                self.report({'INFO'}, f"Exported {len(pil_images)} layouts to: {output_path}")
-                
-                # Open the PDF automatically
-                import subprocess
-                import platform
-                try:
-                    if platform.system() == 'Windows':
-                        os.startfile(output_path)
-                    elif platform.system() == 'Darwin':  # macOS
-                        subprocess.run(['open', output_path])
-                    else:  # Linux
-                        subprocess.run(['xdg-open', output_path])
-                except Exception as e:
-                    self.report({'WARNING'}, f"Could not open PDF: {e}")
-            else:
-                self.report({'WARNING'}, "No layouts were rendered")
-                return {'CANCELLED'}
-                
+            # Each page is written and released as soon as it is rendered
+            with hb_pdf.PdfWriter(output_path) as pdf:
+                for scene in layout_scenes:
+                    # Switch to this scene
+                    context.window.scene = scene
+                    hb_sheet_export.render_sheet_to_pdf(scene, int(self.dpi), pdf, self._cache)
+        except ImportError:
+            self.report({'ERROR'}, "Pillow is required for PDF export. Please reinstall the Home Builder extension.")
+            return {'CANCELLED'}
         finally:
-            # Clean up temp files
-            for temp_path in temp_images:
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
-            
             # Restore original scene
             context.window.scene = original_scene
         
-        return {'FINISHED'}
-    
-    def _setup_compositor_white_background(self, context, scene):
-        """Set up compositor nodes to add white background to transparent render."""
-        # Enable compositing
-        scene.render.use_compositing = True
-        
-        # Set color management to Standard for accurate colors
-        scene.view_settings.view_transform = 'Standard'
-        
-        # In Blender 5.0, compositor uses node group architecture
-        tree = scene.compositing_node_group
-        
-        if tree is None:
-            # Create a new compositor node tree
-            tree = bpy.data.node_groups.new(
-                name=f"{scene.name}_Compositor",
-                type='CompositorNodeTree'
-            )
-            scene.compositing_node_group = tree
-        
-        nodes = tree.nodes
-        links = tree.links
-        
-        # Clear existing nodes
-        for node in list(nodes):
-            nodes.remove(node)
+        return self._report_pdf(output_path, pdf.page_count)
+    
+    def _start_workers(self, context, layout_scenes, prefs):
+        # Sheets already in the cache are copied, not sent to workers
+        self._cache = hb_sheet_export.SheetCache() if self.use_sheet_cache else None
+        self._keys = {}
+        self._cached = set()
+        if self._cache is not None:
+            for i, scene in enumerate(layout_scenes):
+                key = hb_sheet_export.sheet_content_hash(scene, int(self.dpi))
+                self._keys[i] = key
+                if self._cache.lookup(key) is not None:
+                    self._cached.add(i)
+            if len(self._cached) == len(layout_scenes):
+                return self._render_in_process(context, layout_scenes)
+        
+        self._pool = hb_sheet_export.SheetWorkerPool()
+        self._scene_names = [s.name for s in layout_scenes]
+        worker_count = prefs.pdf_export_workers if prefs else 0
+        try:
+            self._pool.start(self._scene_names, int(self.dpi), worker_count, skip=self._cached)
+        except (OSError, RuntimeError) as e:
+            self._pool.cleanup()
+            self.report({'WARNING'}, f"Could not start background workers ({e}), rendering here")
+            return self._render_in_process(context, layout_scenes)
         
-        # Clear existing interface sockets
-        tree.interface.clear()
+        # Pages are appended in sheet order as the workers finish them
+        self._output_path = bpy.path.abspath(self.filepath)
+        self._pdf = hb_pdf.PdfWriter(self._output_path)
+        self._next_page = 0
         
-        # Create output socket on the node group interface
-        tree.interface.new_socket(name="Image", in_out='OUTPUT', socket_type='NodeSocketColor')
+        wm = context.window_manager
+        wm.progress_begin(0, self._pool.total)
+        self._timer = wm.event_timer_add(0.25, window=context.window)
+        wm.modal_handler_add(self)
+        self._update_header(context, 0)
+        return {'RUNNING_MODAL'}
+    
+    def _update_header(self, context, done):
+        context.window_manager.progress_update(done)
+        if context.area:
+            context.area.header_text_set(
+                f"Rendering sheets: {done} / {self._pool.total} "
+                f"({len(self._pool.processes)} workers)   ESC: Cancel")
+    
+    def _finish_workers(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        if context.area:
+            context.area.header_text_set(None)
+    
+    def _append_ready_pages(self, finished):
+        """Move finished worker pages into the PDF in sheet order. Once
+        every worker has exited, missing pages are skipped."""
+        while self._next_page < self._pool.total:
+            index = self._next_page
+            scene = bpy.data.scenes.get(self._scene_names[index])
+            path = hb_sheet_export.page_path(self._pool.out_dir, index)
+            if index in self._cached:
+                self._cache.add_cached_page(self._pdf, self._keys[index], scene)
+            elif os.path.exists(path):
+                hb_sheet_export.add_png_page(self._pdf, scene, path,
+                                             self._cache, self._keys.get(index))
+                os.remove(path)
+            elif not finished:
+                return
+            self._next_page += 1
+    
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._finish_workers(context)
+            self._pool.cleanup()
+            self._pdf.abort()
+            self.report({'WARNING'}, "PDF export cancelled")
+            return {'CANCELLED'}
         
-        # Create nodes
-        render_layers = nodes.new('CompositorNodeRLayers')
-        render_layers.location = (0, 300)
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
         
-        # White color input
-        white_color = nodes.new('CompositorNodeRGB')
-        white_color.location = (0, 100)
-        white_color.outputs[0].default_value = (1, 1, 1, 1)  # White
+        done, finished = self._pool.poll()
+        self._update_header(context, self._next_page + done)
+        if finished and self._pool.failed():
+            self._finish_workers(context)
+            self._pool.cleanup()
+            self._pdf.abort()
+            self.report({'ERROR'}, f"A sheet worker failed:\n{self._pool.error_log()}")
+            return {'CANCELLED'}
         
-        alpha_over = nodes.new('CompositorNodeAlphaOver')
-        alpha_over.location = (300, 300)
+        self._append_ready_pages(finished)
+        if not finished:
+            return {'PASS_THROUGH'}
         
-        # Group Output node
-        group_output = nodes.new('NodeGroupOutput')
-        group_output.location = (600, 300)
+        self._finish_workers(context)
+        self._pool.cleanup()
+        self._pdf.close()
+        return self._report_pdf(self._output_path, self._pdf.page_count)
+    
+    def _report_pdf(self, output_path, page_count, raster_count=0):
+        if not page_count:
+            self.report({'WARNING'}, "No layouts were rendered")
+            return {'CANCELLED'}
+        message = f"Exported {page_count} layouts to: {output_path}"
+        if raster_count:
+            message += f" ({raster_count} Freestyle sheets rendered)"
+        cache = getattr(self, '_cache', None)
+        if cache is not None and cache.hits:
+            message += f", {cache.hits} unchanged sheets reused"
+        self.report({'INFO'}, message)
+        self._open_pdf(output_path)
+        return {'FINISHED'}
+    
+    def _export_vector(self, context, layout_scenes):
+        output_path = bpy.path.abspath(self.filepath)
+        self._cache = hb_sheet_export.SheetCache() if self.use_sheet_cache else None
+        original_scene = context.window.scene
+        raster_count = 0
         
-        # Viewer node for preview
-        viewer = nodes.new('CompositorNodeViewer')
-        viewer.location = (600, 100)
+        try:
+            with hb_pdf.PdfWriter(output_path) as pdf:
+                for scene in layout_scenes:
+                    if not hb_vector_export.needs_raster(scene):
+                        sheet = hb_vector_export.evaluate_sheet(context, scene)
+                        pdf.add_vector_page(sheet.width, sheet.height, sheet.to_pdf_content())
+                        continue
+                    
+                    # Freestyle lines only exist in a render
+                    context.window.scene = scene
+                    if hb_sheet_export.render_sheet_to_pdf(scene, int(self.dpi), pdf, self._cache):
+                        raster_count += 1
+        except ImportError:
+            self.report({'ERROR'}, "Pillow is required to render Freestyle sheets. Please reinstall the Home Builder extension.")
+            return {'CANCELLED'}
+        finally:
+            context.window.scene = original_scene
         
-        # Link nodes: White background under render
-        links.new(white_color.outputs[0], alpha_over.inputs[0])  # Background (white)
-        links.new(render_layers.outputs['Image'], alpha_over.inputs[1])  # Foreground (render)
-        links.new(alpha_over.outputs[0], group_output.inputs[0])  # To output
-        links.new(alpha_over.outputs[0], viewer.inputs[0])  # To viewer
+        return self._report_pdf(output_path, pdf.page_count, raster_count)
+    
+    def _open_pdf(self, output_path):
+        # Open the PDF automatically
+        import subprocess
+        import platform
+        try:
+            if platform.system() == 'Windows':
+                os.startfile(output_path)
+            elif platform.system() == 'Darwin':  # macOS
+                subprocess.run(['open', output_path])
+            else:  # Linux
+                subprocess.run(['xdg-open', output_path])
+        except Exception as e:
+            self.report({'WARNING'}, f"Could not open PDF: {e}")
+
+
+class home_builder_layouts_OT_export_layout_to_svg(bpy.types.Operator):
+    bl_idname = "home_builder_layouts.export_layout_to_svg"
+    bl_label = "Export Layout to SVG"
+    bl_description = "Write the current Line Art layout view to an SVG file as vector paths"
+    
+    filepath: bpy.props.StringProperty(
+        name="File Path",
+        description="Path to save the SVG file",
+        subtype='FILE_PATH',
+        default="//layout.svg"
+    )  # type: ignore
+    
+    filter_glob: bpy.props.StringProperty(
+        default="*.svg",
+        options={'HIDDEN'}
+    )  # type: ignore
+    
+    @classmethod
+    def poll(cls, context):
+        scene = context.scene
+        return (scene.get('IS_LAYOUT_VIEW') and scene.camera
+                and not hb_vector_export.needs_raster(scene))
+    
+    def invoke(self, context, event):
+        folder = os.path.dirname(bpy.data.filepath) if bpy.data.filepath else "//"
+        self.filepath = os.path.join(folder, f"{bpy.path.clean_name(context.scene.name)}.svg")
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        output_path = bpy.path.abspath(self.filepath)
+        hb_wall_cutters.refresh_stale_cut_caches()
+        sheet = hb_vector_export.evaluate_sheet(context, context.scene)
+        hb_vector_export.write_svg(sheet, output_path)
+        self.report({'INFO'}, f"Exported {context.scene.name} to: {output_path}")
+        return {'FINISHED'}
 
 
 # =============================================================================
@@ -1216,7 +1258,7 @@ class home_builder_layouts_OT_add_dimension(bpy.types.Operator, hb_placement.Dim
         instance_matrix = instance_obj.matrix_world
         best_point = None
         
-        for obj in collection.objects:
+        for obj in collection.all_objects:
             if obj.type != 'MESH':
                 continue
             
@@ -2046,7 +2088,7 @@ class home_builder_layouts_OT_draw_line(bpy.types.Operator, hb_placement.Placeme
         best_point = None
         best_screen_pos = None
         
-        for obj in collection.objects:
+        for obj in collection.all_objects:
             if obj.type != 'MESH':
                 continue
             
@@ -2437,7 +2479,7 @@ class home_builder_layouts_OT_draw_line(bpy.types.Operator, hb_placement.Placeme
         # Add draw handler for snap indicator
         from ..operators.details import draw_snap_indicator
         args = (self, context)
-        self._handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._handle = hb_draw_stats.draw_handler_add(
             draw_snap_indicator, args, 'WINDOW', 'POST_PIXEL')
         
         # Create polyline
@@ -2732,7 +2774,7 @@ class home_builder_layouts_OT_draw_rectangle(bpy.types.Operator, hb_placement.Pl
         best_point = None
         best_screen_pos = None
         
-        for obj in collection.objects:
+        for obj in collection.all_objects:
             if obj.type != 'MESH':
                 continue
             
@@ -3006,7 +3048,7 @@ class home_builder_layouts_OT_draw_rectangle(bpy.types.Operator, hb_placement.Pl
         # Add draw handler for snap indicator
         from ..operators.details import draw_snap_indicator
         args = (self, context)
-        self._handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._handle = hb_draw_stats.draw_handler_add(
             draw_snap_indicator, args, 'WINDOW', 'POST_PIXEL')
         
         # Create rectangle
@@ -3274,7 +3316,7 @@ class home_builder_layouts_OT_draw_circle(bpy.types.Operator, hb_placement.Place
         best_point = None
         best_screen_pos = None
         
-        for obj in collection.objects:
+        for obj in collection.all_objects:
             if obj.type != 'MESH':
                 continue
             
@@ -3472,7 +3514,7 @@ class home_builder_layouts_OT_draw_circle(bpy.types.Operator, hb_placement.Place
         # Add draw handler
         from ..operators.details import draw_snap_indicator
         args = (self, context)
-        self._handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._handle = hb_draw_stats.draw_handler_add(
             draw_snap_indicator, args, 'WINDOW', 'POST_PIXEL')
         
         # Create circle
@@ -3727,7 +3769,7 @@ class home_builder_layouts_OT_add_text(bpy.types.Operator, hb_placement.Placemen
         best_point = None
         best_screen_pos = None
         
-        for obj in collection.objects:
+        for obj in collection.all_objects:
             if obj.type != 'MESH':
                 continue
             
@@ -3850,7 +3892,7 @@ class home_builder_layouts_OT_add_text(bpy.types.Operator, hb_placement.Placemen
         # Add draw handler
         from ..operators.details import draw_snap_indicator
         args = (self, context)
-        self._handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._handle = hb_draw_stats.draw_handler_add(
             draw_snap_indicator, args, 'WINDOW', 'POST_PIXEL')
         
         # Create text object
@@ -4077,7 +4119,7 @@ class home_builder_layouts_OT_generate_2d_plan(bpy.types.Operator):
         view = hb_layouts.PlanView(context.scene)
         wall_objects = []
         if view.content_collection:
-            for obj in view.content_collection.objects:
+            for obj in view.content_collection.all_objects:
                 if obj.get('IS_WALL_BP'):
                     wall_objects.append(obj)
 
@@ -4318,7 +4360,7 @@ class home_builder_layouts_OT_place_room_label(bpy.types.Operator):
         self._mouse_x = 0
         self._mouse_y = 0
 
-        self._draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._draw_handle = hb_draw_stats.draw_handler_add(
             self._draw_preview, (context,), 'WINDOW', 'POST_PIXEL')
 
         context.window_manager.modal_handler_add(self)
@@ -4494,14 +4536,27 @@ class home_builder_layouts_OT_link_objects_to_layout(bpy.types.Operator):
         return False
 
     def _get_content_collection(self, scene_name):
-        """Find the content collection for a layout view scene."""
+        """Find the content collection for a layout view scene.
+
+        Shared registry collections (hb_layouts.get_product_content) are
+        drawn by every view of their product, so objects are never linked
+        into them; a view with only shared content gets its own linked
+        content collection instead."""
         scene = bpy.data.scenes.get(scene_name)
         if not scene:
             return None
         for obj in scene.objects:
             if obj.type == 'EMPTY' and obj.instance_type == 'COLLECTION' and obj.instance_collection:
-                return obj.instance_collection
-        return None
+                if hb_layouts.CONTENT_SOURCE_PROP not in obj.instance_collection:
+                    return obj.instance_collection
+        collection = bpy.data.collections.new(f"{scene.name} Linked Content")
+        instance = bpy.data.objects.new(f"{scene.name} Linked Instance", None)
+        instance.empty_display_size = .01
+        instance.instance_type = 'COLLECTION'
+        instance.instance_collection = collection
+        scene.collection.objects.link(instance)
+        hb_layouts.LayoutView(scene).add_to_freestyle_collection(instance, 'SOLID')
+        return collection
 
     def _add_object_to_collection(self, obj, collection):
         """Recursively add object and children to collection, skipping cages and helpers."""
@@ -4568,6 +4623,120 @@ class home_builder_layouts_OT_link_objects_to_layout(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class home_builder_layouts_OT_collapse_dimensions(bpy.types.Operator):
+    """Fold the sheet's dimensions into one static dimension set object"""
+    bl_idname = "home_builder_layouts.collapse_dimensions"
+    bl_label = "Collapse Dimensions"
+    bl_description = ("Replace this sheet's dimension objects with one dimension set "
+                      "object that draws them all without re-evaluating each one. "
+                      "Use Edit Dimension to bring a single dimension back")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.get('IS_LAYOUT_VIEW')
+
+    def execute(self, context):
+        count = hb_dimension_sets.collapse_dimensions(context.scene)
+        if not count:
+            self.report({'INFO'}, "No dimensions to collapse.")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Collapsed {count} dimension(s) into a dimension set.")
+        return {'FINISHED'}
+
+
+class home_builder_layouts_OT_expand_dimensions(bpy.types.Operator):
+    """Turn the sheet's dimension set back into dimension objects"""
+    bl_idname = "home_builder_layouts.expand_dimensions"
+    bl_label = "Expand Dimensions"
+    bl_description = "Turn every dimension in this sheet's dimension set back into its own object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return hb_dimension_sets.get_dimension_set(context.scene) is not None
+
+    def execute(self, context):
+        objects = hb_dimension_sets.expand_dimensions(context.scene)
+        self.report({'INFO'}, f"Expanded {len(objects)} dimension(s).")
+        return {'FINISHED'}
+
+
+class home_builder_layouts_OT_edit_dimension_in_set(bpy.types.Operator):
+    """Pick a dimension in the dimension set and turn it back into an
+    editable dimension object"""
+    bl_idname = "home_builder_layouts.edit_dimension_in_set"
+    bl_label = "Edit Dimension"
+    bl_description = ("Click a dimension of the dimension set to turn it back into "
+                      "its own dimension object for editing")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Screen distance (pixels) for picking a dimension by its vertices
+    PICK_RADIUS = 12
+
+    @classmethod
+    def poll(cls, context):
+        return (context.area is not None and context.area.type == 'VIEW_3D'
+                and hb_dimension_sets.get_dimension_set(context.scene) is not None)
+
+    def invoke(self, context, event):
+        context.window_manager.modal_handler_add(self)
+        context.area.header_text_set("Click a dimension to edit  |  Esc/Right Click: Cancel")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type in {'ESC', 'RIGHTMOUSE'} and event.value == 'PRESS':
+            context.area.header_text_set(None)
+            return {'CANCELLED'}
+        if event.type == 'LEFTMOUSE' and event.value == 'PRESS':
+            context.area.header_text_set(None)
+            return self._pick(context, event)
+        return {'PASS_THROUGH'}
+
+    def _pick(self, context, event):
+        region = context.region
+        rv3d = context.region_data
+        set_obj = hb_dimension_sets.get_dimension_set(context.scene)
+        if set_obj is None or rv3d is None:
+            return {'CANCELLED'}
+        coord = (event.mouse_region_x, event.mouse_region_y)
+        origin = region_2d_to_origin_3d(region, rv3d, coord)
+        direction = region_2d_to_vector_3d(region, rv3d, coord)
+
+        index = None
+        inverse = set_obj.matrix_world.inverted()
+        hit, _loc, _normal, face = set_obj.ray_cast(
+            inverse @ origin, inverse.to_3x3() @ direction,
+            depsgraph=context.evaluated_depsgraph_get())
+        if hit and face >= 0:
+            index = hb_dimension_sets.record_at_vertex(
+                set_obj, set_obj.data.polygons[face].vertices[0])
+        else:
+            # Loose lines have no faces to hit: nearest vertex on screen
+            best = self.PICK_RADIUS ** 2
+            matrix = set_obj.matrix_world
+            for vert in set_obj.data.vertices:
+                screen = location_3d_to_region_2d(region, rv3d, matrix @ vert.co)
+                if screen is None:
+                    continue
+                dist = (screen.x - coord[0]) ** 2 + (screen.y - coord[1]) ** 2
+                if dist < best:
+                    best = dist
+                    index = hb_dimension_sets.record_at_vertex(set_obj, vert.index)
+        if index is None:
+            self.report({'INFO'}, "No dimension there.")
+            return {'CANCELLED'}
+
+        objects = hb_dimension_sets.expand_dimensions(context.scene, [index])
+        if not objects:
+            return {'CANCELLED'}
+        bpy.ops.object.select_all(action='DESELECT')
+        objects[0].select_set(True)
+        context.view_layer.objects.active = objects[0]
+        self.report({'INFO'}, f"Editing {objects[0].name}; Collapse Dimensions folds it back.")
+        return {'FINISHED'}
+
+
 class home_builder_layouts_OT_lineart_make_editable(bpy.types.Operator):
     """Convert this view's generated line art into real, editable strokes"""
     bl_idname = "home_builder_layouts.lineart_make_editable"
@@ -4592,8 +4761,10 @@ class home_builder_layouts_OT_lineart_make_editable(bpy.types.Operator):
             return {'CANCELLED'}
         gp_obj = hb_layouts.get_line_art_object(context.scene)
         gp_obj.hide_select = False
+        bake = hb_layouts.BAKE_LOG[-1]
         self.report({'INFO'},
-                    "Line art converted. Select the line art object and "
+                    f"Line art converted ({bake['strokes']} strokes in "
+                    f"{bake['seconds']:.2f}s). Select the line art object and "
                     "enter Edit Mode to modify lines.")
         return {'FINISHED'}
 
@@ -4620,6 +4791,9 @@ class home_builder_layouts_OT_lineart_restore_auto(bpy.types.Operator):
 
 
 classes = (
+    home_builder_layouts_OT_collapse_dimensions,
+    home_builder_layouts_OT_expand_dimensions,
+    home_builder_layouts_OT_edit_dimension_in_set,
     home_builder_layouts_OT_lineart_make_editable,
     home_builder_layouts_OT_lineart_restore_auto,
     home_builder_layouts_OT_create_elevation_view,
@@ -4631,11 +4805,13 @@ classes = (
     home_builder_layouts_OT_create_all_elevations,
     home_builder_layouts_OT_create_multi_view,
     home_builder_layouts_OT_update_elevation_view,
+    home_builder_layouts_OT_rescale_all_annotations,
     home_builder_layouts_OT_delete_layout_view,
     home_builder_layouts_OT_go_to_layout_view,
     home_builder_layouts_OT_fit_view_to_content,
     home_builder_layouts_OT_render_layout,
     home_builder_layouts_OT_export_all_to_pdf,
+    home_builder_layouts_OT_export_layout_to_svg,
     home_builder_layouts_OT_add_dimension,
     home_builder_layouts_OT_draw_line,
     home_builder_layouts_OT_add_dimension_3d,
@@ -2,6 +2,8 @@
 
 import bpy
 
+from .. import hb_draw_stats
+
 
 class HB_MT_call_menu_wrapper(bpy.types.Menu):
     """Wrapper menu that forces INVOKE_DEFAULT on its contents.
@@ -215,10 +217,26 @@ class HB_GENERAL_OT_delete(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class HB_GENERAL_OT_reset_draw_times(bpy.types.Operator):
+    """Clears the recorded viewport draw times so the averages restart
+    from the current scene and view."""
+    bl_idname = "hb_general.reset_draw_times"
+    bl_label = "Reset Draw Times"
+    bl_description = "Forget the recorded draw handler times"
+
+    def execute(self, context):
+        hb_draw_stats.reset()
+        for area in context.screen.areas if context.screen else ():
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        return {'FINISHED'}
+
+
 classes = (
     HB_MT_call_menu_wrapper,
     HB_GENERAL_OT_menu,
     HB_GENERAL_OT_delete,
+    HB_GENERAL_OT_reset_draw_times,
 )
 
 
@@ -25,12 +25,14 @@ no labels draw unless a wall / opening is part of the selection.
 """
 
 import bpy
-import blf
 import gpu
 from mathutils import Vector
 from bpy_extras import view3d_utils
 
 from .. import hb_placement, hb_types, units
+from .. import hb_draw_stats
+from ..hb_gpu_draw import DrawList, text_dimensions
+from ..hb_label_layout import LabelStack
 from ..units import inch
 from ..product_libraries.common import door_window_geo
 
@@ -44,6 +46,7 @@ LABEL_BORDER    = (1.0, 1.0, 1.0, 0.25)
 EDIT_BG         = (0.20, 0.43, 0.70, 0.95)
 TEXT_COLOR      = (0.95, 0.95, 0.95, 1.0)
 EDIT_TEXT_COLOR = (1.0, 1.0, 1.0, 1.0)
+LABEL_CELL      = 64    # de-overlap grid bucket, about one label wide
 
 _INPUT_CHARS = set("0123456789./-'\" ")
 
@@ -184,44 +187,28 @@ def _wall_label_targets(wall_obj):
     ]
 
 
-def _resolve_overlap(rect, existing, gap):
-    """Shift ``rect`` downward until it clears every already-placed
-    label rect. In head-on views (plan view of a wall, elevation of a
-    tall stack) several anchors project to the same screen point; the
-    labels stack below each other instead of piling up. Applied inside
-    compute_labels so drawing and click hit-testing stay identical."""
-    x, y, w, h = rect
-    for _ in range(16):
-        hit = None
-        for _name, _kind, (ex, ey, ew, eh), _text in existing:
-            if x < ex + ew and ex < x + w and y < ey + eh and ey < y + h:
-                hit = (ex, ey, ew, eh)
-                break
-        if hit is None:
-            break
-        y = hit[1] - h - gap
-    return (x, y, w, h)
-
-
 def compute_labels(context, region, rv3d):
     """[(obj_name, kind, rect, text)] for every label currently on
-    screen; rect is (x, y, w, h) region-local. Overlapping labels are
-    stacked vertically (see _resolve_overlap). Shared by the draw
-    handler and the click operator so hits can't drift from pixels."""
+    screen; rect is (x, y, w, h) region-local. In head-on views (plan
+    view of a wall, elevation of a tall stack) several anchors project to
+    the same screen point; a LabelStack stacks those labels below each
+    other instead of letting them pile up. Shared by the draw handler and
+    the click operator so hits can't drift from pixels."""
     if rv3d is None:
         return []
     targets = _selected_targets(context)
     if not targets:
         return []
-    unit_settings = context.scene.unit_settings
+    signature = units.unit_signature(context.scene.unit_settings)
     s = 1.0
     try:
         s = bpy.context.preferences.system.ui_scale
     except AttributeError:
         pass
-    blf.size(0, FONT_SIZE * s)
+    font_sz = FONT_SIZE * s
 
     labels = []
+    stack = LabelStack(gap=2.0 * s, cell=LABEL_CELL * s)
     for name, (tag, obj) in targets.items():
         rows = (_cage_label_targets(obj) if tag == 'CAGE'
                 else _wall_label_targets(obj))
@@ -231,8 +218,8 @@ def compute_labels(context, region, rv3d):
             pt = view3d_utils.location_3d_to_region_2d(region, rv3d, anchor)
             if pt is None:
                 continue
-            text = prefix + units.unit_to_string(unit_settings, value)
-            tw, th = blf.dimensions(0, text)
+            text = prefix + units.format_length(signature, value)
+            tw, th = text_dimensions(0, font_sz, text)
             w = tw + 2 * PAD_X * s
             h = th + 2 * PAD_Y * s
             rect = (pt.x - w / 2.0, pt.y - h / 2.0, w, h)
@@ -240,25 +227,23 @@ def compute_labels(context, region, rv3d):
                 continue
             if rect[1] + h < 0 or rect[1] > region.height:
                 continue
-            rect = _resolve_overlap(rect, labels, 2.0 * s)
+            rect = stack.place(rect)
             labels.append((name, kind, rect, text))
     return labels
 
 
 # ---- Draw handler --------------------------------------------------------
 
-def _draw_label_rect(shader, rect, bg):
+def _draw_label_rect(dl, rect, bg):
     x, y, w, h = rect
-    verts = ((x, y), (x + w, y), (x + w, y + h), (x, y + h))
-    from gpu_extras.batch import batch_for_shader
-    shader.uniform_float("color", bg)
-    batch_for_shader(shader, 'TRI_FAN', {"pos": verts}).draw(shader)
-    shader.uniform_float("color", LABEL_BORDER)
-    batch_for_shader(shader, 'LINE_LOOP', {"pos": verts}).draw(shader)
+    dl.rect(x, y, w, h, bg)
+    dl.rect_outline(x, y, w, h, LABEL_BORDER)
 
 
 def _draw():
-    """Permanent POST_PIXEL callback; cheap no-op with nothing selected."""
+    """Permanent POST_PIXEL callback; cheap no-op with nothing selected.
+    Every label goes into one DrawList, so the draw calls don't grow
+    with the label count."""
     if _shutdown:
         return
     context = bpy.context
@@ -277,27 +262,25 @@ def _draw():
     except AttributeError:
         pass
     font_sz = FONT_SIZE * s
-    gpu.state.blend_set('ALPHA')
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-    shader.bind()
+    dl = DrawList()
     for name, kind, rect, text in labels:
         editing = (_edit is not None and _edit['name'] == name
                    and _edit['kind'] == kind)
         if editing:
             typed = _edit['typed']
             shown = (typed + "|") if typed else text
-            blf.size(0, font_sz)
-            tw, _th = blf.dimensions(0, shown)
+            tw, _th = text_dimensions(0, font_sz, shown)
             w = max(rect[2], tw + 2 * PAD_X * s)
             rect = (rect[0], rect[1], w, rect[3])
-            _draw_label_rect(shader, rect, EDIT_BG)
-            blf.color(0, *EDIT_TEXT_COLOR)
+            _draw_label_rect(dl, rect, EDIT_BG)
+            dl.text(0, rect[0] + PAD_X * s, rect[1] + PAD_Y * s, font_sz,
+                    EDIT_TEXT_COLOR, shown)
         else:
-            _draw_label_rect(shader, rect, LABEL_BG)
-            blf.size(0, font_sz)
-            blf.color(0, *TEXT_COLOR)
-        blf.position(0, rect[0] + PAD_X * s, rect[1] + PAD_Y * s, 0)
-        blf.draw(0, text if not editing else shown)
+            _draw_label_rect(dl, rect, LABEL_BG)
+            dl.text(0, rect[0] + PAD_X * s, rect[1] + PAD_Y * s, font_sz,
+                    TEXT_COLOR, text)
+    gpu.state.blend_set('ALPHA')
+    dl.draw()
     gpu.state.blend_set('NONE')
 
 
@@ -520,7 +503,7 @@ def register():
     _shutdown = False
     for cls in classes:
         bpy.utils.register_class(cls)
-    _draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+    _draw_handle = hb_draw_stats.draw_handler_add(
         _draw, (), 'WINDOW', 'POST_PIXEL')
     _register_keymaps()
 
@@ -17,14 +17,13 @@ wheel, and section headers click to collapse.
 
 import bpy
 import gpu
-import blf
+from bpy.app.handlers import persistent
 
+from .. import hb_draw_stats
 from ..hb_gpu_draw import (
     get_visible_window_bounds as _get_visible_window_bounds,
-    draw_rect as _draw_rect,
-    draw_rect_outline as _draw_rect_outline,
-    draw_lines as _draw_lines,
-    draw_text as _draw_text,
+    DrawList,
+    text_dimensions as _text_dimensions,
     vcenter_baseline as _vcenter_baseline,
     point_in_rect as _point_in_rect,
 )
@@ -117,6 +116,18 @@ _last_current = None
 # into a scene re-expands the section that contains it.
 _collapsed = set()
 
+# Sorting every scene (and resolving layout views' parent rooms) each frame
+# is what made large projects slow to redraw with the navigator pinned.
+# _collect_groups() is reused until a scene or object is renamed, a scene is
+# re-sorted (msgbus), the scene count changes, or undo / file load swaps the
+# data out; every rebuild bumps the generation. The pinned layout is cached
+# per area on top of that, keyed on the generation and everything else it
+# is built from (see build_pinned_layout).
+_groups = None              # (scene count, groups)
+_groups_generation = 0
+_layout_cache = {}          # area pointer -> (key, (panel_rect, entries))
+_msgbus_owner = object()
+
 
 # ---- Scale ------------------------------------------------------------------
 
@@ -188,38 +199,83 @@ def _collect_groups():
     ]
     return [g for g in raw if g[2]]
 
+
+def _invalidate_groups(*_args):
+    global _groups
+    _groups = None
+
+
+def _current_groups():
+    """(generation, groups) -- _collect_groups() through the cache."""
+    global _groups, _groups_generation
+    count = len(bpy.data.scenes)
+    if _groups is None or _groups[0] != count:
+        _groups = (count, _collect_groups())
+        _groups_generation += 1
+        _layout_cache.clear()
+    return _groups_generation, _groups[1]
+
+
+def _subscribe():
+    from .. import hb_props
+    for key in ((bpy.types.Scene, "name"),
+                (bpy.types.Object, "name"),
+                (hb_props.Home_Builder_Scene_Props, "sort_order")):
+        bpy.msgbus.subscribe_rna(key=key, owner=_msgbus_owner, args=(),
+                                 notify=_invalidate_groups)
+
+
+@persistent
+def _on_reset(*_args):
+    _invalidate_groups()
+
+
+@persistent
+def _on_load_post(*_args):
+    # File loads drop msgbus subscriptions.
+    _invalidate_groups()
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    _subscribe()
+
+
+_HANDLERS = (
+    ('undo_post', _on_reset),
+    ('redo_post', _on_reset),
+    ('load_post', _on_load_post),
+)
+
 # ---- Glyph helpers ----------------------------------------------------------
 
-def _draw_rename_glyph(shader, rect, color):
+def _draw_rename_glyph(dl, rect, color):
     """A small text-field box with a cursor bar -- the rename affordance."""
     rx, ry, rw, rh = rect
     s = _s()
     pad = 4 * s
     bx, by = rx + pad, ry + pad
     bw, bh = rw - pad * 2, rh - pad * 2
-    _draw_rect_outline(shader, bx, by, bw, bh, color)
+    dl.rect_outline(bx, by, bw, bh, color)
     cx = bx + bw / 3.0
-    _draw_rect(shader, cx, by + 2 * s, 1.5 * s, bh - 4 * s, color)
+    dl.rect(cx, by + 2 * s, 1.5 * s, bh - 4 * s, color)
 
 
-def _draw_delete_glyph(shader, rect, color):
+def _draw_delete_glyph(dl, rect, color):
     """An X -- the delete affordance."""
     rx, ry, rw, rh = rect
     pad = 5 * _s()
     x0, y0 = rx + pad, ry + pad
     x1, y1 = rx + rw - pad, ry + rh - pad
-    _draw_lines(shader, [(x0, y0), (x1, y1), (x0, y1), (x1, y0)], color)
+    dl.segments([(x0, y0), (x1, y1), (x0, y1), (x1, y0)], color)
 
 
-def _draw_plus_glyph(shader, cx, cy, size, color):
+def _draw_plus_glyph(dl, cx, cy, size, color):
     """A plus sign centered at (cx, cy). ``size`` arrives pre-scaled."""
     half = size / 2.0
     thick = 1.5 * _s()
-    _draw_rect(shader, cx - half, cy - thick / 2.0, size, thick, color)
-    _draw_rect(shader, cx - thick / 2.0, cy - half, thick, size, color)
+    dl.rect(cx - half, cy - thick / 2.0, size, thick, color)
+    dl.rect(cx - thick / 2.0, cy - half, thick, size, color)
 
 
-def _draw_pin_glyph(shader, rect, color):
+def _draw_pin_glyph(dl, rect, color):
     """A small thumbtack -- the pin toggle affordance: a flat head with a
     short needle dropping from it."""
     rx, ry, rw, rh = rect
@@ -227,11 +283,11 @@ def _draw_pin_glyph(shader, rect, color):
     cx = rx + rw / 2.0
     head_w, head_h = 9 * s, 4 * s
     head_y = ry + rh - 5 * s - head_h
-    _draw_rect(shader, cx - head_w / 2.0, head_y, head_w, head_h, color)
-    _draw_lines(shader, [(cx, head_y), (cx, ry + 4 * s)], color)
+    dl.rect(cx - head_w / 2.0, head_y, head_w, head_h, color)
+    dl.segments([(cx, head_y), (cx, ry + 4 * s)], color)
 
 
-def _draw_chevron(shader, cx, cy, size, collapsed, color):
+def _draw_chevron(dl, cx, cy, size, collapsed, color):
     """Section disclosure chevron centered at (cx, cy): points right when
     the section is collapsed, down when expanded. ``size`` is pre-scaled."""
     h = size / 2.0
@@ -241,14 +297,13 @@ def _draw_chevron(shader, cx, cy, size, collapsed, color):
     else:
         pts = [(cx - h, cy + h / 2.0), (cx, cy - h / 2.0),
                (cx, cy - h / 2.0), (cx + h, cy + h / 2.0)]
-    _draw_lines(shader, pts, color)
+    dl.segments(pts, color)
 
 
 # ---- Text fitting -----------------------------------------------------------
 
 def _text_w(font_id, size, text):
-    blf.size(font_id, size)
-    return blf.dimensions(font_id, text)[0]
+    return _text_dimensions(font_id, size, text)[0]
 
 
 def _fit_text(font_id, size, text, max_w):
@@ -290,7 +345,7 @@ def _build_layout(region, area, current_scene_name,
     Room rows carry rename/delete sub-rects; other rows carry None.
     """
     global _scroll, _last_current
-    groups = _collect_groups()
+    groups = _current_groups()[1]
 
     s = _s()
     panel_hdr_h = PANEL_HEADER_HEIGHT * s
@@ -526,22 +581,21 @@ def toggle_section(label):
 
 # ---- Draw helpers -----------------------------------------------------------
 
-def _draw_panel_header(shader, font_id, rect, current_name, pin_rect, mx, my):
+def _draw_panel_header(dl, font_id, rect, current_name, pin_rect, mx, my):
     rx, ry, rw, rh = rect
     s = _s()
     hdr_font = HEADER_FONT_SIZE * s
     row_font = ROW_FONT_SIZE * s
-    blf.size(font_id, hdr_font)
     label = "CURRENT"
-    label_w = blf.dimensions(font_id, label)[0]
+    label_w = _text_w(font_id, hdr_font, label)
     baseline = _vcenter_baseline(rect, font_id, row_font)
-    _draw_text(font_id, rx, baseline, hdr_font, HEADER_TEXT, label)
+    dl.text(font_id, rx, baseline, hdr_font, HEADER_TEXT, label)
     name_x = rx + label_w + 8 * s
     name_w = pin_rect[0] - 8 * s - name_x
-    _draw_text(font_id, name_x, baseline, row_font, TEXT_PRIMARY,
-               _fit_text(font_id, row_font, current_name, name_w))
+    dl.text(font_id, name_x, baseline, row_font, TEXT_PRIMARY,
+            _fit_text(font_id, row_font, current_name, name_w))
     # separator line at the bottom of the header rect
-    _draw_rect(shader, rx, ry, rw, max(1.0, s), SEPARATOR_COLOR)
+    dl.rect(rx, ry, rw, max(1.0, s), SEPARATOR_COLOR)
     # pin toggle -- when lit, the navigator stays open across scene picks
     px, py, pw, ph = pin_rect
     hovered = _point_in_rect(mx, my, pin_rect)
@@ -551,29 +605,29 @@ def _draw_panel_header(shader, font_id, rect, current_name, pin_rect, mx, my):
         bg = ACTION_HOVER_BG
     else:
         bg = ACTION_BG
-    _draw_rect(shader, px, py, pw, ph, bg)
+    dl.rect(px, py, pw, ph, bg)
     glyph = PIN_GLYPH_ACTIVE if (_pinned or hovered) else PIN_GLYPH
-    _draw_pin_glyph(shader, pin_rect, glyph)
+    _draw_pin_glyph(dl, pin_rect, glyph)
 
 
-def _draw_row(shader, font_id, entry, mx, my):
+def _draw_row(dl, font_id, entry, mx, my):
     (_, scene, parent, color, is_current, rect,
      rename_rect, delete_rect) = entry
     rx, ry, rw, rh = rect
     hovered = _point_in_rect(mx, my, rect)
 
     if is_current:
-        _draw_rect(shader, rx, ry, rw, rh, (*color, 0.14))
+        dl.rect(rx, ry, rw, rh, (*color, 0.14))
     elif hovered:
-        _draw_rect(shader, rx, ry, rw, rh, ROW_HOVER_BG)
+        dl.rect(rx, ry, rw, rh, ROW_HOVER_BG)
 
     s = _s()
     row_font = ROW_FONT_SIZE * s
     parent_font = PARENT_FONT_SIZE * s
 
     accent_alpha = 1.0 if is_current else (0.85 if hovered else 0.55)
-    _draw_rect(shader, rx + ACCENT_LEFT_PAD * s, ry + 4 * s,
-               ACCENT_WIDTH * s, rh - 8 * s, (*color, accent_alpha))
+    dl.rect(rx + ACCENT_LEFT_PAD * s, ry + 4 * s,
+            ACCENT_WIDTH * s, rh - 8 * s, (*color, accent_alpha))
 
     text_x = rx + ROW_TEXT_LEFT_PAD * s
     name_color = TEXT_PRIMARY if is_current else TEXT_NORMAL
@@ -588,61 +642,59 @@ def _draw_row(shader, font_id, entry, mx, my):
         avail = rx + rw - ROW_TEXT_RIGHT_PAD * s - text_x
 
     if parent:
-        blf.size(font_id, parent_font)
-        parent_w = blf.dimensions(font_id, parent)[0]
+        parent_w = _text_w(font_id, parent_font, parent)
         sep = "  \u00b7  "
-        sep_w = blf.dimensions(font_id, sep)[0]
+        sep_w = _text_w(font_id, parent_font, sep)
         if parent_w + sep_w + PARENT_MIN_NAME_W * s > avail:
             parent = None
     if parent:
-        _draw_text(font_id, text_x, baseline,
-                   parent_font, TEXT_DIM, parent)
-        _draw_text(font_id, text_x + parent_w, baseline,
-                   parent_font, TEXT_DIM, sep)
+        dl.text(font_id, text_x, baseline,
+                parent_font, TEXT_DIM, parent)
+        dl.text(font_id, text_x + parent_w, baseline,
+                parent_font, TEXT_DIM, sep)
         name = _fit_text(font_id, row_font, scene.name,
                          avail - parent_w - sep_w)
-        _draw_text(font_id, text_x + parent_w + sep_w, baseline,
-                   row_font, name_color, name)
+        dl.text(font_id, text_x + parent_w + sep_w, baseline,
+                row_font, name_color, name)
     else:
         name = _fit_text(font_id, row_font, scene.name, avail)
-        _draw_text(font_id, text_x, baseline, row_font, name_color, name)
+        dl.text(font_id, text_x, baseline, row_font, name_color, name)
 
     if rename_rect is not None:
         r_hover = _point_in_rect(mx, my, rename_rect)
         brx, bry, brw, brh = rename_rect
-        _draw_rect(shader, brx, bry, brw, brh,
-                   ACTION_HOVER_BG if r_hover else ACTION_BG)
-        _draw_rename_glyph(shader, rename_rect,
+        dl.rect(brx, bry, brw, brh,
+                ACTION_HOVER_BG if r_hover else ACTION_BG)
+        _draw_rename_glyph(dl, rename_rect,
                            ACTION_GLYPH_HOVER if r_hover else ACTION_GLYPH)
     if delete_rect is not None:
         d_hover = _point_in_rect(mx, my, delete_rect)
         bdx, bdy, bdw, bdh = delete_rect
-        _draw_rect(shader, bdx, bdy, bdw, bdh,
-                   ACTION_DELETE_HOVER_BG if d_hover else ACTION_BG)
-        _draw_delete_glyph(shader, delete_rect,
+        dl.rect(bdx, bdy, bdw, bdh,
+                ACTION_DELETE_HOVER_BG if d_hover else ACTION_BG)
+        _draw_delete_glyph(dl, delete_rect,
                            ACTION_GLYPH_HOVER if d_hover else ACTION_GLYPH)
 
 
-def _draw_new_room_button(shader, font_id, rect, mx, my):
+def _draw_new_room_button(dl, font_id, rect, mx, my):
     rx, ry, rw, rh = rect
     hovered = _point_in_rect(mx, my, rect)
-    _draw_rect(shader, rx, ry, rw, rh,
-               NEW_ROOM_HOVER_BG if hovered else NEW_ROOM_BG)
-    _draw_rect_outline(shader, rx, ry, rw, rh, PANEL_BORDER)
+    dl.rect(rx, ry, rw, rh,
+            NEW_ROOM_HOVER_BG if hovered else NEW_ROOM_BG)
+    dl.rect_outline(rx, ry, rw, rh, PANEL_BORDER)
     label = "New Room"
     s = _s()
     row_font = ROW_FONT_SIZE * s
-    blf.size(font_id, row_font)
-    label_w = blf.dimensions(font_id, label)[0]
+    label_w = _text_w(font_id, row_font, label)
     plus_size = 10 * s
     gap = 8 * s
     group_w = plus_size + gap + label_w
     gx = rx + (rw - group_w) / 2.0
     cy = ry + rh / 2.0
-    _draw_plus_glyph(shader, gx + plus_size / 2.0, cy, plus_size, TEXT_PRIMARY)
+    _draw_plus_glyph(dl, gx + plus_size / 2.0, cy, plus_size, TEXT_PRIMARY)
     baseline = _vcenter_baseline(rect, font_id, row_font)
-    _draw_text(font_id, gx + plus_size + gap, baseline,
-               row_font, TEXT_PRIMARY, label)
+    dl.text(font_id, gx + plus_size + gap, baseline,
+            row_font, TEXT_PRIMARY, label)
 
 
 # ---- Draw callback ----------------------------------------------------------
@@ -654,14 +706,18 @@ def paint_navigator(panel_rect, entries, mx, my):
     can render the SAME panel when the navigator is pinned -- the HUD owns a
     permanent draw handler that survives designing, where the modal's own
     handler does not.
+
+    Drawn as three DrawLists -- panel, scissored list, fixed header and
+    footer -- so the draw-call count stays the same however many rows
+    are visible.
     """
     gpu.state.blend_set('ALPHA')
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-    shader.bind()
 
     px, py, pw, ph = panel_rect
-    _draw_rect(shader, px, py, pw, ph, PANEL_BG)
-    _draw_rect_outline(shader, px, py, pw, ph, PANEL_BORDER)
+    panel = DrawList()
+    panel.rect(px, py, pw, ph, PANEL_BG)
+    panel.rect_outline(px, py, pw, ph, PANEL_BORDER)
+    panel.draw()
 
     font_id = 0
     s = _s()
@@ -685,6 +741,7 @@ def paint_navigator(panel_rect, entries, mx, my):
     else:
         lmx, lmy = mx, my
 
+    dl = DrawList()
     for entry in entries:
         kind = entry[0]
         if kind == 'header':
@@ -693,37 +750,40 @@ def paint_navigator(panel_rect, entries, mx, my):
             hdr_font = HEADER_FONT_SIZE * s
             hovered = _point_in_rect(lmx, lmy, rect)
             if hovered:
-                _draw_rect(shader, rx, ry, rw, rh, ROW_HOVER_BG)
+                dl.rect(rx, ry, rw, rh, ROW_HOVER_BG)
             baseline = _vcenter_baseline(rect, font_id, hdr_font)
             chev = SECTION_CHEVRON_W * s
-            _draw_chevron(shader, rx + chev / 2.0 - 1 * s, ry + rh / 2.0,
+            _draw_chevron(dl, rx + chev / 2.0 - 1 * s, ry + rh / 2.0,
                           6 * s, collapsed,
                           TEXT_NORMAL if hovered else HEADER_TEXT)
-            _draw_text(font_id, rx + chev, baseline, hdr_font,
-                       TEXT_NORMAL if hovered else HEADER_TEXT, label)
+            dl.text(font_id, rx + chev, baseline, hdr_font,
+                    TEXT_NORMAL if hovered else HEADER_TEXT, label)
             if collapsed:
                 lw = _text_w(font_id, hdr_font, label)
-                _draw_text(font_id, rx + chev + lw, baseline, hdr_font,
-                           TEXT_DIM, f"  {count}")
+                dl.text(font_id, rx + chev + lw, baseline, hdr_font,
+                        TEXT_DIM, f"  {count}")
         elif kind == 'row':
-            _draw_row(shader, font_id, entry, lmx, lmy)
+            _draw_row(dl, font_id, entry, lmx, lmy)
+    dl.draw()
 
     if saved_scissor is not None:
         gpu.state.scissor_set(*saved_scissor)
         gpu.state.scissor_test_set(False)
 
+    dl = DrawList()
     for entry in entries:
         kind = entry[0]
         if kind == 'panel_header':
-            _draw_panel_header(shader, font_id, entry[2], entry[1],
+            _draw_panel_header(dl, font_id, entry[2], entry[1],
                                entry[3], mx, my)
         elif kind == 'list':
             _, _clip, track, thumb = entry
             if track is not None:
-                _draw_rect(shader, *track, SCROLLBAR_TRACK)
-                _draw_rect(shader, *thumb, SCROLLBAR_THUMB)
+                dl.rect(*track, SCROLLBAR_TRACK)
+                dl.rect(*thumb, SCROLLBAR_THUMB)
         elif kind == 'new_room':
-            _draw_new_room_button(shader, font_id, entry[1], mx, my)
+            _draw_new_room_button(dl, font_id, entry[1], mx, my)
+    dl.draw()
 
     gpu.state.blend_set('NONE')
 
@@ -760,7 +820,23 @@ def build_pinned_layout(context, area, region, anchor_x=-1.0, anchor_top=-1.0):
     """
     if not _pinned or region is None or area is None:
         return None
-    return _build_layout(region, area, context.scene.name, anchor_x, anchor_top)
+    generation = _current_groups()[0]
+    current = context.scene.name
+    key = (generation, current, region.width, region.height,
+           _get_visible_window_bounds(area), _s(), anchor_x, anchor_top,
+           _scroll, frozenset(_collapsed))
+    pointer = area.as_pointer()
+    cached = _layout_cache.get(pointer)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    layout = _build_layout(region, area, current, anchor_x, anchor_top)
+    # _build_layout may clamp / re-target _scroll; key the entry on the
+    # state it leaves behind so the next frame hits.
+    key = key[:8] + (_scroll, frozenset(_collapsed))
+    if len(_layout_cache) > 32:
+        _layout_cache.clear()
+    _layout_cache[pointer] = (key, layout)
+    return layout
 
 
 def handle_navigator_click(context, mx, my, entries):
@@ -853,7 +929,7 @@ class home_builder_OT_scene_navigator(bpy.types.Operator):
 
         self._rebuild_layout(context)
 
-        self._draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._draw_handle = hb_draw_stats.draw_handler_add(
             draw_scene_navigator, (self,), 'WINDOW', 'POST_PIXEL'
         )
         context.window_manager.modal_handler_add(self)
@@ -1009,8 +1085,20 @@ classes = (
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    _subscribe()
+    for name, handler in _HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if handler not in handlers:
+            handlers.append(handler)
 
 
 def unregister():
+    for name, handler in _HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if handler in handlers:
+            handlers.remove(handler)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    _invalidate_groups()
+    _layout_cache.clear()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -19,15 +19,15 @@ logic.
 
 import bpy
 import gpu
-import blf
 from collections import namedtuple
 
+from .. import hb_draw_stats
 from ..hb_gpu_draw import (
     get_visible_window_bounds,
-    draw_rect,
-    draw_rect_outline,
-    draw_text,
     point_in_rect,
+    DrawList,
+    BatchCache,
+    text_dimensions,
 )
 # Sibling module -- safe to import at load (scene_navigator imports viewport_hud
 # only lazily, inside its pin-toggle handler, so there's no import cycle).
@@ -47,6 +47,8 @@ _mouse = (-1, -1)          # last cursor pos, region-local
 _mouse_region = None       # region _mouse was measured in (hover is per-region)
 _last_hover_key = None     # layout index of the widget under the cursor
 _addon_keymaps = []        # [(keymap, keymap_item), ...] for cleanup
+_batch_caches = {}         # region pointer -> BatchCache of the widget shapes
+_layout_cache = {}         # area pointer -> (layout key, compute_layout result)
 
 
 # ---- Layout + style ---------------------------------------------------------
@@ -137,12 +139,11 @@ _CL_SELECTION = _SelectionWiring(
 
 # ---- Widgets ----------------------------------------------------------------
 
-def _draw_centered_text(font_id, rect, size, color, text):
+def _draw_centered_text(dl, font_id, rect, size, color, text):
     rx, ry, rw, rh = rect
-    blf.size(font_id, size)
-    tw, th = blf.dimensions(font_id, text)
-    draw_text(font_id, rx + (rw - tw) / 2.0, ry + (rh - th) / 2.0,
-              size, color, text)
+    tw, th = text_dimensions(font_id, size, text)
+    dl.text(font_id, rx + (rw - tw) / 2.0, ry + (rh - th) / 2.0,
+            size, color, text)
 
 
 class _NavButton:
@@ -152,20 +153,19 @@ class _NavButton:
     def width(self):
         # Sized to the current scene name so it doubles as a status display.
         s = _s()
-        blf.size(0, FONT_SIZE * s)
-        text_w = blf.dimensions(0, bpy.context.scene.name)[0]
+        text_w = text_dimensions(0, FONT_SIZE * s, bpy.context.scene.name)[0]
         return int((NAV_TEXT_LEFT + NAV_PAD_RIGHT) * s + text_w)
 
     def visible(self, context):
         return True
 
-    def draw(self, shader, font_id, rect, context, mouse):
+    def draw(self, dl, font_id, rect, context, mouse):
         rx, ry, rw, rh = rect
         s = _s()
         hovered = point_in_rect(mouse[0], mouse[1], rect)
-        draw_rect(shader, rx, ry, rw, rh,
-                  BTN_HOVER_BG if hovered else BTN_BG)
-        draw_rect_outline(shader, rx, ry, rw, rh, BTN_BORDER)
+        dl.rect(rx, ry, rw, rh,
+                BTN_HOVER_BG if hovered else BTN_BG)
+        dl.rect_outline(rx, ry, rw, rh, BTN_BORDER)
         # Hamburger glyph -- three stacked bars, left-aligned. blf can't
         # render Blender's icon set in a GPU pass, so it's drawn by hand.
         bar_w = 12 * s
@@ -175,16 +175,15 @@ class _NavButton:
         total = bar_h * 3 + gap * 2
         gy = ry + (rh - total) / 2.0
         for i in range(3):
-            draw_rect(shader, gx, gy + i * (bar_h + gap), bar_w, bar_h,
-                      GLYPH_COLOR)
+            dl.rect(gx, gy + i * (bar_h + gap), bar_w, bar_h,
+                    GLYPH_COLOR)
         # Current scene name -- shows the active scene at a glance and is
         # itself the target that opens the navigator.
         name = context.scene.name
         font_sz = FONT_SIZE * s
-        blf.size(font_id, font_sz)
-        label_h = blf.dimensions(font_id, name)[1]
-        draw_text(font_id, rx + NAV_TEXT_LEFT * s, ry + (rh - label_h) / 2.0,
-                  font_sz, TEXT_NORMAL, name)
+        label_h = text_dimensions(font_id, font_sz, name)[1]
+        dl.text(font_id, rx + NAV_TEXT_LEFT * s, ry + (rh - label_h) / 2.0,
+                font_sz, TEXT_NORMAL, name)
 
     def on_click(self, context, area, region):
         # When pinned, the persistent HUD already draws the navigator panel,
@@ -236,7 +235,7 @@ class _ModeButton:
     def visible(self, context):
         return self.wiring.ui_visible(context)
 
-    def draw(self, shader, font_id, rect, context, mouse):
+    def draw(self, dl, font_id, rect, context, mouse):
         rx, ry, rw, rh = rect
         is_active = self._is_active(self._props(context))
         hovered = point_in_rect(mouse[0], mouse[1], rect)
@@ -247,11 +246,11 @@ class _ModeButton:
             bg = BTN_HOVER_BG
         else:
             bg = BTN_BG
-        draw_rect(shader, rx, ry, rw, rh, bg)
-        draw_rect_outline(shader, rx, ry, rw, rh, BTN_BORDER)
+        dl.rect(rx, ry, rw, rh, bg)
+        dl.rect_outline(rx, ry, rw, rh, BTN_BORDER)
 
         color = TEXT_ACTIVE if is_active else TEXT_NORMAL
-        _draw_centered_text(font_id, rect, FONT_SIZE * _s(), color, self.label)
+        _draw_centered_text(dl, font_id, rect, FONT_SIZE * _s(), color, self.label)
 
     def on_click(self, context, area, region):
         props = self._props(context)
@@ -303,9 +302,8 @@ class _ModalToggleButton:
         # Size to the longer of the two possible labels so the rect
         # doesn't shift width when state flips.
         s = _s()
-        blf.size(0, FONT_SIZE * s)
-        w_enable = blf.dimensions(0, self.enable_label)[0]
-        w_disable = blf.dimensions(0, self.disable_label)[0]
+        w_enable = text_dimensions(0, FONT_SIZE * s, self.enable_label)[0]
+        w_disable = text_dimensions(0, FONT_SIZE * s, self.disable_label)[0]
         return int(max(w_enable, w_disable) + 24 * s)  # text + horizontal pad
 
     def visible(self, context):
@@ -319,7 +317,7 @@ class _ModalToggleButton:
         # and the user would be forced to Esc out.
         return in_my_mode or self._is_my_modal_active()
 
-    def draw(self, shader, font_id, rect, context, mouse):
+    def draw(self, dl, font_id, rect, context, mouse):
         rx, ry, rw, rh = rect
         active = self._is_my_modal_active()
         hovered = point_in_rect(mouse[0], mouse[1], rect)
@@ -329,10 +327,10 @@ class _ModalToggleButton:
             bg = BTN_HOVER_BG
         else:
             bg = BTN_BG
-        draw_rect(shader, rx, ry, rw, rh, bg)
-        draw_rect_outline(shader, rx, ry, rw, rh, BTN_BORDER)
+        dl.rect(rx, ry, rw, rh, bg)
+        dl.rect_outline(rx, ry, rw, rh, BTN_BORDER)
         color = TEXT_ACTIVE if active else TEXT_NORMAL
-        _draw_centered_text(font_id, rect, FONT_SIZE * _s(), color, self._label())
+        _draw_centered_text(dl, font_id, rect, FONT_SIZE * _s(), color, self._label())
 
     def on_click(self, context, area, region):
         if active_modal_idname() == self.op_idname:
@@ -429,7 +427,7 @@ class _SceneToggleButton:
     def visible(self, context):
         return self.ui_visible(context)
 
-    def draw(self, shader, font_id, rect, context, mouse):
+    def draw(self, dl, font_id, rect, context, mouse):
         rx, ry, rw, rh = rect
         is_active = self._is_active(context)
         hovered = point_in_rect(mouse[0], mouse[1], rect)
@@ -439,10 +437,10 @@ class _SceneToggleButton:
             bg = BTN_HOVER_BG
         else:
             bg = BTN_BG
-        draw_rect(shader, rx, ry, rw, rh, bg)
-        draw_rect_outline(shader, rx, ry, rw, rh, BTN_BORDER)
+        dl.rect(rx, ry, rw, rh, bg)
+        dl.rect_outline(rx, ry, rw, rh, BTN_BORDER)
         color = TEXT_ACTIVE if is_active else TEXT_NORMAL
-        _draw_centered_text(font_id, rect, FONT_SIZE * _s(), color,
+        _draw_centered_text(dl, font_id, rect, FONT_SIZE * _s(), color,
                             self.label)
 
     def on_click(self, context, area, region):
@@ -498,8 +496,36 @@ def _corner_has_overlay_text(area):
 def compute_layout(context, area):
     """Return [(widget, rect), ...] for every currently-visible widget, in
     WINDOW-local pixel coords. Shared by the draw handler and the click
-    listener so their rects cannot drift apart."""
-    x_min, x_max, y_min, y_max = get_visible_window_bounds(area)
+    listener so their rects cannot drift apart.
+
+    Runs on every redraw of every viewport and on every mouse move (hover),
+    so the result is cached per area. The key holds everything the layout
+    is built from -- visible window bounds (region resizes, N-panel),
+    UI scale, scene name (nav button width), overlay text and each widget's
+    visibility -- so any of them changing rebuilds it. Hover only affects
+    painting, not placement."""
+    bounds = get_visible_window_bounds(area)
+    rows = _rows()
+    nav_visible = _NAV_BUTTON.visible(context)
+    visible = tuple(w.visible(context)
+                    for row in rows for group in row for w in group)
+    key = (bounds, _s(), context.scene.name, nav_visible,
+           nav_visible and _corner_has_overlay_text(area), visible)
+    pointer = area.as_pointer()
+    cached = _layout_cache.get(pointer)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    placed = _build_layout(bounds, rows, key[3], key[4], iter(visible))
+    if len(_layout_cache) > 32:
+        _layout_cache.clear()
+    _layout_cache[pointer] = (key, placed)
+    return placed
+
+
+def _build_layout(bounds, rows, nav_visible, corner_taken, visible):
+    """compute_layout's placement pass; ``visible`` yields each row
+    widget's visibility in _rows() order."""
+    x_min, x_max, y_min, y_max = bounds
     visible_w = x_max - x_min
     s = _s()
     margin_y = HUD_MARGIN_Y * s
@@ -511,14 +537,17 @@ def compute_layout(context, area):
     placed = []
     top_y = y_max - margin_y - btn_h
 
+    # Visibility flags are consumed in _rows() order, before the nav
+    # button may be folded into the first row.
+    rows = [[[w for w in g if next(visible)] for g in row] for row in rows]
+
     # The scene-navigator button is left-anchored just past the toolbar,
     # not part of the centered rows -- a fixed spot makes it easy to find
     # and its panel opens directly below it. When the viewport's overlay
     # text is on that corner belongs to Blender, so the button yields and
     # joins the first centered row as its leftmost group instead.
-    rows = _rows()
-    if _NAV_BUTTON.visible(context):
-        if _corner_has_overlay_text(area):
+    if nav_visible:
+        if corner_taken:
             rows = [[[_NAV_BUTTON]] + rows[0]] + rows[1:]
         else:
             placed.append((_NAV_BUTTON, (x_min + margin_x, top_y,
@@ -526,8 +555,7 @@ def compute_layout(context, area):
 
     cursor_y = top_y
     for row in rows:
-        groups = [[w for w in g if w.visible(context)] for g in row]
-        groups = [g for g in groups if g]
+        groups = [g for g in row if g]
         if not groups:
             continue
         row_w = group_gap * (len(groups) - 1)
@@ -658,12 +686,20 @@ def _draw_hud():
     # Hover state is only meaningful for the region the cursor is in.
     mouse = _mouse if _mouse_region == region else (-1, -1)
 
-    gpu.state.blend_set('ALPHA')
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-    shader.bind()
+    # Widgets add their shapes and text to one DrawList; the button
+    # backgrounds only change on hover / state / layout changes, so each
+    # region keeps the last GPU batches and reuses them while they match.
+    dl = DrawList()
     font_id = 0
     for widget, rect in placed:
-        widget.draw(shader, font_id, rect, context, mouse)
+        widget.draw(dl, font_id, rect, context, mouse)
+    cache = _batch_caches.get(region.as_pointer())
+    if cache is None:
+        if len(_batch_caches) > 32:
+            _batch_caches.clear()
+        cache = _batch_caches[region.as_pointer()] = BatchCache()
+    gpu.state.blend_set('ALPHA')
+    dl.draw(cache)
     gpu.state.blend_set('NONE')
 
     # Pinned scene navigator: drawn by THIS permanent handler (not the
@@ -853,7 +889,7 @@ def register():
     _hud_shutdown = False
     for cls in classes:
         bpy.utils.register_class(cls)
-    _draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+    _draw_handle = hb_draw_stats.draw_handler_add(
         _draw_hud, (), 'WINDOW', 'POST_PIXEL')
     _register_keymaps()
 
@@ -862,6 +898,8 @@ def unregister():
     global _draw_handle, _hud_shutdown
     _hud_shutdown = True
     _unregister_keymaps()
+    _batch_caches.clear()
+    _layout_cache.clear()
     if _draw_handle is not None:
         try:
             bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
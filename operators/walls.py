@@ -8,7 +8,8 @@ from mathutils import Vector
 from mathutils.geometry import intersect_line_plane
 from bpy_extras import view3d_utils
 from gpu_extras.batch import batch_for_shader
-from .. import hb_types, hb_snap, hb_placement, hb_utils, units
+from .. import hb_types, hb_snap, hb_placement, hb_utils, hb_wall_cutters, units
+from .. import hb_draw_stats
 
 # Wall Miter Angle Calculation
 def calculate_wall_miter_angles(wall_obj):
@@ -1634,7 +1635,7 @@ class home_builder_walls_OT_draw_walls(bpy.types.Operator, hb_placement.Placemen
         dimension. Replaces the legacy GeoNodeDimension scene-object approach."""
         self._wall_dim_visible = False
         if getattr(self, '_wall_dim_handle', None) is None:
-            self._wall_dim_handle = bpy.types.SpaceView3D.draw_handler_add(
+            self._wall_dim_handle = hb_draw_stats.draw_handler_add(
                 _draw_wall_length_dim, (self,), 'WINDOW', 'POST_PIXEL')
 
     def _remove_dim_handler(self):
@@ -2152,7 +2153,7 @@ class home_builder_walls_OT_draw_walls(bpy.types.Operator, hb_placement.Placemen
             child.hide_set(True)
 
         # Add GPU draw handler for snap indicator
-        self._snap_draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._snap_draw_handle = hb_draw_stats.draw_handler_add(
             draw_wall_snap_indicator, (self, context), 'WINDOW', 'POST_PIXEL')
 
         # Close-room snap state (active when cursor is near first wall's start point)
@@ -3384,7 +3385,7 @@ class home_builder_walls_OT_change_room_size(bpy.types.Operator):
         self._update_header(context)
         # Register the GPU draw handler for hover/drag highlighting
         if self._draw_handle is None:
-            self._draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+            self._draw_handle = hb_draw_stats.draw_handler_add(
                 _draw_change_room_size_highlight, (self,), 'WINDOW', 'POST_PIXEL')
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
@@ -4995,6 +4996,9 @@ class home_builder_walls_OT_delete_wall(bpy.types.Operator):
         for child in wall_bp.children_recursive:
             objects_to_delete.add(child)
 
+        # Drop the wall's cutter collection and pre-cut cache
+        hb_wall_cutters.remove_wall(wall_bp)
+
         # Delete all collected objects
         for obj in objects_to_delete:
             bpy.data.objects.remove(obj, do_unlink=True)
@@ -5472,7 +5476,7 @@ class home_builder_walls_OT_draw_floor_cutter(bpy.types.Operator, hb_placement.P
             return {'CANCELLED'}
 
         # Add GPU draw handler
-        self._draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._draw_handle = hb_draw_stats.draw_handler_add(
             draw_floor_cutter_preview, (self, context), 'WINDOW', 'POST_PIXEL')
 
         context.window_manager.modal_handler_add(self)
@@ -5785,14 +5789,8 @@ class home_builder_walls_OT_draw_wall_cutter(bpy.types.Operator, hb_placement.Pl
         return obj
 
     def add_boolean_to_wall(self, wall_obj, cutter_obj):
-        """Add a boolean DIFFERENCE modifier to the wall's mesh children."""
-        wall = hb_types.GeoNodeWall(wall_obj)
-        mod_name = f"Cut - {cutter_obj.name}"
-        mod = wall_obj.modifiers.new(name=mod_name, type='BOOLEAN')
-        mod.operation = 'DIFFERENCE'
-        mod.object = cutter_obj
-        mod.solver = 'EXACT'
-        return mod
+        """Add the cutter to the wall's shared openings boolean."""
+        return hb_wall_cutters.add_cutter(wall_obj, cutter_obj)
 
     def finish(self, context):
         """Create cutter cube, apply boolean, clean up."""
@@ -5838,7 +5836,7 @@ class home_builder_walls_OT_draw_wall_cutter(bpy.types.Operator, hb_placement.Pl
         self.target_wall = None
 
         # Add GPU draw handler
-        self._draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._draw_handle = hb_draw_stats.draw_handler_add(
             draw_wall_cutter_preview, (self, context), 'WINDOW', 'POST_PIXEL')
 
         context.window_manager.modal_handler_add(self)
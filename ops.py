@@ -8,6 +8,7 @@ from bpy_extras.view3d_utils import region_2d_to_location_3d, location_3d_to_reg
 import bmesh
 from . import hb_types
 from . import hb_utils
+from . import hb_draw_stats
 
 class home_builder_OT_to_do(bpy.types.Operator):
     bl_idname = "home_builder.to_do"
@@ -571,7 +572,7 @@ class home_builder_OT_set_scale_with_two_points(bpy.types.Operator):
         self.current_mouse_pos = None
 
         # Add GPU draw handler
-        self._draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._draw_handle = hb_draw_stats.draw_handler_add(
             _draw_scale_line, (self, context), 'WINDOW', 'POST_PIXEL')
 
         context.area.header_text_set("Click the FIRST point on the image")
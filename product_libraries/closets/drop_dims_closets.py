@@ -18,6 +18,9 @@ from bpy_extras import view3d_utils
 from gpu_extras.batch import batch_for_shader
 
 from ... import units
+from ... import hb_label_cache
+from ... import hb_draw_stats
+from ...hb_gpu_draw import text_dimensions
 
 LINE_COLOR = (0.95, 0.75, 0.15, 1.0)
 SNAP_COLOR = (0.35, 0.9, 0.4, 1.0)
@@ -28,6 +31,10 @@ TICK = 7.0
 
 _handle = None
 _entries = []
+# Nothing in the depsgraph moves these - show() replaces the entries -
+# so the cache is never watched, only invalidated by show() / hide().
+# Orbiting mid-placement re-projects without re-measuring text.
+_cache = hb_label_cache.LabelCache(lambda obj: False)
 
 
 def show(entries):
@@ -38,8 +45,9 @@ def show(entries):
     something, which colours it."""
     global _handle, _entries
     _entries = list(entries)
+    _cache.invalidate()
     if _handle is None:
-        _handle = bpy.types.SpaceView3D.draw_handler_add(
+        _handle = hb_draw_stats.draw_handler_add(
             _draw, (), 'WINDOW', 'POST_PIXEL')
 
 
@@ -47,6 +55,7 @@ def hide():
     """Stop drawing and let go of the handler."""
     global _handle, _entries
     _entries = []
+    _cache.invalidate()
     if _handle is not None:
         try:
             bpy.types.SpaceView3D.draw_handler_remove(_handle, 'WINDOW')
@@ -76,11 +85,10 @@ def _line(shader, points, color):
     batch_for_shader(shader, 'LINES', {"pos": points}).draw(shader)
 
 
-def _text(x, y, size, text):
+def _text(x, y, size, text, w, h):
     # Drawn twice, dark then light, so it stays readable over both a
     # pale panel and a dark opening.
     blf.size(0, size)
-    w, h = blf.dimensions(0, text)
     blf.color(0, *SHADOW)
     blf.position(0, x - w / 2.0 + 1, y - h / 2.0 - 1, 0)
     blf.draw(0, text)
@@ -89,6 +97,36 @@ def _text(x, y, size, text):
     blf.draw(0, text)
 
 
+def _measure(size):
+    """Entries with their figures measured: (start, end, text, snapped,
+    w, h)."""
+    return [(start, end, text, snapped) + tuple(text_dimensions(0, size, text))
+            for start, end, text, snapped in _entries]
+
+
+def _project(region, rv3d, measured, tick):
+    """Screen-space line, tick and figure positions per entry."""
+    shapes = []
+    for start, end, text, snapped, w, h in measured:
+        a = view3d_utils.location_3d_to_region_2d(region, rv3d, start)
+        b = view3d_utils.location_3d_to_region_2d(region, rv3d, end)
+        if a is None or b is None:
+            continue
+        dx, dy = b.x - a.x, b.y - a.y
+        length = (dx * dx + dy * dy) ** 0.5
+        if length < 1.0:
+            continue
+        # ticks square to the line, so it reads as a dimension
+        nx, ny = -dy / length * tick, dx / length * tick
+        lines = [(a.x, a.y), (b.x, b.y),
+                 (a.x - nx, a.y - ny), (a.x + nx, a.y + ny),
+                 (b.x - nx, b.y - ny), (b.x + nx, b.y + ny)]
+        figure = ((a.x + b.x) / 2.0 + nx * 2.4,
+                  (a.y + b.y) / 2.0 + ny * 2.4, text, w, h)
+        shapes.append((SNAP_COLOR if snapped else LINE_COLOR, lines, figure))
+    return shapes
+
+
 def _draw():
     """POST_PIXEL callback. Guarded throughout - a drawing error must
     never spill into the viewport or stop a placement."""
@@ -102,41 +140,20 @@ def _draw():
             return
         if context.area is None or context.area.type != 'VIEW_3D':
             return
-        scale = 1.0
-        try:
-            scale = context.preferences.system.ui_scale
-        except AttributeError:
-            pass
+        scale = hb_label_cache.ui_scale()
         size = FONT_SIZE * scale
         tick = TICK * scale
+        measured = _cache.world(scale, lambda: _measure(size))
+        shapes = _cache.projected(
+            region, rv3d, lambda: _project(region, rv3d, measured, tick))
         gpu.state.blend_set('ALPHA')
         gpu.state.line_width_set(2.0)
         try:
             shader = gpu.shader.from_builtin('UNIFORM_COLOR')
             shader.bind()
-            for start, end, text, snapped in _entries:
-                a = view3d_utils.location_3d_to_region_2d(region, rv3d,
-                                                          start)
-                b = view3d_utils.location_3d_to_region_2d(region, rv3d,
-                                                          end)
-                if a is None or b is None:
-                    continue
-                color = SNAP_COLOR if snapped else LINE_COLOR
-                dx, dy = b.x - a.x, b.y - a.y
-                length = (dx * dx + dy * dy) ** 0.5
-                if length < 1.0:
-                    continue
-                # ticks square to the line, so it reads as a dimension
-                nx, ny = -dy / length * tick, dx / length * tick
-                _line(shader, [(a.x, a.y), (b.x, b.y)], color)
-                _line(shader,
-                      [(a.x - nx, a.y - ny), (a.x + nx, a.y + ny)],
-                      color)
-                _line(shader,
-                      [(b.x - nx, b.y - ny), (b.x + nx, b.y + ny)],
-                      color)
-                _text((a.x + b.x) / 2.0 + nx * 2.4,
-                      (a.y + b.y) / 2.0 + ny * 2.4, size, text)
+            for color, lines, (x, y, text, w, h) in shapes:
+                _line(shader, lines, color)
+                _text(x, y, size, text, w, h)
         finally:
             # Whatever happens per entry, the state this drew with
             # must not leak into whoever draws next.
@@ -19,20 +19,22 @@ Typing back the displayed value is a no-op by construction.
 Architecture mirrors face_frame/dim_edit_overlay.py deliberately: a
 permanent draw handler plus addon-keymap click operators that
 PASS_THROUGH anything that isn't a label hit, so selection and tools are
-untouched and no persistent modal blocks autosave. Labels are recomputed
-on click rather than cached, so draw and hit-test can never drift.
+untouched and no persistent modal blocks autosave. Draw and hit-test
+share compute_labels, so they can never drift; its geometry is cached
+(hb_label_cache) until a closet starter changes or the view moves.
 """
 
 import bpy
-import blf
 import gpu
 from mathutils import Vector
 from bpy_extras import view3d_utils
 
 from ... import units
 from ... import hb_placement
+from ... import hb_label_cache
+from ... import hb_draw_stats
 from ...hb_types import GeoNodeCutpart
-from ...hb_gpu_draw import get_visible_window_bounds
+from ...hb_gpu_draw import get_visible_window_bounds, DrawList, text_dimensions
 from . import types_closets
 from . import const_closets as const
 # Stale-matrix-safe cage readers (valid for cages created while hidden).
@@ -123,14 +125,22 @@ def _selection_name_sets(context):
 
 
 def _obj_in_selection(obj, raw, expanded):
-    if obj.name in expanded:
+    return _lineage_in_selection(_lineage(obj), raw, expanded)
+
+
+def _lineage(obj):
+    """Names of obj and its ancestors, nearest first."""
+    names = []
+    while obj is not None:
+        names.append(obj.name)
+        obj = obj.parent
+    return tuple(names)
+
+
+def _lineage_in_selection(lineage, raw, expanded):
+    if lineage[0] in expanded:
         return True
-    node = obj.parent
-    while node is not None:
-        if node.name in raw:
-            return True
-        node = node.parent
-    return False
+    return any(name in raw for name in lineage[1:])
 
 # Label kinds. STARTER_* commit hb_closet_starter props; BAY_W commits
 # the bay width (auto-lock); OPEN_H inverse-writes the bay height.
@@ -208,7 +218,6 @@ def _filter_pill_rects(context, area, mode):
     except AttributeError:
         pass
     x_min, x_max, _y_min, y_max = get_visible_window_bounds(area)
-    blf.size(0, FONT_SIZE * s)
     pills = []
     for label, key, _p, modes in _FILTERS:
         if mode not in modes:
@@ -226,7 +235,8 @@ def _filter_pill_rects(context, area, mode):
         # Static add-part actions (start the hover-to-place modals).
         pills.append(("Add Shelf", '__add_shelf__'))
         pills.append(("Add Rod", '__add_rod__'))
-    widths = [blf.dimensions(0, label)[0] + 24 * s for label, _k in pills]
+    widths = [text_dimensions(0, FONT_SIZE * s, label)[0] + 24 * s
+              for label, _k in pills]
     h = _HUD_BTN_H * s
     total = sum(widths) + _PILL_GAP * s * max(0, len(pills) - 1)
     row1_y = y_max - _HUD_MARGIN_Y * s - h
@@ -267,18 +277,7 @@ def _starter_shown(starter, space=None):
     probe a structural part that is always visible when the closet is:
     the first partition panel (never design-hidden, present on every
     starter class including L shelves)."""
-    for child in starter.children:
-        if (child.get('hb_part_role') == types_closets.PART_ROLE_PANEL
-                and not child.get('hb_double_partition')
-                and not child.get('hb_panel_off')):
-            try:
-                if (space is not None
-                        and getattr(space, 'type', '') == 'VIEW_3D'):
-                    return child.visible_get(viewport=space)
-                return child.visible_get()
-            except Exception:
-                return True
-    return True
+    return _probe_shown(_visibility_probe(starter), space)
 
 
 def _anchor_world(cage, fx, fz):
@@ -305,130 +304,257 @@ def _starter_label_targets(starter):
     ]
 
 
+def _visibility_probe(starter):
+    """The part _starter_shown tests for a starter, or None."""
+    for child in starter.children:
+        if (child.get('hb_part_role') == types_closets.PART_ROLE_PANEL
+                and not child.get('hb_double_partition')
+                and not child.get('hb_panel_off')):
+            return child
+    return None
+
+
+def _probe_shown(probe, space=None):
+    if probe is None:
+        return True
+    try:
+        if space is not None and getattr(space, 'type', '') == 'VIEW_3D':
+            return probe.visible_get(viewport=space)
+        return probe.visible_get()
+    except Exception:
+        return True
+
+
+def _is_closet_object(obj):
+    """True for a closet starter root and anything under one."""
+    while obj is not None:
+        if obj.get(types_closets.TAG_STARTER_CAGE):
+            return True
+        obj = obj.parent
+    return False
+
+
+# World-space labels are rebuilt only when a depsgraph update touches a
+# closet starter; screen rects only when a region's view changes.
+_label_cache = hb_label_cache.LabelCache(_is_closet_object)
+
+
+def _starter_targets(starter, mode):
+    """[(obj, kind, editable, locked, anchor, value, prefix)] for one
+    starter in the given mode."""
+    targets = []
+    if mode == 'Starters':
+        for kind, anchor, value, prefix in _starter_label_targets(starter):
+            targets.append((starter, kind, True, False,
+                            anchor, value, prefix))
+        return targets
+    # Same placement rule as the starter labels: a label sits where
+    # its edit ACTS. Bay width = mid-face of the bay (panels move
+    # sideways around it); opening height = the opening's top edge;
+    # part labels ride the part they move.
+    for bay in _iter_bay_cages(starter):
+        if mode == 'Bays':
+            bp = bay.hb_closet_bay
+            targets.append((bay, 'BAY_W', True, bp.unlock_width,
+                            _anchor_world(bay, 0.5, 0.5),
+                            bp.width, "W "))
+            # Bay depth: drawn at the FRONT edge of the bay floor
+            # (full -Y), centered on width - so in a side view it
+            # sits at the front instead of stacking on the front-
+            # face W / H labels.
+            b_mw = split_preview._world_matrix(bay)
+            b_w, _bh = split_preview._cage_dims(bay)
+            d_anchor = b_mw @ Vector((b_w * 0.5, -bp.depth, 0.001))
+            targets.append((bay, 'BAY_D', True, False,
+                            d_anchor, bp.depth, "D "))
+        # Opening heights split by concern: Bays mode shows only the
+        # TOPMOST segment per side (that label edits the bay height);
+        # Openings mode shows only the capped segments (those labels
+        # move their capping shelf). Keeps shelf information out of
+        # Bays mode and bay-level values out of Openings mode.
+        openings_by_side = {}
+        for opening in _iter_opening_cages(bay):
+            side = opening.get(types_closets.PROP_OPENING_SIDE, 'FRONT')
+            openings_by_side.setdefault(side, []).append(opening)
+        top_index = {side: max(o.get('hb_opening_index', 0) for o in ops)
+                     for side, ops in openings_by_side.items()}
+        shelves_by_side = {}
+        for side in openings_by_side:
+            shelves_by_side[side] = sorted(
+                [c for c in bay.children
+                 if c.get('hb_part_role')
+                 == types_closets.PART_ROLE_FIXED_SHELF
+                 and c.get(types_closets.PROP_OPENING_SIDE,
+                           'FRONT') == side
+                 and not c.get('hb_preview')],
+                key=lambda o: o.get('hb_z_offset', 0.0))
+        for opening in _iter_opening_cages(bay):
+            side = opening.get(types_closets.PROP_OPENING_SIDE, 'FRONT')
+            idx = opening.get('hb_opening_index', 0)
+            is_top = (idx == top_index[side])
+            o_w, interior_h = split_preview._cage_dims(opening)
+            if mode == 'Bays' and is_top:
+                # Bay height reads OFF THE FLOOR (world Z of the bay
+                # top) and sits on the top edge - the line the grab
+                # handle drags. One emission per side.
+                bay_top_world = (split_preview._world_matrix(bay)
+                                 .translation.z
+                                 + bay.hb_closet_bay.height)
+                targets.append((bay, 'BAY_H', True, False,
+                                _anchor_world(bay, 0.5, 1.0),
+                                bay_top_world, "H "))
+            elif mode == 'Openings' and not is_top:
+                # Section label reads the capping shelf's height OFF
+                # THE GROUND (world Z); committing places the shelf
+                # at the typed height.
+                shelves = shelves_by_side.get(side, [])
+                if idx < len(shelves):
+                    shelf_world_z = split_preview._world_matrix(
+                        shelves[idx]).translation.z
+                    targets.append((opening, 'OPEN_H', True, False,
+                                    _anchor_world(opening, 0.5, 1.0),
+                                    shelf_world_z, "H "))
+            if mode != 'Openings':
+                continue
+            # Per-part labels: fixed shelves and rods show their
+            # opening-local height at the part itself; a drawer
+            # stack shows its front height at the stack's top edge.
+            o_mw = split_preview._world_matrix(opening)
+            for child in opening.children:
+                role = child.get('hb_part_role')
+                if (role == types_closets.PART_ROLE_ROD
+                        and not child.get('hb_preview')):
+                    anchor = o_mw @ Vector(
+                        (o_w / 2.0, -0.003, child.location.z))
+                    targets.append((child, 'PART_Z', True, False,
+                                    anchor, child.location.z, ""))
+                elif role == types_closets.PART_ROLE_DRAWER_FRONT:
+                    # Every drawer front carries its own editable height
+                    # label at its center; the bullet marks the fronts
+                    # the user has pinned, which the stack redistributes
+                    # around.
+                    # The height the front is standing at right now:
+                    # a pinned front squeezed by its opening labels
+                    # what is on screen, not the height it is owed.
+                    dh = child.get(
+                        types_closets.PROP_FRONT_HEIGHT_SOLVED,
+                        child.get(types_closets.PROP_FRONT_HEIGHT,
+                                  const.DRAWER_FRONT_HEIGHT))
+                    pinned = bool(child.get(
+                        types_closets.PROP_UNLOCK_FRONT_HEIGHT, 0))
+                    anchor = o_mw @ Vector(
+                        (o_w / 2.0, -0.003,
+                         child.location.z + dh / 2.0))
+                    targets.append((child, 'DRAWER_H', True, pinned,
+                                    anchor, dh, ""))
+
+    return targets
+
+
+def _build_world_labels(scene, mode, s):
+    """Per starter: (starter name, visibility probe name, labels,
+    toggles). Labels are (name, kind, editable, locked, anchor, text,
+    w, h, lineage); toggles (Bays mode) are (bay name, unlock_width,
+    glyph, glyph width, bottom anchor, bottom on, bottom w, bottom h).
+    The expensive half of compute_labels - scene walk, unit formatting,
+    text measuring - cached until a closet starter changes."""
+    signature = units.unit_signature(scene.unit_settings)
+    font_sz = FONT_SIZE * s
+    groups = []
+    for starter in _iter_starter_roots(scene):
+        labels = []
+        for obj, kind, editable, locked, anchor, value, prefix in \
+                _starter_targets(starter, mode):
+            if anchor is None:
+                continue
+            text = prefix + units.format_length(signature, value)
+            # BAY_W carries a dedicated lock glyph (added in
+            # compute_labels) instead of the bullet prefix.
+            if locked and kind != 'BAY_W':
+                text = "• " + text
+            tw, th = text_dimensions(0, font_sz, text)
+            labels.append((obj.name, kind, editable, locked, anchor.freeze(),
+                           text, tw + 2 * PAD_X * s, th + 2 * PAD_Y * s,
+                           _lineage(obj)))
+        toggles = []
+        if mode == 'Bays':
+            bw, bh = text_dimensions(0, font_sz, "Bottom")
+            for bay in _iter_bay_cages(starter):
+                bp = bay.hb_closet_bay
+                glyph = "•" if bp.unlock_width else "○"
+                # Bottom on/off pill just above the bay's bottom edge -
+                # the very bottom-front is the bay depth (BAY_D) label, so
+                # the pill sits a touch higher to clear it.
+                anchor = _anchor_world(bay, 0.5, 0.08)
+                toggles.append((bay.name, bp.unlock_width, glyph,
+                                text_dimensions(0, font_sz, glyph)[0],
+                                anchor.freeze() if anchor is not None else None,
+                                not bp.remove_bottom,
+                                bw + 2 * PAD_X * s, bh + 2 * PAD_Y * s))
+        probe = _visibility_probe(starter)
+        groups.append((starter.name, probe.name if probe else "",
+                       labels, toggles))
+    return groups
+
+
+def _on_screen(region, rv3d, anchor, w, h):
+    """Region rect (x, y, w, h) centred on the projected anchor, or None
+    when it falls fully outside the region."""
+    pt = view3d_utils.location_3d_to_region_2d(region, rv3d, anchor)
+    if pt is None:
+        return None
+    rect = (pt.x - w / 2.0, pt.y - h / 2.0, w, h)
+    if rect[0] + w < 0 or rect[0] > region.width:
+        return None
+    if rect[1] + h < 0 or rect[1] > region.height:
+        return None
+    return rect
+
+
+def _project_labels(region, rv3d, groups):
+    """World labels -> per starter (starter name, probe name, rects,
+    toggles) in region space; rects are (name, kind, editable, locked,
+    rect, text, lineage), toggles carry the bottom pill's rect (or None)
+    in place of its anchor."""
+    projected = []
+    for starter_name, probe_name, labels, toggles in groups:
+        rects = []
+        for name, kind, editable, locked, anchor, text, w, h, lineage in labels:
+            rect = _on_screen(region, rv3d, anchor, w, h)
+            if rect is not None:
+                rects.append((name, kind, editable, locked, rect, text, lineage))
+        placed = []
+        for bay_name, unlocked, glyph, gw, anchor, bottom_on, w, h in toggles:
+            rect = (_on_screen(region, rv3d, anchor, w, h)
+                    if anchor is not None else None)
+            placed.append((bay_name, unlocked, glyph, gw, rect, bottom_on))
+        projected.append((starter_name, probe_name, rects, placed))
+    return projected
+
+
 def compute_labels(context, region, rv3d):
     """[(obj_name, kind, editable, locked, rect, text)] currently on
-    screen. Shared by draw and the click operators."""
+    screen. Shared by draw and the click operators. Geometry comes from
+    _label_cache; visibility, the SELECTED scope and the family filters
+    are applied per call."""
     mode = _active_mode(context)
     if mode is None or rv3d is None:
         return []
     scene = context.scene
-    unit_settings = scene.unit_settings
-    s = 1.0
-    try:
-        s = bpy.context.preferences.system.ui_scale
-    except AttributeError:
-        pass
-    blf.size(0, FONT_SIZE * s)
+    s = hb_label_cache.ui_scale()
+
+    key = (scene.name, mode, s, hb_label_cache.unit_key(scene.unit_settings))
+    groups = _label_cache.world(
+        key, lambda: _build_world_labels(scene, mode, s))
+    projected = _label_cache.projected(
+        region, rv3d, lambda: _project_labels(region, rv3d, groups))
 
     space = getattr(context, 'space_data', None)
-    targets = []   # (obj, kind, editable, locked, anchor, value, prefix)
-    for starter in _iter_starter_roots(scene):
-        if not _starter_shown(starter, space):
-            continue
-        if mode == 'Starters':
-            for kind, anchor, value, prefix in _starter_label_targets(starter):
-                targets.append((starter, kind, True, False,
-                                anchor, value, prefix))
-            continue
-        # Same placement rule as the starter labels: a label sits where
-        # its edit ACTS. Bay width = mid-face of the bay (panels move
-        # sideways around it); opening height = the opening's top edge;
-        # part labels ride the part they move.
-        for bay in _iter_bay_cages(starter):
-            if mode == 'Bays':
-                bp = bay.hb_closet_bay
-                targets.append((bay, 'BAY_W', True, bp.unlock_width,
-                                _anchor_world(bay, 0.5, 0.5),
-                                bp.width, "W "))
-                # Bay depth: drawn at the FRONT edge of the bay floor
-                # (full -Y), centered on width - so in a side view it
-                # sits at the front instead of stacking on the front-
-                # face W / H labels.
-                b_mw = split_preview._world_matrix(bay)
-                b_w, _bh = split_preview._cage_dims(bay)
-                d_anchor = b_mw @ Vector((b_w * 0.5, -bp.depth, 0.001))
-                targets.append((bay, 'BAY_D', True, False,
-                                d_anchor, bp.depth, "D "))
-            # Opening heights split by concern: Bays mode shows only the
-            # TOPMOST segment per side (that label edits the bay height);
-            # Openings mode shows only the capped segments (those labels
-            # move their capping shelf). Keeps shelf information out of
-            # Bays mode and bay-level values out of Openings mode.
-            openings_by_side = {}
-            for opening in _iter_opening_cages(bay):
-                side = opening.get(types_closets.PROP_OPENING_SIDE, 'FRONT')
-                openings_by_side.setdefault(side, []).append(opening)
-            top_index = {side: max(o.get('hb_opening_index', 0) for o in ops)
-                         for side, ops in openings_by_side.items()}
-            shelves_by_side = {}
-            for side in openings_by_side:
-                shelves_by_side[side] = sorted(
-                    [c for c in bay.children
-                     if c.get('hb_part_role')
-                     == types_closets.PART_ROLE_FIXED_SHELF
-                     and c.get(types_closets.PROP_OPENING_SIDE,
-                               'FRONT') == side
-                     and not c.get('hb_preview')],
-                    key=lambda o: o.get('hb_z_offset', 0.0))
-            for opening in _iter_opening_cages(bay):
-                side = opening.get(types_closets.PROP_OPENING_SIDE, 'FRONT')
-                idx = opening.get('hb_opening_index', 0)
-                is_top = (idx == top_index[side])
-                o_w, interior_h = split_preview._cage_dims(opening)
-                if mode == 'Bays' and is_top:
-                    # Bay height reads OFF THE FLOOR (world Z of the bay
-                    # top) and sits on the top edge - the line the grab
-                    # handle drags. One emission per side.
-                    bay_top_world = (split_preview._world_matrix(bay)
-                                     .translation.z
-                                     + bay.hb_closet_bay.height)
-                    targets.append((bay, 'BAY_H', True, False,
-                                    _anchor_world(bay, 0.5, 1.0),
-                                    bay_top_world, "H "))
-                elif mode == 'Openings' and not is_top:
-                    # Section label reads the capping shelf's height OFF
-                    # THE GROUND (world Z); committing places the shelf
-                    # at the typed height.
-                    shelves = shelves_by_side.get(side, [])
-                    if idx < len(shelves):
-                        shelf_world_z = split_preview._world_matrix(
-                            shelves[idx]).translation.z
-                        targets.append((opening, 'OPEN_H', True, False,
-                                        _anchor_world(opening, 0.5, 1.0),
-                                        shelf_world_z, "H "))
-                if mode != 'Openings':
-                    continue
-                # Per-part labels: fixed shelves and rods show their
-                # opening-local height at the part itself; a drawer
-                # stack shows its front height at the stack's top edge.
-                o_mw = split_preview._world_matrix(opening)
-                for child in opening.children:
-                    role = child.get('hb_part_role')
-                    if (role == types_closets.PART_ROLE_ROD
-                            and not child.get('hb_preview')):
-                        anchor = o_mw @ Vector(
-                            (o_w / 2.0, -0.003, child.location.z))
-                        targets.append((child, 'PART_Z', True, False,
-                                        anchor, child.location.z, ""))
-                    elif role == types_closets.PART_ROLE_DRAWER_FRONT:
-                        # Every drawer front carries its own editable height
-                        # label at its center; the bullet marks the fronts
-                        # the user has pinned, which the stack redistributes
-                        # around.
-                        # The height the front is standing at right now:
-                        # a pinned front squeezed by its opening labels
-                        # what is on screen, not the height it is owed.
-                        dh = child.get(
-                            types_closets.PROP_FRONT_HEIGHT_SOLVED,
-                            child.get(types_closets.PROP_FRONT_HEIGHT,
-                                      const.DRAWER_FRONT_HEIGHT))
-                        pinned = bool(child.get(
-                            types_closets.PROP_UNLOCK_FRONT_HEIGHT, 0))
-                        anchor = o_mw @ Vector(
-                            (o_w / 2.0, -0.003,
-                             child.location.z + dh / 2.0))
-                        targets.append((child, 'DRAWER_H', True, pinned,
-                                        anchor, dh, ""))
+    shown = []
+    for group in projected:
+        probe = bpy.data.objects.get(group[1]) if group[1] else None
+        if _probe_shown(probe, space):
+            shown.append(group)
 
     # SELECTED scope on the Dims pill: keep only labels whose object
     # belongs to the current selection (itself, an enclosing cage, or a
@@ -436,32 +562,17 @@ def compute_labels(context, region, rv3d):
     # family) are gated by their own pill, not the Dims scope; a
     # filtered bay's lock glyph disappears with its BAY_W label because
     # the glyph keys off the visible label rect.
+    selection = None
     if _dims_scope(scene) == 'SELECTED':
-        raw, expanded = _selection_name_sets(context)
-        targets = [t for t in targets
-                   if _obj_in_selection(t[0], raw, expanded)]
+        selection = _selection_name_sets(context)
 
     labels = []
-    for obj, kind, editable, locked, anchor, value, prefix in targets:
-        if anchor is None:
-            continue
-        pt = view3d_utils.location_3d_to_region_2d(region, rv3d, anchor)
-        if pt is None:
-            continue
-        text = prefix + units.unit_to_string(unit_settings, value)
-        # BAY_W carries a dedicated lock glyph (added below) instead of
-        # the bullet prefix.
-        if locked and kind != 'BAY_W':
-            text = "• " + text
-        tw, th = blf.dimensions(0, text)
-        w = tw + 2 * PAD_X * s
-        h = th + 2 * PAD_Y * s
-        rect = (pt.x - w / 2.0, pt.y - h / 2.0, w, h)
-        if rect[0] + w < 0 or rect[0] > region.width:
-            continue
-        if rect[1] + h < 0 or rect[1] > region.height:
-            continue
-        labels.append((obj.name, kind, editable, locked, rect, text))
+    for _starter, _probe, rects, _toggles in shown:
+        for name, kind, editable, locked, rect, text, lineage in rects:
+            if (selection is not None
+                    and not _lineage_in_selection(lineage, *selection)):
+                continue
+            labels.append((name, kind, editable, locked, rect, text))
 
     # ----- Toggle widgets (Bays mode). Reuses the label tuple shape:
     # editable=False keeps them out of the edit modal; the ``locked``
@@ -469,41 +580,18 @@ def compute_labels(context, region, rv3d):
     if mode == 'Bays':
         bay_w_rects = {name: rect for name, kind, _e, _l, rect, _t in labels
                        if kind == 'BAY_W'}
-        for starter in _iter_starter_roots(scene):
-            if not _starter_shown(starter, space):
-                continue
-            for bay in _iter_bay_cages(starter):
-                bp = bay.hb_closet_bay
+        for _starter, _probe, _rects, toggles in shown:
+            for bay_name, unlocked, glyph, gw, bottom_rect, bottom_on in toggles:
                 # Lock glyph flush right of the bay's width label.
-                lrect = bay_w_rects.get(bay.name)
+                lrect = bay_w_rects.get(bay_name)
                 if lrect is not None:
-                    glyph = "•" if bp.unlock_width else "○"
-                    gw, _gh = blf.dimensions(0, glyph)
-                    gh = lrect[3]
                     grect = (lrect[0] + lrect[2] + 2 * s, lrect[1],
-                             gw + 2 * PAD_X * s, gh)
-                    labels.append((bay.name, 'TOGGLE_LOCK', False,
-                                   bp.unlock_width, grect, glyph))
-                # Bottom on/off pill just above the bay's bottom edge -
-                # the very bottom-front is the bay depth (BAY_D) label, so
-                # the pill sits a touch higher to clear it.
-                anchor = _anchor_world(bay, 0.5, 0.08)
-                if anchor is None:
-                    continue
-                pt = view3d_utils.location_3d_to_region_2d(
-                    region, rv3d, anchor)
-                if pt is None:
-                    continue
-                text = "Bottom"
-                tw, th = blf.dimensions(0, text)
-                w = tw + 2 * PAD_X * s
-                h = th + 2 * PAD_Y * s
-                rect = (pt.x - w / 2.0, pt.y - h / 2.0, w, h)
-                if (rect[0] + w < 0 or rect[0] > region.width
-                        or rect[1] + h < 0 or rect[1] > region.height):
-                    continue
-                labels.append((bay.name, 'TOGGLE_BOTTOM', False,
-                               not bp.remove_bottom, rect, text))
+                             gw + 2 * PAD_X * s, lrect[3])
+                    labels.append((bay_name, 'TOGGLE_LOCK', False,
+                                   unlocked, grect, glyph))
+                if bottom_rect is not None:
+                    labels.append((bay_name, 'TOGGLE_BOTTOM', False,
+                                   bottom_on, bottom_rect, "Bottom"))
 
     # Per-family visibility filters (the pills below the HUD).
     return [entry for entry in labels if _kind_visible(scene, entry[1])]
@@ -511,14 +599,16 @@ def compute_labels(context, region, rv3d):
 
 # ---- Draw handler ------------------------------------------------------------
 
-def _draw_label_rect(shader, rect, bg):
+def _draw_label_rect(dl, rect, bg):
     x, y, w, h = rect
-    verts = ((x, y), (x + w, y), (x + w, y + h), (x, y + h))
-    from gpu_extras.batch import batch_for_shader
-    shader.uniform_float("color", bg)
-    batch_for_shader(shader, 'TRI_FAN', {"pos": verts}).draw(shader)
-    shader.uniform_float("color", LABEL_BORDER)
-    batch_for_shader(shader, 'LINE_LOOP', {"pos": verts}).draw(shader)
+    dl.rect(x, y, w, h, bg)
+    dl.rect_outline(x, y, w, h, LABEL_BORDER)
+
+
+def _draw_centered_text(dl, rect, font_sz, color, text):
+    tw, th = text_dimensions(0, font_sz, text)
+    dl.text(0, rect[0] + (rect[2] - tw) / 2.0,
+            rect[1] + (rect[3] - th) / 2.0, font_sz, color, text)
 
 
 def _grab_active():
@@ -529,7 +619,7 @@ def _grab_active():
         return False
 
 
-def _draw_filter_pills(shader, context, area, font_sz, mode):
+def _draw_filter_pills(dl, context, area, font_sz, mode):
     """One pill per widget family applicable to the mode; active blue
     while that family is shown. The Grab pill mirrors the modal state."""
     for label, key, rect in _filter_pill_rects(context, area, mode):
@@ -545,17 +635,14 @@ def _draw_filter_pills(shader, context, area, font_sz, mode):
                 on = False
         else:
             on = _filter_on(context.scene, key)
-        _draw_label_rect(shader, rect, EDIT_BG if on else LABEL_BG)
-        blf.size(0, font_sz)
-        blf.color(0, *(EDIT_TEXT_COLOR if on else TEXT_COLOR))
-        tw, th = blf.dimensions(0, label)
-        blf.position(0, rect[0] + (rect[2] - tw) / 2.0,
-                     rect[1] + (rect[3] - th) / 2.0, 0)
-        blf.draw(0, label)
+        _draw_label_rect(dl, rect, EDIT_BG if on else LABEL_BG)
+        _draw_centered_text(dl, rect, font_sz,
+                            EDIT_TEXT_COLOR if on else TEXT_COLOR, label)
 
 
 def _draw():
     """Permanent POST_PIXEL callback; cheap no-op outside closet modes.
+    Pills and labels go into one DrawList, submitted in a few batches.
     Fully exception-guarded - a draw error must never spam the viewport."""
     if _shutdown:
         return
@@ -578,42 +665,36 @@ def _draw():
         except AttributeError:
             pass
         font_sz = FONT_SIZE * s
-        gpu.state.blend_set('ALPHA')
-        shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-        shader.bind()
-        _draw_filter_pills(shader, context, area, font_sz, mode)
+        dl = DrawList()
+        _draw_filter_pills(dl, context, area, font_sz, mode)
         for name, kind, editable, _locked, rect, text in labels:
             if kind.startswith('TOGGLE_'):
                 # Toggle pill/glyph: ``_locked`` slot = active state.
-                _draw_label_rect(shader, rect,
+                _draw_label_rect(dl, rect,
                                  EDIT_BG if _locked else LABEL_BG)
-                blf.size(0, font_sz)
-                blf.color(0, *(EDIT_TEXT_COLOR if _locked else TEXT_COLOR))
-                tw, th = blf.dimensions(0, text)
-                blf.position(0, rect[0] + (rect[2] - tw) / 2.0,
-                             rect[1] + (rect[3] - th) / 2.0, 0)
-                blf.draw(0, text)
+                _draw_centered_text(
+                    dl, rect, font_sz,
+                    EDIT_TEXT_COLOR if _locked else TEXT_COLOR, text)
                 continue
             editing = (_edit is not None and _edit['name'] == name
                        and _edit['kind'] == kind)
             if editing:
                 typed = _edit['typed']
                 shown = (typed + "|") if typed else text
-                blf.size(0, font_sz)
-                tw, _th = blf.dimensions(0, shown)
+                tw, _th = text_dimensions(0, font_sz, shown)
                 w = max(rect[2], tw + 2 * PAD_X * s)
                 rect = (rect[0], rect[1], w, rect[3])
-                _draw_label_rect(shader, rect, EDIT_BG)
-                blf.color(0, *EDIT_TEXT_COLOR)
-                blf.position(0, rect[0] + PAD_X * s, rect[1] + PAD_Y * s, 0)
-                blf.draw(0, shown)
+                _draw_label_rect(dl, rect, EDIT_BG)
+                dl.text(0, rect[0] + PAD_X * s, rect[1] + PAD_Y * s,
+                        font_sz, EDIT_TEXT_COLOR, shown)
             else:
-                _draw_label_rect(shader, rect,
+                _draw_label_rect(dl, rect,
                                  LABEL_BG if editable else LABEL_BG_DIM)
-                blf.size(0, font_sz)
-                blf.color(0, *(TEXT_COLOR if editable else TEXT_COLOR_DIM))
-                blf.position(0, rect[0] + PAD_X * s, rect[1] + PAD_Y * s, 0)
-                blf.draw(0, text)
+                dl.text(0, rect[0] + PAD_X * s, rect[1] + PAD_Y * s,
+                        font_sz, TEXT_COLOR if editable else TEXT_COLOR_DIM,
+                        text)
+        gpu.state.blend_set('ALPHA')
+        dl.draw()
         gpu.state.blend_set('NONE')
     except Exception:
         pass
@@ -1006,8 +1087,9 @@ def register():
     _shutdown = False
     for cls in classes:
         bpy.utils.register_class(cls)
-    _draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+    _draw_handle = hb_draw_stats.draw_handler_add(
         _draw, (), 'WINDOW', 'POST_PIXEL')
+    hb_label_cache.watch(_label_cache)
     _register_keymaps()
 
 
@@ -1016,6 +1098,7 @@ def unregister():
     _shutdown = True
     _edit = None
     _unregister_keymaps()
+    hb_label_cache.unwatch(_label_cache)
     if _draw_handle is not None:
         try:
             bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
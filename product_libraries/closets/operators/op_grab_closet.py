@@ -31,6 +31,7 @@ from gpu_extras.batch import batch_for_shader
 from bpy_extras import view3d_utils
 
 from .... import units
+from .... import hb_draw_stats
 from ....units import inch
 from ....hb_types import GeoNodeCage, GeoNodeCutpart
 from .. import types_closets
@@ -1417,7 +1418,7 @@ def register():
     global _draw_handle
     for cls in classes:
         bpy.utils.register_class(cls)
-    _draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+    _draw_handle = hb_draw_stats.draw_handler_add(
         _draw, (), 'WINDOW', 'POST_PIXEL')
     _register_keymaps()
 
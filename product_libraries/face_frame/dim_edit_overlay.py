@@ -35,21 +35,24 @@ Architecture mirrors operators/viewport_hud.py deliberately: a
 permanent draw handler plus an addon-keymap click operator that
 PASS_THROUGHs anything that isn't a label hit, so selection and other
 tools are untouched and no persistent modal blocks Blender's autosave.
-The label list is recomputed on click rather than cached, so draw and
-hit-test can never drift apart. Cage geometry is read through
+Draw and the click operators share compute_labels, so hit-tests can
+never drift from pixels; its label geometry is cached in two levels
+(hb_label_cache): world anchors and texts until a depsgraph update
+touches a face-frame cabinet, screen rects until the view changes. Cage geometry is read through
 split_preview's stale-matrix-safe helpers (_cage_dims / _world_matrix),
 which stay valid for cages created while hidden.
 """
 
 import bpy
-import blf
 import gpu
 from mathutils import Vector
 from bpy_extras import view3d_utils
 
 from ... import units
 from ... import hb_placement
-from ...hb_gpu_draw import get_visible_window_bounds
+from ... import hb_label_cache
+from ... import hb_draw_stats
+from ...hb_gpu_draw import get_visible_window_bounds, DrawList, text_dimensions
 from ...hb_types import GeoNodeCutpart
 from . import types_face_frame
 from . import split_preview
@@ -190,8 +193,7 @@ def _toggle_rect(context, area):
     except AttributeError:
         pass
     x_min, x_max, _y_min, y_max = get_visible_window_bounds(area)
-    blf.size(0, FONT_SIZE * s)
-    w = blf.dimensions(0, _toggle_label(context))[0] + 24 * s
+    w = text_dimensions(0, FONT_SIZE * s, _toggle_label(context))[0] + 24 * s
     h = _HUD_BTN_H * s
     row1_y = y_max - _HUD_MARGIN_Y * s - h
     rows_down = (2 if _active_mode(bpy.context)
@@ -246,19 +248,9 @@ def _iter_face_frame_parts(cabinet):
             yield child
 
 
-def _cabinet_shown(cabinet, space=None):
-    """False when the cabinet is hidden in the viewport (wall hidden with
-    its children, subtree hidden, isolate / local view, collection off) so
-    its labels vanish - and stop catching clicks - with it. Mirrors the
-    closet overlay's _starter_shown. The root cage can't carry this test
-    (it is hide_viewport=True by design even when the cabinet is fully on
-    screen), so probe a structural member that is always visible when the
-    cabinet is: the first face-frame part (stiles are never design-hidden;
-    recalc-parked parts carry hide_render and are already skipped). Leg
-    products and other cabinets with NO face-frame roles fall back to the
-    first real mesh part - cages are excluded (their hide flags are
-    selection-mode state, not product visibility) and so are 2D
-    annotations (they can live outside the view layer)."""
+def _visibility_probe(cabinet):
+    """The object whose viewport visibility stands for the cabinet's
+    (see _cabinet_shown), or None when there is nothing to probe."""
     probe = next(_iter_face_frame_parts(cabinet), None)
     if probe is None:
         for child in cabinet.children_recursive:
@@ -268,6 +260,10 @@ def _cabinet_shown(cabinet, space=None):
                 continue
             probe = child
             break
+    return probe
+
+
+def _probe_shown(probe, space=None):
     if probe is None:
         return True
     try:
@@ -278,6 +274,22 @@ def _cabinet_shown(cabinet, space=None):
         return True
 
 
+def _cabinet_shown(cabinet, space=None):
+    """False when the cabinet is hidden in the viewport (wall hidden with
+    its children, subtree hidden, isolate / local view, collection off) so
+    its labels vanish - and stop catching clicks - with it. Mirrors the
+    closet overlay's _starter_shown. The root cage can't carry this test
+    (it is hide_viewport=True by design even when the cabinet is fully on
+    screen), so probe a structural member that is always visible when the
+    cabinet is: the first face-frame part (stiles are never design-hidden;
+    recalc-parked parts carry hide_render and are already skipped). Leg
+    products and other cabinets with NO face-frame roles fall back to the
+    first real mesh part - cages are excluded (their hide flags are
+    selection-mode state, not product visibility) and so are 2D
+    annotations (they can live outside the view layer)."""
+    return _probe_shown(_visibility_probe(cabinet), space)
+
+
 def _part_anchor_world(part):
     """World-space centre of a member's bounding box. Unlike cages, parts
     are real built meshes, so bound_box is authoritative."""
@@ -341,13 +353,187 @@ def _cabinet_label_targets(cabinet):
     ]
 
 
+def _is_face_frame_object(obj):
+    """True for a face-frame cabinet root and anything under one."""
+    while obj is not None:
+        if obj.get(types_face_frame.TAG_CABINET_CAGE):
+            return True
+        obj = obj.parent
+    return False
+
+
+# World-space labels are rebuilt only when a depsgraph update touches a
+# face-frame cabinet; screen rects only when a region's view changes.
+_label_cache = hb_label_cache.LabelCache(_is_face_frame_object)
+
+
+def _cabinet_targets(cabinet, mode):
+    """[(cage, kind, editable, locked, value, prefix, anchor)] for one
+    cabinet in the given mode; anchor None means the cage / part centre."""
+    # Displayed values come from the SAME properties a commit writes
+    # (face_frame_bay.width / face_frame_opening.size), never the cage
+    # dims -- the two differ (frame overlaps), and typing back the
+    # number you can see must be a no-op. Non-editable openings have
+    # a meaningless size prop (root/V-child), so those read-only
+    # labels show the built cage height instead.
+    if mode == 'Cabinets':
+        # Corner cabinets size through their own corner-section
+        # props; skip them rather than show W/H/D labels that
+        # wouldn't commit sensibly.
+        if getattr(cabinet.face_frame_cabinet,
+                   'corner_type', 'NONE') != 'NONE':
+            return []
+        targets = [
+            (cabinet, kind, True, False, value, prefix, anchor)
+            for kind, anchor, value, prefix
+            in _cabinet_label_targets(cabinet)
+        ]
+    elif mode == 'Bays':
+        targets = []
+        for bay in _iter_bay_cages(cabinet):
+            bp = bay.face_frame_bay
+            targets.append((bay, 'BAY', True, bp.unlock_width,
+                            bp.width, "W ", None))
+            # Height / depth always display bp.height / bp.depth --
+            # the exact values the solver reads and a commit writes
+            # (the sidebar shows the same numbers behind its lock
+            # icons), so typing back the shown value is a no-op.
+            # While locked the system keeps them in sync; the
+            # bullet marks user-pinned (unlocked) values. Anchors:
+            # a face-frame bay cage's origin already sits at its
+            # front plane (unlike closet bay cages, origin at the
+            # BACK), so _anchor_world's -0.003 is the whole front
+            # offset.
+            targets.append((bay, 'BAY_H', True, bp.unlock_height,
+                            bp.height, "H ",
+                            _anchor_world(bay, 0.5, 1.0)))
+            targets.append((bay, 'BAY_D', True, bp.unlock_depth,
+                            bp.depth, "D ",
+                            _anchor_world(bay, 0.5, 0.0)))
+    elif mode == 'Openings':
+        targets = []
+        # Non-editable openings (bay roots / V-split children) show
+        # the solver leaf's real FF opening height -- cage minus the
+        # top / bottom reveals, the same number Opening Properties
+        # prints. The raw cage spans the front-overlay footprint,
+        # which read one overlay too tall (e.g. 28.5" for a 27.5"
+        # opening). Leaf heights resolve once per cabinet; anything
+        # unresolvable falls back to the raw cage height.
+        leaf_h = {}
+        try:
+            from . import solver_face_frame as solver
+            layout_ss = solver.FaceFrameLayout(cabinet)
+            for bay in _iter_bay_cages(cabinet):
+                bi = bay.get('hb_bay_index')
+                if bi is None:
+                    continue
+                for lf in solver.bay_openings(
+                        layout_ss, bi).get('leaves', []):
+                    leaf_h[lf['obj_name']] = (
+                        lf['cage_dim_z'] - lf['reveal_top']
+                        - lf['reveal_bottom'])
+        except Exception:
+            pass
+        for bay in _iter_bay_cages(cabinet):
+            for op in _iter_opening_cages(bay):
+                editable = _opening_height_editable(op)
+                props = op.face_frame_opening
+                value = (props.size if editable
+                         else leaf_h.get(
+                             op.name,
+                             split_preview._cage_dims(op)[1]))
+                targets.append((op, 'OPENING', editable,
+                                editable and props.unlock_size,
+                                value, "", None))
+    else:
+        # Face Frame: member widths. Editable labels read
+        # _get_current_width -- the same per-role props the Set Width
+        # dialog writes -- so typing back the shown value is a no-op.
+        targets = []
+        for part in _iter_face_frame_parts(cabinet):
+            role = part.get('hb_part_role')
+            editable = role in ops_part_commands._ROLES_WITH_WIDTH
+            try:
+                if editable:
+                    value = ops_part_commands._get_current_width(
+                        part, role, cabinet)
+                    locked = types_face_frame.part_width_is_unlocked(part)
+                else:
+                    # Between-bay mid rails have no width command;
+                    # show the built width read-only.
+                    value = GeoNodeCutpart(part).get_input('Width')
+                    locked = False
+            except Exception:
+                continue
+            targets.append((part, 'PART', editable, locked,
+                            value, "", None))
+    return targets
+
+
+def _build_world_labels(scene, mode, s):
+    """[(cabinet name, visibility probe name, [(name, kind, editable,
+    locked, anchor, text, w, h)])] for every face-frame cabinet. The
+    expensive half of compute_labels: scene walk, unit formatting and
+    text measuring. Cached until a face-frame cabinet changes."""
+    signature = units.unit_signature(scene.unit_settings)
+    font_sz = FONT_SIZE * s
+    groups = []
+    for cabinet in _iter_cabinet_roots(scene):
+        labels = []
+        for cage, kind, editable, locked, value, prefix, anchor in \
+                _cabinet_targets(cabinet, mode):
+            if anchor is None:
+                anchor = (_part_anchor_world(cage) if kind == 'PART'
+                          else _label_anchor_world(cage))
+            if anchor is None:
+                continue
+            text = prefix + units.format_length(signature, value)
+            if locked:
+                # Pinned (user-typed, held during redistribution). The
+                # marker doubles as the affordance for "this one can be
+                # reset to auto" (right-click, or X / 0 while editing).
+                text = "• " + text
+            tw, th = text_dimensions(0, font_sz, text)
+            labels.append((cage.name, kind, editable, locked, anchor.freeze(),
+                           text, tw + 2 * PAD_X * s, th + 2 * PAD_Y * s))
+        if labels:
+            probe = _visibility_probe(cabinet)
+            groups.append((cabinet.name, probe.name if probe else "", labels))
+    return groups
+
+
+def _project_labels(region, rv3d, groups):
+    """World labels -> [(cabinet name, probe name, [(name, kind,
+    editable, locked, rect, text)])] in region space, dropping labels
+    fully outside the region."""
+    projected = []
+    for cabinet_name, probe_name, labels in groups:
+        rects = []
+        for name, kind, editable, locked, anchor, text, w, h in labels:
+            pt = view3d_utils.location_3d_to_region_2d(region, rv3d, anchor)
+            if pt is None:
+                continue
+            rect = (pt.x - w / 2.0, pt.y - h / 2.0, w, h)
+            # Skip labels fully outside the region.
+            if rect[0] + w < 0 or rect[0] > region.width:
+                continue
+            if rect[1] + h < 0 or rect[1] > region.height:
+                continue
+            rects.append((name, kind, editable, locked, rect, text))
+        if rects:
+            projected.append((cabinet_name, probe_name, rects))
+    return projected
+
+
 def compute_labels(context, region, rv3d):
     """[(obj_name, kind, editable, locked, rect, text)] for every label
     currently on screen. rect is (x, y, w, h) region-local. ``locked``
     is the bay/opening hold flag (user-typed value held during
     redistribution); locked labels carry a bullet marker so users can
     see which values are pinned vs auto-calculated. Shared by the draw
-    handler and the click operators so hits can't drift from pixels."""
+    handler and the click operators so hits can't drift from pixels.
+    Geometry comes from _label_cache; only visibility and the SELECTED
+    scope are checked per call."""
     mode = _active_mode(context)
     if mode is None or rv3d is None:
         return []
@@ -359,180 +545,54 @@ def compute_labels(context, region, rv3d):
     sel_names = (_selected_label_names(context)
                  if scope == 'SELECTED' else None)
     scene = context.scene
-    unit_settings = scene.unit_settings
-    s = 1.0
-    try:
-        s = bpy.context.preferences.system.ui_scale
-    except AttributeError:
-        pass
-    font_sz = FONT_SIZE * s
-    blf.size(0, font_sz)
+    s = hb_label_cache.ui_scale()
+
+    key = (scene.name, mode, s, hb_label_cache.unit_key(scene.unit_settings))
+    groups = _label_cache.world(
+        key, lambda: _build_world_labels(scene, mode, s))
+    projected = _label_cache.projected(
+        region, rv3d, lambda: _project_labels(region, rv3d, groups))
 
     labels = []
     space = getattr(context, 'space_data', None)
-    for cabinet in _iter_cabinet_roots(scene):
-        if not _cabinet_shown(cabinet, space):
+    for _cabinet_name, probe_name, rects in projected:
+        probe = bpy.data.objects.get(probe_name) if probe_name else None
+        if not _probe_shown(probe, space):
             continue
-        # Displayed values come from the SAME properties a commit writes
-        # (face_frame_bay.width / face_frame_opening.size), never the cage
-        # dims -- the two differ (frame overlaps), and typing back the
-        # number you can see must be a no-op. Non-editable openings have
-        # a meaningless size prop (root/V-child), so those read-only
-        # labels show the built cage height instead.
-        if mode == 'Cabinets':
-            # Corner cabinets size through their own corner-section
-            # props; skip them rather than show W/H/D labels that
-            # wouldn't commit sensibly.
-            if getattr(cabinet.face_frame_cabinet,
-                       'corner_type', 'NONE') != 'NONE':
-                continue
-            targets = [
-                (cabinet, kind, True, False, value, prefix, anchor)
-                for kind, anchor, value, prefix
-                in _cabinet_label_targets(cabinet)
-            ]
-        elif mode == 'Bays':
-            targets = []
-            for bay in _iter_bay_cages(cabinet):
-                bp = bay.face_frame_bay
-                targets.append((bay, 'BAY', True, bp.unlock_width,
-                                bp.width, "W ", None))
-                # Height / depth always display bp.height / bp.depth --
-                # the exact values the solver reads and a commit writes
-                # (the sidebar shows the same numbers behind its lock
-                # icons), so typing back the shown value is a no-op.
-                # While locked the system keeps them in sync; the
-                # bullet marks user-pinned (unlocked) values. Anchors:
-                # a face-frame bay cage's origin already sits at its
-                # front plane (unlike closet bay cages, origin at the
-                # BACK), so _anchor_world's -0.003 is the whole front
-                # offset.
-                targets.append((bay, 'BAY_H', True, bp.unlock_height,
-                                bp.height, "H ",
-                                _anchor_world(bay, 0.5, 1.0)))
-                targets.append((bay, 'BAY_D', True, bp.unlock_depth,
-                                bp.depth, "D ",
-                                _anchor_world(bay, 0.5, 0.0)))
-        elif mode == 'Openings':
-            targets = []
-            # Non-editable openings (bay roots / V-split children) show
-            # the solver leaf's real FF opening height -- cage minus the
-            # top / bottom reveals, the same number Opening Properties
-            # prints. The raw cage spans the front-overlay footprint,
-            # which read one overlay too tall (e.g. 28.5" for a 27.5"
-            # opening). Leaf heights resolve once per cabinet; anything
-            # unresolvable falls back to the raw cage height.
-            leaf_h = {}
-            try:
-                from . import solver_face_frame as solver
-                layout_ss = solver.FaceFrameLayout(cabinet)
-                for bay in _iter_bay_cages(cabinet):
-                    bi = bay.get('hb_bay_index')
-                    if bi is None:
-                        continue
-                    for lf in solver.bay_openings(
-                            layout_ss, bi).get('leaves', []):
-                        leaf_h[lf['obj_name']] = (
-                            lf['cage_dim_z'] - lf['reveal_top']
-                            - lf['reveal_bottom'])
-            except Exception:
-                pass
-            for bay in _iter_bay_cages(cabinet):
-                for op in _iter_opening_cages(bay):
-                    editable = _opening_height_editable(op)
-                    props = op.face_frame_opening
-                    value = (props.size if editable
-                             else leaf_h.get(
-                                 op.name,
-                                 split_preview._cage_dims(op)[1]))
-                    targets.append((op, 'OPENING', editable,
-                                    editable and props.unlock_size,
-                                    value, "", None))
-        else:
-            # Face Frame: member widths. Editable labels read
-            # _get_current_width -- the same per-role props the Set Width
-            # dialog writes -- so typing back the shown value is a no-op.
-            targets = []
-            for part in _iter_face_frame_parts(cabinet):
-                role = part.get('hb_part_role')
-                editable = role in ops_part_commands._ROLES_WITH_WIDTH
-                try:
-                    if editable:
-                        value = ops_part_commands._get_current_width(
-                            part, role, cabinet)
-                        locked = types_face_frame.part_width_is_unlocked(part)
-                    else:
-                        # Between-bay mid rails have no width command;
-                        # show the built width read-only.
-                        value = GeoNodeCutpart(part).get_input('Width')
-                        locked = False
-                except Exception:
-                    continue
-                targets.append((part, 'PART', editable, locked,
-                                value, "", None))
         # SELECTED scope: keep only labels whose cage is part of the
         # current selection. The click handlers hit-test against this
         # same list, so filtered labels are not clickable either.
         if sel_names is not None:
-            targets = [t for t in targets if t[0].name in sel_names]
-        for cage, kind, editable, locked, value, prefix, anchor in targets:
-            if anchor is None:
-                anchor = (_part_anchor_world(cage) if kind == 'PART'
-                          else _label_anchor_world(cage))
-            if anchor is None:
-                continue
-            pt = view3d_utils.location_3d_to_region_2d(region, rv3d, anchor)
-            if pt is None:
-                continue
-            text = prefix + units.unit_to_string(unit_settings, value)
-            if locked:
-                # Pinned (user-typed, held during redistribution). The
-                # marker doubles as the affordance for "this one can be
-                # reset to auto" (right-click, or X / 0 while editing).
-                text = "• " + text
-            tw, th = blf.dimensions(0, text)
-            w = tw + 2 * PAD_X * s
-            h = th + 2 * PAD_Y * s
-            rect = (pt.x - w / 2.0, pt.y - h / 2.0, w, h)
-            # Skip labels fully outside the region.
-            if rect[0] + w < 0 or rect[0] > region.width:
-                continue
-            if rect[1] + h < 0 or rect[1] > region.height:
-                continue
-            labels.append((cage.name, kind, editable, locked, rect, text))
+            rects = [r for r in rects if r[0] in sel_names]
+        labels.extend(rects)
     return labels
 
 
 # ---- Draw handler ---------------------------------------------------------
 
-def _draw_label_rect(shader, rect, bg):
+def _draw_label_rect(dl, rect, bg):
     x, y, w, h = rect
-    verts = ((x, y), (x + w, y), (x + w, y + h), (x, y + h))
-    from gpu_extras.batch import batch_for_shader
-    shader.uniform_float("color", bg)
-    batch_for_shader(shader, 'TRI_FAN', {"pos": verts}).draw(shader)
-    shader.uniform_float("color", LABEL_BORDER)
-    batch_for_shader(
-        shader, 'LINE_LOOP', {"pos": verts}).draw(shader)
+    dl.rect(x, y, w, h, bg)
+    dl.rect_outline(x, y, w, h, LABEL_BORDER)
 
 
-def _draw_toggle_pill(shader, context, area, font_sz, s):
+def _draw_toggle_pill(dl, context, area, font_sz, s):
     """The Sizes show/hide pill -- HUD-styled, active blue while labels
     are shown."""
     rect = _toggle_rect(context, area)
     on = _sizes_shown(context)
     label = _toggle_label(context)
-    _draw_label_rect(shader, rect, EDIT_BG if on else LABEL_BG)
-    blf.size(0, font_sz)
-    blf.color(0, *(EDIT_TEXT_COLOR if on else TEXT_COLOR))
-    tw, th = blf.dimensions(0, label)
-    blf.position(0, rect[0] + (rect[2] - tw) / 2.0,
-                 rect[1] + (rect[3] - th) / 2.0, 0)
-    blf.draw(0, label)
+    _draw_label_rect(dl, rect, EDIT_BG if on else LABEL_BG)
+    tw, th = text_dimensions(0, font_sz, label)
+    dl.text(0, rect[0] + (rect[2] - tw) / 2.0,
+            rect[1] + (rect[3] - th) / 2.0, font_sz,
+            EDIT_TEXT_COLOR if on else TEXT_COLOR, label)
 
 
 def _draw():
-    """Permanent POST_PIXEL callback; cheap no-op outside the two modes."""
+    """Permanent POST_PIXEL callback; cheap no-op outside the two modes.
+    The pill and every label go into one DrawList, so the draw calls
+    don't grow with the label count."""
     if _shutdown:
         return
     context = bpy.context
@@ -552,10 +612,8 @@ def _draw():
     except AttributeError:
         pass
     font_sz = FONT_SIZE * s
-    gpu.state.blend_set('ALPHA')
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-    shader.bind()
-    _draw_toggle_pill(shader, context, area, font_sz, s)
+    dl = DrawList()
+    _draw_toggle_pill(dl, context, area, font_sz, s)
     for name, kind, editable, _locked, rect, text in labels:
         editing = (_edit is not None and _edit['name'] == name
                    and _edit['kind'] == kind)
@@ -564,21 +622,19 @@ def _draw():
             # shows the current value so the user sees what Enter keeps.
             typed = _edit['typed']
             shown = (typed + "|") if typed else text
-            blf.size(0, font_sz)
-            tw, th = blf.dimensions(0, shown)
+            tw, th = text_dimensions(0, font_sz, shown)
             w = max(rect[2], tw + 2 * PAD_X * s)
             rect = (rect[0], rect[1], w, rect[3])
-            _draw_label_rect(shader, rect, EDIT_BG)
-            blf.color(0, *EDIT_TEXT_COLOR)
-            blf.position(0, rect[0] + PAD_X * s, rect[1] + PAD_Y * s, 0)
-            blf.draw(0, shown)
+            _draw_label_rect(dl, rect, EDIT_BG)
+            dl.text(0, rect[0] + PAD_X * s, rect[1] + PAD_Y * s, font_sz,
+                    EDIT_TEXT_COLOR, shown)
         else:
-            _draw_label_rect(shader, rect,
+            _draw_label_rect(dl, rect,
                              LABEL_BG if editable else LABEL_BG_DIM)
-            blf.size(0, font_sz)
-            blf.color(0, *(TEXT_COLOR if editable else TEXT_COLOR_DIM))
-            blf.position(0, rect[0] + PAD_X * s, rect[1] + PAD_Y * s, 0)
-            blf.draw(0, text)
+            dl.text(0, rect[0] + PAD_X * s, rect[1] + PAD_Y * s, font_sz,
+                    TEXT_COLOR if editable else TEXT_COLOR_DIM, text)
+    gpu.state.blend_set('ALPHA')
+    dl.draw()
     gpu.state.blend_set('NONE')
 
 
@@ -923,8 +979,9 @@ def register():
     _shutdown = False
     for cls in classes:
         bpy.utils.register_class(cls)
-    _draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+    _draw_handle = hb_draw_stats.draw_handler_add(
         _draw, (), 'WINDOW', 'POST_PIXEL')
+    hb_label_cache.watch(_label_cache)
     _register_keymaps()
 
 
@@ -933,6 +990,7 @@ def unregister():
     _shutdown = True
     _edit = None
     _unregister_keymaps()
+    hb_label_cache.unwatch(_label_cache)
     if _draw_handle is not None:
         try:
             bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
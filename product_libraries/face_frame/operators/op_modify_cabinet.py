@@ -30,6 +30,7 @@ from bpy_extras import view3d_utils
 from .. import solver_face_frame as solver
 from .. import types_face_frame
 from .... import hb_types
+from .... import hb_draw_stats
 from ....units import inch
 
 
@@ -964,7 +965,7 @@ class _GrabBaseMixin:
         if not self._boundaries:
             self.report({'INFO'}, "No editable boundaries found")
             return {'CANCELLED'}
-        self._draw_handle = bpy.types.SpaceView3D.draw_handler_add(
+        self._draw_handle = hb_draw_stats.draw_handler_add(
             _draw_callback, (self, context), 'WINDOW', 'POST_PIXEL')
         context.window_manager.modal_handler_add(self)
         # bl_label leads so the mode is identified up front. Area
@@ -11,6 +11,7 @@ from gpu_extras.batch import batch_for_shader
 from mathutils import Vector
 
 from ... import hb_utils
+from ... import hb_draw_stats
 
 
 # Only one split dialog can be open at a time, so a single handler slot
@@ -221,7 +222,7 @@ def add_preview(op, opening_name):
     global _handler, _opening_name
     remove_preview()
     _opening_name = opening_name
-    _handler = bpy.types.SpaceView3D.draw_handler_add(
+    _handler = hb_draw_stats.draw_handler_add(
         _draw, (op,), 'WINDOW', 'POST_VIEW')
     tag_redraw(op, bpy.context)
 
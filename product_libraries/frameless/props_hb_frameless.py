@@ -1315,7 +1315,7 @@ class HB_MT_crown_detail_library(bpy.types.Menu):
             for detail in crown_details:
                 op = layout.operator("home_builder_details.create_from_library",
                                     text=detail.get("name", "Unnamed"), 
-                                    icon='IMPORT')
+                                    **hb_detail_library.icon_args(detail))
                 op.filepath = detail.get("filepath", "")
                 op.name = detail.get("name", "Crown Detail")
         else:
@@ -664,6 +664,17 @@ class HOME_BUILDER_MT_dimension_commands(bpy.types.Menu):
         layout.operator("object.delete", text="Delete Dimension", icon='X')
 
 
+class HOME_BUILDER_MT_dimension_set_commands(bpy.types.Menu):
+    bl_label = "Dimension Set Commands"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator_context = 'INVOKE_DEFAULT'
+        layout.operator("home_builder_layouts.edit_dimension_in_set", text="Edit Dimension", icon='RESTRICT_SELECT_OFF')
+        layout.operator("home_builder_layouts.collapse_dimensions", text="Collapse Dimensions", icon='FULLSCREEN_EXIT')
+        layout.operator("home_builder_layouts.expand_dimensions", text="Expand All Dimensions", icon='FULLSCREEN_ENTER')
+
+
 def is_annotation_text(obj):
     """True for a 2D annotation text object the drafter placed."""
     return bool(obj and obj.type == 'FONT'
@@ -756,6 +767,7 @@ classes = (
     HOME_BUILDER_OT_move_dimension_text,
     HOME_BUILDER_OT_show_dimension_properties,
     HOME_BUILDER_MT_dimension_commands,
+    HOME_BUILDER_MT_dimension_set_commands,
     HOME_BUILDER_OT_set_text_alignment,
     HOME_BUILDER_MT_text_commands,
 )
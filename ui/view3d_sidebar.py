@@ -2,6 +2,7 @@ import bpy
 from .. import hb_project
 from .. import hb_layouts
 from .. import hb_details
+from .. import hb_draw_stats
 
 CATEGORY_NAME = "Home Builder"
 
@@ -852,7 +853,7 @@ class HOME_BUILDER_MT_detail_library(bpy.types.Menu):
                 row = layout.row()
                 op = row.operator("home_builder_details.create_from_library",
                                  text=detail.get("name", "Unnamed"), 
-                                 icon='IMPORT')
+                                 **hb_detail_library.icon_args(detail))
                 op.filepath = detail.get("filepath", "")
                 op.name = detail.get("name", "Detail")
         else:
@@ -971,6 +972,14 @@ class HOME_BUILDER_PT_layout_views_settings(bpy.types.Panel):
                     text="Render", icon='RENDER_STILL')
         row.operator("home_builder_layouts.export_all_to_pdf", 
                     text="Export PDF", icon='FILE')
+        row.operator("home_builder_layouts.export_layout_to_svg", 
+                    text="", icon='CURVE_BEZCURVE')
+        
+        row = col.row(align=True)
+        row.operator("home_builder_layouts.collapse_dimensions", 
+                    text="Collapse Dimensions", icon='FULLSCREEN_EXIT')
+        row.operator("home_builder_layouts.expand_dimensions", 
+                    text="", icon='FULLSCREEN_ENTER')
 
 
 
@@ -1370,6 +1379,9 @@ class HOME_BUILDER_PT_annotations_settings(bpy.types.Panel):
         layout.separator()
         layout.operator("home_builder_annotations.apply_settings_to_all", 
                        text="Apply to All Annotations", icon='FILE_REFRESH')
+        if is_layout:
+            layout.operator("home_builder_layouts.rescale_all_annotations",
+                           text="Rescale All Layout Views", icon='FILE_REFRESH')
 
 
 # =============================================================================
@@ -1441,6 +1453,45 @@ class HOME_BUILDER_PT_room_layout_stairs(bpy.types.Panel):
         row.operator('home_builder_stairs.place_stairs', text="Place Stairs", icon='MOD_ARRAY')
 
 
+class HOME_BUILDER_PT_draw_times(bpy.types.Panel):
+    """Per-handler viewport draw cost, for finding which overlay slows
+    redraws down on heavy scenes. The table refreshes when the sidebar
+    redraws (hover it)."""
+    bl_label = "Draw Times"
+    bl_idname = "HOME_BUILDER_PT_draw_times"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = CATEGORY_NAME
+    bl_order = 10
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        wm_props = context.window_manager.home_builder
+
+        row = layout.row(align=True)
+        row.prop(wm_props, "record_draw_times", toggle=True)
+        row.prop(wm_props, "show_draw_time_strip", toggle=True)
+        row.operator("hb_general.reset_draw_times", text="", icon='FILE_REFRESH')
+
+        if not wm_props.record_draw_times:
+            layout.label(text="Recording is off.", icon='INFO')
+            return
+        rows = hb_draw_stats.summary()
+        if not rows:
+            layout.label(text="Redraw a viewport to collect times.", icon='INFO')
+            return
+
+        flow = layout.grid_flow(columns=4, even_columns=False, align=True)
+        for text in ("Handler", "Avg ms", "P95 ms", "Max ms"):
+            flow.label(text=text)
+        for name, avg, p95, worst, _count in rows:
+            flow.label(text=name)
+            flow.label(text=f"{avg:.2f}")
+            flow.label(text=f"{p95:.2f}")
+            flow.label(text=f"{worst:.2f}")
+
+
 classes = (
     HOME_BUILDER_PT_selection_mode,
     HOME_BUILDER_PT_project,
@@ -1468,6 +1519,7 @@ classes = (
     HOME_BUILDER_PT_annotations_edit,
     HOME_BUILDER_PT_annotations_plan_view_tools,
     HOME_BUILDER_PT_annotations_settings,
+    HOME_BUILDER_PT_draw_times,
 )
 
 def register():
@@ -1,3 +1,6 @@
+import functools
+
+
 def inch(value):
     """ Converts inch to meter
     """
@@ -47,19 +50,34 @@ def format_number(value):
     else:
         return f"{rounded:.4f}".rstrip('0').rstrip('.')
 
+def unit_signature(unit_settings):
+    """The unit settings unit_to_string reads, as a hashable tuple. Read it
+    once per frame and pass it to format_length for every label."""
+    return (unit_settings.system, unit_settings.length_unit)
+
+
+def format_length(signature, value):
+    """unit_to_string for a unit_signature. The string is memoized on the
+    value rounded to display precision, so overlays redrawing the same
+    dimensions every frame skip the formatting; a change of units changes
+    the key, so nothing needs invalidating."""
+    system, length_unit = signature
+    if system == 'METRIC':
+        if length_unit == 'METERS':
+            return _format(round(value, 3), "m")
+        return _format(round(meter_to_millimeter(value), 2), "mm")
+    elif system == 'IMPERIAL':
+        if length_unit == 'FEET':
+            return _format(round(meter_to_feet(value), 2), "'")
+        # Round to nearest 1/16" for clean cabinet dimensions
+        return _format(round_to_sixteenth(meter_to_inch(value)), '"')
+    return _format(round(value, 4), "")
+
+
+@functools.lru_cache(maxsize=4096)
+def _format(number, suffix):
+    return format_number(number) + suffix
+
+
 def unit_to_string(unit_settings, value):
-    if unit_settings.system == 'METRIC':
-        if unit_settings.length_unit == 'METERS':
-            return format_number(round(value, 3)) + "m"
-        else:
-            return format_number(round(meter_to_millimeter(value), 2)) + "mm"
-    elif unit_settings.system == 'IMPERIAL':
-        if unit_settings.length_unit == 'FEET':
-            return format_number(round(meter_to_feet(value), 2)) + "'"
-        else:
-            # Round to nearest 1/16" for clean cabinet dimensions
-            inches = meter_to_inch(value)
-            rounded_inches = round_to_sixteenth(inches)
-            return format_number(rounded_inches) + '"'
-    else:
-        return format_number(round(value, 4))    
\ No newline at end of file
+    return format_length(unit_signature(unit_settings), value)